@@ -0,0 +1,308 @@
+"""
+Benchmark suite for doc_br.
+
+Measures the throughput of the hot paths of the library, the memory taken by each built
+object and the time taken to import the light modules in a fresh interpreter, saves the
+results as a JSON baseline and compares later runs against it.
+
+Examples:
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json --threshold 0.15
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type
+
+from sqlalchemy import Column, Integer, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from doc_br.sqlalchemy_types import CNPJTypeDecorator, CPFTypeDecorator
+from doc_br.types import CNPJ, CPF, Document
+from doc_br.utils import CNPJDocumentUtils, CPFDocumentUtils, DocumentUtils
+
+Base = declarative_base()
+
+
+class CPFRow(Base):
+    """Table row holding a CPF document, used by the ORM benchmarks."""
+
+    __tablename__ = 'cpf_row'
+    id = Column(Integer, primary_key=True)
+    document = Column(CPFTypeDecorator)
+
+
+class CNPJRow(Base):
+    """Table row holding a CNPJ document, used by the ORM benchmarks."""
+
+    __tablename__ = 'cnpj_row'
+    id = Column(Integer, primary_key=True)
+    document = Column(CNPJTypeDecorator)
+
+
+class Benchmark(NamedTuple):
+    """A benchmark of a single operation."""
+
+    name: str
+    """Unique name of the benchmark."""
+
+    prepare: Callable[[int], Any]
+    """Build the input of the benchmark for a number of operations. Not timed."""
+
+    run: Callable[[Any], Optional[List[Any]]]
+    """Run the operations. Returns the built objects when their memory should be measured."""
+
+    operations: Optional[int] = None
+    """Fixed number of operations per run for slow operations, instead of the -n option."""
+
+
+class Result(NamedTuple):
+    """Result of a benchmark."""
+
+    name: str
+    operations: int
+    seconds: float
+    ops_per_second: float
+    bytes_per_object: Optional[float]
+
+
+def _documents(utils: DocumentUtils, n: int, masked: bool) -> List[str]:
+    """Generate reproducible document strings.
+
+    :param utils: The document utils of the document type.
+    :param n: The number of document strings.
+    :param masked: Whether to return the masked document strings.
+    :return: The document strings.
+    """
+    return [doc.masked if masked else doc.plain for doc in utils.iter_documents(n, seed=0)]
+
+
+def _construct(document_class: Type[Document], utils: DocumentUtils, masked: bool) -> Benchmark:
+    """Benchmark the construction of documents from valid strings."""
+    form = 'masked' if masked else 'plain'
+    return Benchmark(
+        f'{document_class.__name__.lower()}_construct_{form}',
+        lambda n: _documents(utils, n, masked),
+        lambda docs: [document_class(doc) for doc in docs],
+    )
+
+
+def _reject(document_class: Type[Document], utils: DocumentUtils) -> Benchmark:
+    """Benchmark the rejection of invalid document strings, one per failure reason."""
+
+    def prepare(n: int) -> List[str]:
+        valid = _documents(utils, n, masked=True)
+        invalid = [doc[:-1] + str((int(doc[-1]) + 1) % 10) for doc in valid]
+        invalid[1::4] = ['1' * len(doc) for doc in valid[1::4]]
+        invalid[2::4] = [doc + '0' for doc in valid[2::4]]
+        invalid[3::4] = [doc.replace('.', 'x') for doc in valid[3::4]]
+        return invalid
+
+    def run(docs: List[str]) -> None:
+        for doc in docs:
+            try:
+                document_class(doc)
+            except ValueError:
+                pass
+
+    return Benchmark(f'{document_class.__name__.lower()}_reject_invalid', prepare, run)
+
+
+def _generate(document_class: Type[Document], utils: DocumentUtils) -> Benchmark:
+    """Benchmark the generation of a large set of unique documents."""
+    return Benchmark(
+        f'{document_class.__name__.lower()}_generate_documents',
+        lambda n: n,
+        lambda n: list(utils.generate_documents(n)),
+    )
+
+
+def _orm_session(row_class: Type[Any], docs: Optional[List[Document]] = None) -> Session:
+    """Create a session on a new in-memory SQLite database, optionally with rows.
+
+    :param row_class: The mapped class of the table.
+    :param docs: The documents to be inserted.
+    :return: The session.
+    """
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    if docs:
+        session.add_all(row_class(document=doc) for doc in docs)
+        session.commit()
+    return session
+
+
+def _orm_insert(row_class: Type[Any], utils: DocumentUtils) -> Benchmark:
+    """Benchmark inserting documents through the ORM and the type decorators."""
+
+    def run(prepared: tuple) -> None:
+        session, docs = prepared
+        session.add_all(row_class(document=doc) for doc in docs)
+        session.commit()
+
+    return Benchmark(
+        f'{row_class.__name__[:-3].lower()}_orm_insert',
+        lambda n: (_orm_session(row_class), list(utils.iter_documents(n, seed=0))),
+        run,
+    )
+
+
+def _orm_select(row_class: Type[Any], utils: DocumentUtils) -> Benchmark:
+    """Benchmark loading documents through the type decorators."""
+    return Benchmark(
+        f'{row_class.__name__[:-3].lower()}_orm_select',
+        lambda n: _orm_session(row_class, list(utils.iter_documents(n, seed=0))),
+        lambda session: session.scalars(select(row_class.document)).all(),
+    )
+
+
+def _import(module: str) -> Benchmark:
+    """Benchmark importing a module in a fresh interpreter, startup included.
+
+    Each run starts new interpreters, so the number of operations is fixed and small. A slower
+    import, as when a heavy dependency starts being loaded eagerly, shows as a regression.
+    """
+
+    def run(n: int) -> None:
+        for _ in range(n):
+            subprocess.run([sys.executable, '-c', f'import {module}'], check=True)
+
+    return Benchmark(f'import_{module.replace(".", "_")}', lambda n: n, run, operations=20)
+
+
+BENCHMARKS = [
+    _construct(CPF, CPFDocumentUtils(), masked=True),
+    _construct(CPF, CPFDocumentUtils(), masked=False),
+    _construct(CNPJ, CNPJDocumentUtils(), masked=True),
+    _construct(CNPJ, CNPJDocumentUtils(), masked=False),
+    _reject(CPF, CPFDocumentUtils()),
+    _reject(CNPJ, CNPJDocumentUtils()),
+    _generate(CPF, CPFDocumentUtils()),
+    _generate(CNPJ, CNPJDocumentUtils()),
+    _orm_insert(CPFRow, CPFDocumentUtils()),
+    _orm_insert(CNPJRow, CNPJDocumentUtils()),
+    _orm_select(CPFRow, CPFDocumentUtils()),
+    _orm_select(CNPJRow, CNPJDocumentUtils()),
+    _import('doc_br.types'),
+    _import('doc_br.utils'),
+]
+"""All the benchmarks, in running order."""
+
+
+def run_benchmark(benchmark: Benchmark, n: int, repeat: int = 3) -> Result:
+    """Run a benchmark, keeping the best of a number of runs.
+
+    :param benchmark: The benchmark.
+    :param n: The number of operations per run, unless the benchmark has a fixed one.
+    :param repeat: The number of timed runs.
+    :return: The benchmark result.
+    """
+    n = benchmark.operations or n
+    best = float('inf')
+    for _ in range(repeat):
+        prepared = benchmark.prepare(n)
+        start = time.perf_counter()
+        benchmark.run(prepared)
+        best = min(best, time.perf_counter() - start)
+
+    prepared = benchmark.prepare(n)
+    tracemalloc.start()
+    objects = benchmark.run(prepared)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    bytes_per_object = allocated / len(objects) if objects else None
+    return Result(benchmark.name, n, best, n / best, bytes_per_object)
+
+
+def compare(
+    results: List[Result], baseline: Dict[str, Dict[str, Any]], threshold: float
+) -> List[str]:
+    """Compare results against a baseline.
+
+    :param results: The current results.
+    :param baseline: The baseline results, by benchmark name.
+    :param threshold: The tolerated relative loss of throughput or gain of memory.
+    :return: A description of each regression.
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+
+        if result.ops_per_second < previous['ops_per_second'] * (1 - threshold):
+            regressions.append(
+                f'{result.name}: {result.ops_per_second:,.0f} ops/s, '
+                f'baseline {previous["ops_per_second"]:,.0f} ops/s'
+            )
+
+        previous_bytes = previous.get('bytes_per_object')
+        if result.bytes_per_object and previous_bytes:
+            if result.bytes_per_object > previous_bytes * (1 + threshold):
+                regressions.append(
+                    f'{result.name}: {result.bytes_per_object:,.1f} bytes/object, '
+                    f'baseline {previous_bytes:,.1f} bytes/object'
+                )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite from the command line.
+
+    :param argv: The command line arguments.
+    :return: The exit code, 1 if a regression was found.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the doc_br hot paths.')
+    parser.add_argument('-n', type=int, default=20000, help='operations per benchmark run')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark')
+    parser.add_argument('--only', nargs='*', help='names of the benchmarks to run')
+    parser.add_argument('--save', help='save the results as a JSON baseline')
+    parser.add_argument('--compare', help='compare the results against a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.15, help='tolerated regression')
+    args = parser.parse_args(argv)
+
+    results = []
+    for benchmark in BENCHMARKS:
+        if args.only and benchmark.name not in args.only:
+            continue
+
+        result = run_benchmark(benchmark, args.n, args.repeat)
+        results.append(result)
+        memory = f'{result.bytes_per_object:10,.1f} B/obj' if result.bytes_per_object else ''
+        print(f'{result.name:28} {result.ops_per_second:14,.0f} ops/s {memory}')
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(
+                {
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'results': {result.name: result._asdict() for result in results},
+                },
+                file,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
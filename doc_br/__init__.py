@@ -0,0 +1,94 @@
+"""
+Brazilian CPF and CNPJ documents.
+
+The document types and utils are re-exported here, and the submodules are available as
+attributes, all of them imported on first access only. Importing the package alone loads
+neither SQLAlchemy, NumPy nor any other optional dependency.
+
+Examples:
+    >>> import doc_br
+    >>> doc_br.CPF('529.982.247-25').masked
+    '529.982.247-25'
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from doc_br.types import (  # noqa: F401
+        CNPJ,
+        CPF,
+        Document,
+        InvalidDocumentError,
+        InvalidReason,
+        ParseFailure,
+        parse_document,
+        parse_documents,
+        try_parse_document,
+    )
+    from doc_br.utils import (  # noqa: F401
+        CNPJDocumentUtils,
+        CPFDocumentUtils,
+        DocumentUtils,
+        ValidationResult,
+    )
+
+_EXPORTS = {
+    'CNPJ': 'doc_br.types',
+    'CPF': 'doc_br.types',
+    'Document': 'doc_br.types',
+    'InvalidDocumentError': 'doc_br.types',
+    'InvalidReason': 'doc_br.types',
+    'ParseFailure': 'doc_br.types',
+    'parse_document': 'doc_br.types',
+    'parse_documents': 'doc_br.types',
+    'try_parse_document': 'doc_br.types',
+    'CNPJDocumentUtils': 'doc_br.utils',
+    'CPFDocumentUtils': 'doc_br.utils',
+    'DocumentUtils': 'doc_br.utils',
+    'ValidationResult': 'doc_br.utils',
+}
+"""Module defining each re-exported name."""
+
+_SUBMODULES = frozenset(
+    {
+        'batch',
+        'cli',
+        'collections',
+        'dedup',
+        'index',
+        'metrics',
+        'pandas_types',
+        'pydantic_types',
+        'scan',
+        'sqlalchemy_types',
+        'stream',
+        'types',
+        'utils',
+    }
+)
+"""Submodules imported on first attribute access."""
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name or a submodule on first access.
+
+    :param name: The attribute name.
+    :return: The re-exported object or the submodule.
+    :raises AttributeError: If the name is neither re-exported nor a submodule.
+    """
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name]), name)
+    elif name in _SUBMODULES:
+        value = import_module(f'{__name__}.{name}')
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the ones not imported yet."""
+    return sorted(set(globals()) | _EXPORTS.keys() | _SUBMODULES)
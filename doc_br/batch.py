@@ -0,0 +1,199 @@
+"""
+Vectorized validation of document strings with NumPy.
+
+Besides validate_many and classify_many, the digit helpers below are the internal API shared
+by the other NumPy-based modules of the package, as the pandas types, the document index, the
+deduplicator, the scanner and the generator. They are not re-exported by the package.
+"""
+from typing import Iterable, Tuple
+
+from doc_br.types.check_digit import CheckDigitEngine, InvalidDocumentError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_CHUNK_SIZE = 65536
+"""Number of rows validated at once, bounding the size of the character matrix."""
+
+DIGIT_ZERO = ord('0')
+"""Code point of the digit zero, subtracted from character codes to get digit values."""
+
+_NINE = ord('9')
+
+
+def _require_numpy() -> None:
+    """Ensure NumPy is available.
+
+    :raises ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError('NumPy is required for batch validation: pip install numpy')
+
+
+def _as_str_array(docs: Iterable[str]) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Convert the input documents to a NumPy unicode array.
+
+    Entries that are not strings, such as None, integers or bytes, are replaced by empty
+    strings and flagged, so they are invalid as they are for the document constructors.
+
+    :param docs: A sequence or array of document strings. Other entries are accepted.
+    :return: The unicode array and a boolean mask of the entries that are not strings.
+    """
+    if not isinstance(docs, np.ndarray):
+        docs = np.array(list(docs), dtype=object)
+
+    if docs.dtype.kind == 'U':
+        return docs.ravel(), np.zeros(docs.size, dtype=bool)
+
+    docs = docs.ravel().astype(object)
+    not_str = ~np.fromiter((isinstance(doc, str) for doc in docs), dtype=bool, count=docs.size)
+    return np.where(not_str, '', docs).astype(str), not_str
+
+
+def _validate_chunk(chars: 'np.ndarray', engine: CheckDigitEngine) -> Tuple['np.ndarray', ...]:
+    """Validate a chunk of documents given as a matrix of code points.
+
+    :param chars: A (rows, width) uint32 matrix of code points, right-padded with zeros.
+    :param engine: The check-digit engine of the document type.
+    :return: The boolean validity mask and the (rows, size) digit matrix.
+    """
+    size = engine.size
+    is_digit = (chars >= DIGIT_ZERO) & (chars <= _NINE)
+    is_mask = np.isin(chars, [ord(c) for c in engine.mask_characters])
+    valid = ~(~is_digit & ~is_mask & (chars != 0)).any(axis=1)
+
+    # Right-align the digits of each row, which also fills them with leading zeros.
+    from_right = np.cumsum(is_digit[:, ::-1], axis=1)[:, ::-1]
+    valid &= from_right[:, 0] <= size
+
+    digits = np.zeros((chars.shape[0], size), dtype=np.int64)
+    rows, cols = np.nonzero(is_digit & valid[:, None])
+    digits[rows, size - from_right[rows, cols]] = chars[rows, cols] - DIGIT_ZERO
+
+    valid &= valid_digits(digits, engine)
+    return valid, digits
+
+
+def valid_digits(digits: 'np.ndarray', engine: CheckDigitEngine) -> 'np.ndarray':
+    """Check the check digits and the repeated digits of a digit matrix.
+
+    :param digits: A (rows, size) int64 matrix of digits.
+    :param engine: The check-digit engine of the document type.
+    :return: The boolean validity mask.
+    """
+    weights = np.asarray(engine.weights, dtype=np.int64)
+    first = mod11_check_digits(digits[:, :-2] @ weights[1:])
+    second = mod11_check_digits(digits[:, :-2] @ weights[:-1] + first * weights[-1])
+
+    valid = (digits[:, -2] == first) & (digits[:, -1] == second)
+    valid &= ~(digits == digits[:, :1]).all(axis=1)
+    return valid
+
+
+def mod11_check_digits(totals: 'np.ndarray') -> 'np.ndarray':
+    """Compute modulo 11 check digits from weighted sums.
+
+    :param totals: The weighted sums.
+    :return: The check digits.
+    """
+    remainder = totals % 11
+    return np.where(remainder < 2, 0, 11 - remainder)
+
+
+def plain_to_ints(plain: 'np.ndarray', size: int) -> 'np.ndarray':
+    """Convert plain document strings to integers without parsing each string.
+
+    :param plain: The NumPy unicode array of plain document strings, all valid.
+    :param size: The number of digits.
+    :return: The uint64 values.
+    """
+    codes = np.ascontiguousarray(plain, dtype=f'U{size}').view(np.uint32).reshape(-1, size)
+    powers = 10 ** np.arange(size - 1, -1, -1, dtype=np.uint64)
+    return (codes - np.uint32(DIGIT_ZERO)).astype(np.uint64) @ powers
+
+
+def invalid_error(doc: str, engine: CheckDigitEngine) -> InvalidDocumentError:
+    """Build the error of a document string found invalid in bulk, with its failure reason.
+
+    :param doc: The invalid document string.
+    :param engine: The check-digit engine of the document type.
+    :return: The error.
+    """
+    return engine.error(engine.parse(doc))
+
+
+def validate_many(
+    docs: Iterable[str], engine: CheckDigitEngine
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Validate and normalize many document strings at once.
+
+    Check digits are computed as weighted sums over a matrix of digits, so no Python object
+    is built per document.
+
+    :param docs: A sequence or NumPy array of document strings, masked or not.
+    :param engine: The check-digit engine of the document type.
+    :return: A boolean mask of the valid documents and an array with their plain strings.
+             Invalid documents have an empty plain string.
+    :raises ImportError: If NumPy is not installed.
+    """
+    _require_numpy()
+
+    docs, not_str = _as_str_array(docs)
+    size = engine.size
+    valid = np.zeros(docs.size, dtype=bool)
+    plain = np.zeros(docs.size, dtype=f'U{size}')
+
+    for start in range(0, docs.size, _CHUNK_SIZE):
+        end = min(start + _CHUNK_SIZE, docs.size)
+        chunk = np.ascontiguousarray(docs[start:end])
+        width = chunk.dtype.itemsize // 4
+        chars = chunk.view(np.uint32).reshape(chunk.size, width)
+
+        if width:
+            chunk_valid, digits = _validate_chunk(chars, engine)
+        else:
+            chunk_valid = np.zeros(chunk.size, dtype=bool)
+            digits = np.zeros((chunk.size, size), dtype=np.int64)
+
+        chunk_valid &= ~not_str[start:end]
+        codes = np.ascontiguousarray((digits + DIGIT_ZERO).astype(np.uint32))
+        chunk_plain = codes.view(f'U{size}').ravel()
+
+        valid[start:end] = chunk_valid
+        plain[start:end] = np.where(chunk_valid, chunk_plain, '')
+
+    return valid, plain
+
+
+def classify_many(docs: Iterable[str], size: int) -> 'np.ndarray':
+    """
+    Tell many CPF and CNPJ document strings apart at once, without validating them.
+
+    A document string is a CNPJ if it has a slash, as in the CNPJ mask, or more than size
+    digits.
+
+    :param docs: A sequence or NumPy array of document strings, masked or not.
+    :param size: The number of digits of a plain CPF document string.
+    :return: A boolean mask of the CNPJ document strings.
+    :raises ImportError: If NumPy is not installed.
+    """
+    _require_numpy()
+
+    docs, _ = _as_str_array(docs)
+    is_cnpj = np.zeros(docs.size, dtype=bool)
+
+    for start in range(0, docs.size, _CHUNK_SIZE):
+        end = min(start + _CHUNK_SIZE, docs.size)
+        chunk = np.ascontiguousarray(docs[start:end])
+        width = chunk.dtype.itemsize // 4
+        if not width:
+            continue
+
+        chars = chunk.view(np.uint32).reshape(chunk.size, width)
+        digit_count = ((chars >= DIGIT_ZERO) & (chars <= _NINE)).sum(axis=1)
+        is_cnpj[start:end] = (chars == ord('/')).any(axis=1) | (digit_count > size)
+
+    return is_cnpj
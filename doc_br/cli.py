@@ -0,0 +1,393 @@
+"""
+Command-line tool for bulk validation, normalization and deduplication of documents.
+
+Examples:
+    doc-br validate --kind cpf extract.txt
+    doc-br normalize --kind cnpj --column cnpj --mask companies.csv > normalized.csv
+    cat extract.txt | doc-br dedupe --workers 8
+"""
+import argparse
+import csv
+import io
+import sys
+from collections import Counter
+from itertools import tee
+from typing import (
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from doc_br.utils import (
+    CNPJDocumentUtils,
+    CPFDocumentUtils,
+    DocumentUtils,
+    ValidationResult,
+)
+
+_UTILS = {
+    'cpf': CPFDocumentUtils,
+    'cnpj': CNPJDocumentUtils,
+}
+"""Document utils class of each supported document kind."""
+
+Row = Union[str, List[str]]
+"""A line of a newline-delimited input, or the fields of a CSV row."""
+
+
+class Summary:
+    """Counters of the processed documents, printed at the end of a command."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.valid = 0
+        self.duplicates = 0
+        self.reasons: Counter = Counter()
+
+    @property
+    def invalid(self) -> int:
+        """Get the number of invalid documents."""
+        return self.total - self.valid
+
+    def write(self, file: TextIO) -> None:
+        """Write the summary.
+
+        :param file: The output file.
+        """
+        file.write(f'total: {self.total}\nvalid: {self.valid}\ninvalid: {self.invalid}\n')
+        for reason, count in self.reasons.most_common():
+            file.write(f'  {reason.value}: {count}\n')
+        if self.duplicates:
+            file.write(f'duplicates: {self.duplicates}\n')
+
+    def add(self, result: ValidationResult) -> None:
+        """Count a validated document.
+
+        :param result: The validation result of the document.
+        """
+        self.total += 1
+        if result.valid:
+            self.valid += 1
+        else:
+            self.reasons[result.reason] += 1
+
+
+def _open_inputs(paths: Sequence[str], encoding: str) -> Iterator[IO]:
+    """Lazily open the input files, '-' being the standard input.
+
+    :param paths: The file paths.
+    :param encoding: The file encoding.
+    :return: An iterator over the open text files.
+    """
+    for path in paths or ['-']:
+        if path == '-':
+            stdin = io.TextIOWrapper(sys.stdin.buffer, encoding=encoding, newline='')
+            try:
+                yield stdin
+            finally:
+                # Detached, the wrapper no longer closes the standard input when collected.
+                stdin.detach()
+            continue
+
+        with open(path, encoding=encoding, newline='') as file:
+            yield file
+
+
+class _RowReader:
+    """
+    Reader of the input rows and of their document values.
+
+    With a column name, the header of every input is read and must be the same as the
+    header of the first one, kept in :attr:`header`.
+
+    Args:
+        args (argparse.Namespace): The command-line arguments.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        column = args.column
+        self.column: Union[int, str, None] = int(column) if column and column.isdigit() else column
+        self.paths = args.files
+        self.delimiter = args.delimiter
+        self.encoding = args.encoding
+        self.header: Optional[List[str]] = None
+
+    def __iter__(self) -> Iterator[Tuple[Row, Optional[int], str]]:
+        """Lazily read the rows of all the inputs.
+
+        :return: An iterator over (row, column index, document value) triples, the column
+                 index being None for newline-delimited inputs.
+        :raises ValueError: If the column name is not found in a header or the headers differ.
+        """
+        for file in _open_inputs(self.paths, self.encoding):
+            if self.column is None:
+                yield from self._read_lines(file)
+            else:
+                yield from self._read_csv(file)
+
+    @staticmethod
+    def _read_lines(file: IO) -> Iterator[Tuple[Row, Optional[int], str]]:
+        """Read the non-blank lines of a newline-delimited input.
+
+        :param file: The input file.
+        :return: An iterator over (line, None, document value) triples.
+        """
+        for line in file:
+            line = line.rstrip('\r\n')
+            if line.strip():
+                yield line, None, line.strip()
+
+    def _read_csv(self, file: IO) -> Iterator[Tuple[Row, Optional[int], str]]:
+        """Read the non-empty rows of a CSV input.
+
+        :param file: The input file.
+        :return: An iterator over (fields, column index, document value) triples.
+        :raises ValueError: If the column name is not found in the header or the headers differ.
+        """
+        reader = csv.reader(file, delimiter=self.delimiter)
+        index = self._column_index(reader)
+        for row in reader:
+            if row:
+                yield row, index, row[index].strip() if index < len(row) else ''
+
+    def _column_index(self, reader: Iterator[List[str]]) -> int:
+        """Get the index of the document column, reading the header if it is named.
+
+        :param reader: The CSV reader of an input, before its first row.
+        :return: The column index.
+        :raises ValueError: If the column name is not found in the header or the headers differ.
+        """
+        if isinstance(self.column, int):
+            return self.column
+
+        names = next(reader, [])
+        if self.header is not None and names != self.header:
+            raise ValueError('The CSV headers of the input files differ.')
+        if self.column not in names:
+            raise ValueError(f'Column {self.column!r} not found in the header.')
+
+        self.header = names
+        return names.index(self.column)
+
+
+class _ValidationWriter:
+    """Writer of the document value, validity and failure reason of each row."""
+
+    def __init__(
+        self, args: argparse.Namespace, output: TextIO, reader: _RowReader, summary: Summary
+    ):
+        self.invalid_only = args.invalid_only
+        self.writer = csv.writer(output, delimiter=args.delimiter, lineterminator='\n')
+
+    def write(self, row: Row, index: Optional[int], value: str, result: ValidationResult) -> None:
+        """Write the validation result of a row.
+
+        :param row: The input row.
+        :param index: The document column index, None for a newline-delimited input.
+        :param value: The document value of the row.
+        :param result: The validation result of the document value.
+        """
+        if result.valid and self.invalid_only:
+            return
+
+        reason = '' if result.valid else result.reason.name
+        self.writer.writerow([value, 'valid' if result.valid else 'invalid', reason])
+
+
+class _NormalizationWriter:
+    """Writer of the rows with their documents normalized, after the CSV header if any."""
+
+    def __init__(
+        self, args: argparse.Namespace, output: TextIO, reader: _RowReader, summary: Summary
+    ):
+        self.document_class = _UTILS[args.kind].document_class
+        self.mask = args.mask
+        self.keep_invalid = args.keep_invalid
+        self.output = output
+        self.writer = csv.writer(output, delimiter=args.delimiter, lineterminator='\n')
+        self.reader = reader
+        self.summary = summary
+        self.header_written = False
+
+    def write(self, row: Row, index: Optional[int], value: str, result: ValidationResult) -> None:
+        """Write a row with its document normalized, or unchanged if invalid and kept.
+
+        :param row: The input row.
+        :param index: The document column index, None for a newline-delimited input.
+        :param value: The document value of the row.
+        :param result: The validation result of the document value.
+        """
+        if not self.header_written and self.reader.header is not None:
+            self.writer.writerow(self.reader.header)
+            self.header_written = True
+
+        if not result.valid:
+            if self.keep_invalid:
+                self._write_row(row)
+            return
+
+        normalized = result.plain
+        if self.mask:
+            normalized = self.document_class.from_trusted(result.plain).masked
+
+        if index is None:
+            row = normalized
+        else:
+            row[index] = normalized
+        self._write_row(row)
+
+    def _write_row(self, row: Row) -> None:
+        """Write a line as it is, or the fields of a CSV row.
+
+        :param row: The row.
+        """
+        if isinstance(row, str):
+            self.output.write(row + '\n')
+        else:
+            self.writer.writerow(row)
+
+
+class _DeduplicationWriter(_NormalizationWriter):
+    """
+    Writer of the first row of each distinct document, normalized.
+
+    The distinct documents seen so far are kept in memory as integers, so memory usage grows
+    with the number of distinct documents, by about 70 bytes each. Inputs with more distinct
+    documents than fit in memory can be deduplicated with :mod:`doc_br.dedup` instead.
+    """
+
+    def __init__(
+        self, args: argparse.Namespace, output: TextIO, reader: _RowReader, summary: Summary
+    ):
+        super().__init__(args, output, reader, summary)
+        self.seen: Set[int] = set()
+
+    def write(self, row: Row, index: Optional[int], value: str, result: ValidationResult) -> None:
+        """Write a row unless its document was already seen, counting the duplicates.
+
+        :param row: The input row.
+        :param index: The document column index, None for a newline-delimited input.
+        :param value: The document value of the row.
+        :param result: The validation result of the document value.
+        """
+        if result.valid:
+            key = int(result.plain)
+            if key in self.seen:
+                self.summary.duplicates += 1
+                return
+            self.seen.add(key)
+
+        super().write(row, index, value, result)
+
+
+_WRITERS = {
+    'validate': _ValidationWriter,
+    'normalize': _NormalizationWriter,
+    'dedupe': _DeduplicationWriter,
+}
+"""Output writer class of each command."""
+
+
+def _process(args: argparse.Namespace, output: TextIO, summary: Summary) -> None:
+    """Validate the input documents in parallel and write the command output.
+
+    :param args: The command-line arguments.
+    :param output: The output file.
+    :param summary: Receives the counts of the processed documents.
+    """
+    utils: DocumentUtils = _UTILS[args.kind]()
+    reader = _RowReader(args)
+    writer = _WRITERS[args.command](args, output, reader, summary)
+
+    rows, values = tee(reader)
+    results = utils.iter_validate_bulk(
+        (value for _, _, value in values), workers=args.workers, chunk_size=args.chunk_size
+    )
+    for (row, index, value), result in zip(rows, results):
+        summary.add(result)
+        writer.write(row, index, value, result)
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the command-line parser.
+
+    :return: The parser.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('files', nargs='*', help="input files, '-' or none for stdin")
+    common.add_argument('-k', '--kind', choices=sorted(_UTILS), default='cpf')
+    common.add_argument('-c', '--column', help='CSV column index or header name')
+    common.add_argument('-d', '--delimiter', default=',', help='CSV delimiter')
+    common.add_argument('-e', '--encoding', default='utf-8')
+    common.add_argument('-o', '--output', help='output file, default to stdout')
+    common.add_argument('-w', '--workers', type=int, help='worker processes, default to CPUs')
+    common.add_argument('--chunk-size', type=int, default=10000, help='documents per task')
+    common.add_argument('-q', '--quiet', action='store_true', help='do not print the summary')
+
+    parser = argparse.ArgumentParser(
+        prog='doc-br', description='Validate, normalize and deduplicate CPF/CNPJ documents.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    validate = commands.add_parser(
+        'validate', parents=[common], help='write the validity and failure reason of each row'
+    )
+    validate.add_argument('--invalid-only', action='store_true', help='only write invalid rows')
+
+    for name, description in (
+        ('normalize', 'write the rows with their documents normalized'),
+        (
+            'dedupe',
+            'write the first row of each distinct document, normalized, keeping the distinct '
+            'documents in memory',
+        ),
+    ):
+        command = commands.add_parser(name, parents=[common], help=description)
+        command.add_argument('-m', '--mask', action='store_true', help='write masked documents')
+        command.add_argument(
+            '--keep-invalid', action='store_true', help='write invalid rows unchanged'
+        )
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the doc-br command-line tool.
+
+    :param argv: The command-line arguments, default to sys.argv.
+    :return: The exit code: 0 on success, 1 if validate found invalid documents, 2 on errors.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1 or args.chunk_size < 1:
+        parser.error('--workers and --chunk-size must be positive')
+
+    summary = Summary()
+    output = sys.stdout
+    try:
+        if args.output:
+            output = open(args.output, 'w', encoding=args.encoding, newline='')
+        _process(args, output, summary)
+    except (OSError, ValueError) as e:
+        print(f'doc-br: error: {e}', file=sys.stderr)
+        return 2
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+
+    if not args.quiet:
+        summary.write(sys.stderr)
+
+    return int(args.command == 'validate' and summary.invalid > 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,283 @@
+from array import array
+from bisect import bisect_left
+from typing import Generic, Iterable, Iterator, Type, TypeVar, Union
+
+from doc_br.types import CNPJ, CPF, Document
+from doc_br.types.check_digit import (
+    CNPJ_ENGINE,
+    CPF_ENGINE,
+    CheckDigitEngine,
+    InvalidReason,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+D = TypeVar('D', bound=Document)
+
+
+class DocumentArray(Generic[D]):
+    """
+    Compact set of documents backed by an array of 64-bit unsigned integers.
+
+    Each document takes 8 bytes. Document objects are only built on demand, when iterating or
+    indexing. The array is sorted and deduplicated lazily, before membership tests, indexing
+    and set operations, so the insertion order is not preserved.
+
+    NumPy is used to sort and to validate large inputs when it is installed.
+
+    Args:
+        docs (Iterable[str | Document]): Initial document strings or documents.
+
+    Raises:
+        ValueError: If a document string is invalid.
+    """
+
+    document_class: Type[D]
+    """The document class of the array items."""
+
+    _engine: CheckDigitEngine
+    """The check-digit engine used to validate the document strings."""
+
+    def __init__(self, docs: Iterable[Union[str, D]] = ()):
+        self._values = array('Q')
+        self._normalized = True
+        self.extend(docs)
+
+    def append(self, doc: Union[str, D]) -> None:
+        """Validate and add a document.
+
+        :param doc: The document string or document object.
+        :raises ValueError: If the document string is invalid.
+        """
+        self._values.append(self._to_int(doc))
+        self._normalized = len(self._values) < 2
+
+    def extend(self, docs: Iterable[Union[str, D]]) -> None:
+        """Validate and add many documents.
+
+        No document is added if any of them is invalid.
+
+        :param docs: The document strings or document objects.
+        :raises ValueError: If a document string is invalid.
+        """
+        if isinstance(docs, DocumentArray):
+            self._check_compatible(docs)
+            values = docs._values
+        elif np is not None and isinstance(docs, (list, tuple, np.ndarray)) and len(docs):
+            values = self._validate_with_numpy(docs)
+        else:
+            values = array('Q', map(self._to_int, docs))
+
+        if len(values):
+            self._values.extend(values)
+            self._normalized = len(self._values) < 2
+
+    def union(self, other: 'DocumentArray[D]') -> 'DocumentArray[D]':
+        """Get the documents in this array or in the other one.
+
+        :param other: The other document array.
+        :return: A new document array.
+        """
+        self._check_compatible(other)
+        result = self._empty()
+        result._values = self._values + other._values
+        result._normalized = False
+        return result
+
+    def intersection(self, other: 'DocumentArray[D]') -> 'DocumentArray[D]':
+        """Get the documents in both this array and the other one.
+
+        :param other: The other document array.
+        :return: A new document array.
+        """
+        return self._filter(other, keep_common=True)
+
+    def difference(self, other: 'DocumentArray[D]') -> 'DocumentArray[D]':
+        """Get the documents in this array but not in the other one.
+
+        :param other: The other document array.
+        :return: A new document array.
+        """
+        return self._filter(other, keep_common=False)
+
+    def _filter(self, other: 'DocumentArray[D]', keep_common: bool) -> 'DocumentArray[D]':
+        """Get the documents of this array that are, or are not, in the other one.
+
+        :param other: The other document array.
+        :param keep_common: Whether to keep the common documents or the other ones.
+        :return: A new document array.
+        """
+        self._check_compatible(other)
+        self._normalize()
+        other._normalize()
+        result = self._empty()
+
+        if np is not None:
+            left = np.frombuffer(self._values, dtype=np.uint64)
+            right = np.frombuffer(other._values, dtype=np.uint64)
+            keep = np.isin(left, right, assume_unique=True)
+            result._values.frombytes(left[keep if keep_common else ~keep].tobytes())
+            return result
+
+        result._values = array('Q', (v for v in self._values if other._has(v) is keep_common))
+        return result
+
+    def _normalize(self) -> None:
+        """Sort and deduplicate the array in place, if needed."""
+        if self._normalized:
+            return
+
+        if np is not None:
+            unique = np.unique(np.frombuffer(self._values, dtype=np.uint64)).tobytes()
+        else:
+            unique = array('Q', sorted(set(self._values))).tobytes()
+
+        self._values = array('Q')
+        self._values.frombytes(unique)
+        self._normalized = True
+
+    def _has(self, value: int) -> bool:
+        """Check whether the sorted array holds an integer value.
+
+        :param value: The integer value of a document.
+        :return: True if the value is in the array, False otherwise.
+        """
+        index = bisect_left(self._values, value)
+        return index < len(self._values) and self._values[index] == value
+
+    def _to_int(self, doc: Union[str, D]) -> int:
+        """Validate a document and get its integer value.
+
+        :param doc: The document string or document object.
+        :return: The integer value of the document.
+        :raises ValueError: If the document string is invalid.
+        """
+        if isinstance(doc, self.document_class):
+            return int(doc)
+
+        return int(self._engine.sanitize(doc))
+
+    def _validate_with_numpy(self, docs: Iterable[str]) -> array:
+        """Validate many document strings at once using NumPy.
+
+        :param docs: The document strings or document objects.
+        :return: The integer values of the documents.
+        :raises ValueError: If a document string is invalid.
+        """
+        from doc_br.batch import validate_many
+
+        docs = [d.plain if isinstance(d, self.document_class) else d for d in docs]
+        valid, plain = validate_many(docs, self._engine)
+        if not valid.all():
+            self._engine.sanitize(docs[int(np.argmin(valid))])
+
+        values = array('Q')
+        values.frombytes(plain.astype(np.uint64).tobytes())
+        return values
+
+    def _check_compatible(self, other: 'DocumentArray') -> None:
+        """Ensure the other array holds the same document type.
+
+        :param other: The other document array.
+        :raises TypeError: If the other array holds another document type.
+        """
+        if not isinstance(other, DocumentArray) or other.document_class is not self.document_class:
+            raise TypeError(f'Expected an array of {self.document_class.__name__} documents.')
+
+    def _empty(self) -> 'DocumentArray[D]':
+        """Create an empty array of the same type.
+
+        :return: The empty document array.
+        """
+        return type(self)()
+
+    def __contains__(self, doc: object) -> bool:
+        """Check whether a document is in the array using a binary search.
+
+        :param doc: The document string or document object.
+        :return: True if the document is valid and in the array, False otherwise.
+        """
+        if isinstance(doc, self.document_class):
+            value = int(doc)
+        elif isinstance(doc, str):
+            plain = self._engine.parse(doc)
+            if isinstance(plain, InvalidReason):
+                return False
+            value = int(plain)
+        else:
+            return False
+
+        self._normalize()
+        return self._has(value)
+
+    def __getitem__(self, index: int) -> D:
+        """Get the document at a position of the sorted array.
+
+        :param index: The position.
+        :return: The document object.
+        """
+        self._normalize()
+        return self.document_class._from_int(self._values[index])
+
+    def __iter__(self) -> Iterator[D]:
+        """Iterate over the documents in ascending order, building them on demand.
+
+        :return: An iterator over the document objects.
+        """
+        self._normalize()
+        from_int = self.document_class._from_int
+        return (from_int(value) for value in self._values)
+
+    def __len__(self) -> int:
+        """Return the number of distinct documents in the array."""
+        self._normalize()
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether two arrays hold the same documents."""
+        if not isinstance(other, DocumentArray) or other.document_class is not self.document_class:
+            return NotImplemented
+
+        self._normalize()
+        other._normalize()
+        return self._values == other._values
+
+    def __or__(self, other: 'DocumentArray[D]') -> 'DocumentArray[D]':
+        """Return the union of two arrays."""
+        return self.union(other)
+
+    def __and__(self, other: 'DocumentArray[D]') -> 'DocumentArray[D]':
+        """Return the intersection of two arrays."""
+        return self.intersection(other)
+
+    def __sub__(self, other: 'DocumentArray[D]') -> 'DocumentArray[D]':
+        """Return the difference of two arrays."""
+        return self.difference(other)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the array."""
+        return f'{type(self).__name__}(<{len(self)} documents>)'
+
+
+class CPFArray(DocumentArray[CPF]):
+    """
+    Compact set of CPF documents.
+
+    Examples:
+        >>> cpfs = CPFArray(['529.982.247-25', '52998224725', '337231923'])
+        >>> len(cpfs), '003.372.319-23' in cpfs
+        (2, True)
+    """
+
+    document_class = CPF
+    _engine = CPF_ENGINE
+
+
+class CNPJArray(DocumentArray[CNPJ]):
+    """Compact set of CNPJ documents."""
+
+    document_class = CNPJ
+    _engine = CNPJ_ENGINE
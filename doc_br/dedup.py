@@ -0,0 +1,368 @@
+"""
+External-memory deduplication of CPF and CNPJ documents.
+
+Documents are normalized by the check-digit engine of their kind, so masked and unmasked forms
+of a document collapse together, and buffered as 64-bit integers. Full buffers are sorted and
+spilled to disk as runs of (value, count) pairs, which are merged at the end, so memory usage
+does not depend on the number of documents.
+
+Examples:
+    >>> with Deduplicator('cpf') as dedup:
+    ...     dedup.add(['529.982.247-25', '52998224725', '337231923', 'x'])
+    ...     for entry in dedup:
+    ...         print(entry.plain, entry.count)
+    00337231923 1
+    52998224725 2
+    >>> dedup.total, dedup.invalid
+    (4, 1)
+"""
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import groupby, islice
+from typing import (
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from doc_br.types.check_digit import CNPJ_ENGINE, CPF_ENGINE, InvalidReason
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_KINDS = {
+    'cpf': CPF_ENGINE,
+    'cnpj': CNPJ_ENGINE,
+}
+"""Check-digit engine of each supported document kind."""
+
+_RUN_SIZE = 1 << 22
+"""Default number of documents buffered in memory before a run is spilled to disk."""
+
+_FANOUT = 64
+"""Default maximum number of runs merged at once."""
+
+_CHUNK_SIZE = 65536
+"""Number of input documents normalized at once."""
+
+_BLOCK_SIZE = 65536
+"""Number of (value, count) pairs read at once from each run."""
+
+_PAIR_SIZE = 2 * array('Q').itemsize
+"""Size in bytes of a (value, count) pair in a run file."""
+
+_DIR_PREFIX = 'doc_br-dedup-'
+"""Name prefix of the temporary directory of the run files."""
+
+
+class DocumentCount(NamedTuple):
+    """A distinct document and the number of times it was found."""
+
+    plain: str
+    """The plain document string."""
+
+    count: int
+    """The number of occurrences of the document, masked or not."""
+
+    @property
+    def duplicates(self) -> int:
+        """Get the number of occurrences after the first one."""
+        return self.count - 1
+
+
+def _count_sorted(values: array) -> bytes:
+    """Sort integer values and count the occurrences of each distinct one.
+
+    :param values: The uint64 values.
+    :return: The sorted (value, count) pairs, as native uint64 bytes.
+    """
+    if np is not None:
+        unique, counts = np.unique(np.frombuffer(values, dtype=np.uint64), return_counts=True)
+        return np.column_stack((unique, counts.astype(np.uint64))).tobytes()
+
+    pairs = array('Q')
+    for value, group in groupby(sorted(values)):
+        pairs.append(value)
+        pairs.append(sum(1 for _ in group))
+    return pairs.tobytes()
+
+
+def _read_run(path: str) -> Iterator[Tuple[int, int]]:
+    """Lazily read the (value, count) pairs of a run file, a block at a time.
+
+    :param path: The run file path.
+    :return: An iterator over the pairs, in order.
+    """
+    with open(path, 'rb') as file:
+        while data := file.read(_BLOCK_SIZE * _PAIR_SIZE):
+            pairs = array('Q')
+            pairs.frombytes(data)
+            yield from zip(pairs[::2], pairs[1::2])
+
+
+def _iter_pairs(data: bytes) -> Iterator[Tuple[int, int]]:
+    """Iterate over the (value, count) pairs of an in-memory run.
+
+    :param data: The pairs, as native uint64 bytes.
+    :return: An iterator over the pairs, in order.
+    """
+    pairs = array('Q')
+    pairs.frombytes(data)
+    return zip(pairs[::2], pairs[1::2])
+
+
+def _merge(runs: Iterable[Iterator[Tuple[int, int]]]) -> Iterator[Tuple[int, int]]:
+    """Merge sorted runs of (value, count) pairs, adding up the counts of equal values.
+
+    :param runs: The sorted runs.
+    :return: An iterator over the merged pairs, with distinct values in order.
+    """
+    current, total = None, 0
+    for value, count in heapq.merge(*runs):
+        if value == current:
+            total += count
+            continue
+
+        if current is not None:
+            yield current, total
+        current, total = value, count
+
+    if current is not None:
+        yield current, total
+
+
+class Deduplicator:
+    """
+    External-memory deduplicator of documents of a single kind.
+
+    Documents are added with :meth:`add` or :meth:`add_file`, then iterating over the
+    deduplicator yields each distinct valid document and its number of occurrences, in
+    ascending order. Invalid document strings are counted and skipped.
+
+    Temporary run files are removed by :meth:`close`, or on exiting a ``with`` block.
+
+    Args:
+        kind (str): The document kind, 'cpf' or 'cnpj'.
+        run_size (int): The number of documents buffered in memory before a run is spilled.
+        fanout (int): The maximum number of runs merged at once, bounding the open files.
+        temp_dir (Optional[str]): The directory of the temporary run files. Default to the
+            system temporary directory.
+
+    Raises:
+        ValueError: If the document kind is not supported, run_size is not positive or fanout
+            is less than 2.
+
+    Attributes:
+        total (int): The number of document strings added.
+        invalid (int): The number of invalid document strings skipped.
+    """
+
+    def __init__(
+        self,
+        kind: str = 'cpf',
+        run_size: int = _RUN_SIZE,
+        fanout: int = _FANOUT,
+        temp_dir: Optional[str] = None,
+    ):
+        if kind.lower() not in _KINDS:
+            raise ValueError(f'Unsupported document kind: {kind!r}.')
+        if run_size < 1 or fanout < 2:
+            raise ValueError('run_size must be positive and fanout at least 2.')
+
+        self.kind = kind.lower()
+        self.run_size = run_size
+        self.fanout = fanout
+        self.temp_dir = temp_dir
+        self.total = 0
+        self.invalid = 0
+
+        self._engine = _KINDS[self.kind]
+        self._buffer = array('Q')
+        self._runs: List[str] = []
+        self._directory: Optional[tempfile.TemporaryDirectory] = None
+        self._run_count = 0
+
+    def add(self, docs: Iterable[str]) -> None:
+        """Normalize and add document strings, spilling a run to disk when the buffer is full.
+
+        :param docs: The document strings, masked or not.
+        """
+        iterator = iter(docs)
+        while chunk := list(islice(iterator, _CHUNK_SIZE)):
+            values = self._normalize(chunk)
+            self.total += len(chunk)
+            self.invalid += len(chunk) - len(values)
+            self._buffer.extend(values)
+
+            if len(self._buffer) >= self.run_size:
+                self._spill()
+
+    def add_file(self, path: Union[str, os.PathLike], encoding: str = 'utf-8') -> None:
+        """Add the document strings of a newline-delimited file, skipping blank lines.
+
+        :param path: The file path.
+        :param encoding: The file encoding.
+        """
+        with open(path, encoding=encoding) as file:
+            self.add(_read_lines(file))
+
+    def __iter__(self) -> Iterator[DocumentCount]:
+        """Iterate over the distinct documents and their counts, in ascending order.
+
+        :return: An iterator over the document counts.
+        """
+        self._reduce_runs()
+        runs = [_read_run(path) for path in self._runs]
+        if self._buffer:
+            runs.append(_iter_pairs(_count_sorted(self._buffer)))
+
+        size = self._engine.size
+        for value, count in _merge(runs):
+            yield DocumentCount(str(value).zfill(size), count)
+
+    def close(self) -> None:
+        """Remove the temporary run files and discard the buffered documents."""
+        self._buffer = array('Q')
+        self._runs = []
+        if self._directory is not None:
+            self._directory.cleanup()
+            self._directory = None
+
+    def __enter__(self) -> 'Deduplicator':
+        """Enter the runtime context of the deduplicator."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Remove the temporary run files on exiting the runtime context."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return the string representation of the deduplicator."""
+        return (
+            f'Deduplicator({self.kind!r}, total={self.total}, invalid={self.invalid}, '
+            f'runs={len(self._runs)})'
+        )
+
+    def _normalize(self, docs: List[str]) -> array:
+        """Validate and normalize a chunk of document strings.
+
+        :param docs: The document strings.
+        :return: The uint64 values of the valid documents.
+        """
+        engine = self._engine
+        values = array('Q')
+        if np is not None:
+            from doc_br.batch import plain_to_ints, validate_many
+
+            valid, plain = validate_many(docs, engine)
+            values.frombytes(plain_to_ints(plain[valid], engine.size).tobytes())
+            return values
+
+        parsed = map(engine.parse, docs)
+        values.extend(int(plain) for plain in parsed if not isinstance(plain, InvalidReason))
+        return values
+
+    def _new_run_path(self) -> str:
+        """Get the path of a new run file in the temporary directory.
+
+        :return: The run file path.
+        """
+        if self._directory is None:
+            self._directory = tempfile.TemporaryDirectory(prefix=_DIR_PREFIX, dir=self.temp_dir)
+
+        self._run_count += 1
+        return os.path.join(self._directory.name, f'run-{self._run_count}')
+
+    def _spill(self) -> None:
+        """Sort, count and write the buffered documents as a new run file."""
+        path = self._new_run_path()
+        with open(path, 'wb') as file:
+            file.write(_count_sorted(self._buffer))
+
+        self._runs.append(path)
+        self._buffer = array('Q')
+
+    def _reduce_runs(self) -> None:
+        """Merge groups of run files until they can all be merged at once with the buffer."""
+        while len(self._runs) + 1 > self.fanout:
+            fanout = self.fanout
+            group, self._runs = self._runs[:fanout], self._runs[fanout:]
+            path = self._new_run_path()
+
+            with open(path, 'wb') as file:
+                pairs = array('Q')
+                for value, count in _merge(_read_run(run) for run in group):
+                    pairs.append(value)
+                    pairs.append(count)
+                    if len(pairs) >= 2 * _BLOCK_SIZE:
+                        file.write(pairs.tobytes())
+                        pairs = array('Q')
+                file.write(pairs.tobytes())
+
+            for run in group:
+                os.remove(run)
+            self._runs.append(path)
+
+
+def _read_lines(file: IO) -> Iterator[str]:
+    """Lazily read the non-blank lines of a text file, stripped.
+
+    :param file: The text file.
+    :return: An iterator over the lines.
+    """
+    return filter(None, (line.strip() for line in file))
+
+
+def deduplicate_files(
+    paths: Iterable[Union[str, os.PathLike]],
+    kind: str = 'cpf',
+    encoding: str = 'utf-8',
+    run_size: int = _RUN_SIZE,
+    fanout: int = _FANOUT,
+    temp_dir: Optional[str] = None,
+) -> Iterator[DocumentCount]:
+    """
+    Deduplicate the documents of newline-delimited files larger than memory.
+
+    Examples:
+        >>> for entry in deduplicate_files(['january.txt', 'february.txt'], kind='cnpj'):
+        ...     print(entry.plain, entry.count)  # doctest: +SKIP
+
+    :param paths: The file paths.
+    :param kind: The document kind, 'cpf' or 'cnpj'.
+    :param encoding: The file encoding.
+    :param run_size: The number of documents buffered in memory before a run is spilled.
+    :param fanout: The maximum number of runs merged at once.
+    :param temp_dir: The directory of the temporary run files.
+    :return: An iterator over the distinct valid documents and their counts, in ascending
+             order. The temporary run files are removed once it is exhausted or closed.
+    :raises ValueError: If the document kind is not supported, run_size is not positive or
+                        fanout is less than 2.
+    """
+    dedup = Deduplicator(kind, run_size, fanout, temp_dir)
+    return _deduplicate_files(dedup, paths, encoding)
+
+
+def _deduplicate_files(
+    dedup: Deduplicator, paths: Iterable[Union[str, os.PathLike]], encoding: str
+) -> Iterator[DocumentCount]:
+    """Add the documents of the files and yield the deduplicated documents.
+
+    :param dedup: The deduplicator.
+    :param paths: The file paths.
+    :param encoding: The file encoding.
+    :return: An iterator over the document counts.
+    """
+    with dedup:
+        for path in paths:
+            dedup.add_file(path, encoding)
+        yield from dedup
@@ -0,0 +1,434 @@
+import math
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from typing import Generic, Iterable, List, Optional, Type, TypeVar, Union
+
+from doc_br.batch import invalid_error, plain_to_ints, validate_many
+from doc_br.types import CNPJ, CPF, Document
+from doc_br.types.check_digit import (
+    CNPJ_ENGINE,
+    CPF_ENGINE,
+    CheckDigitEngine,
+    InvalidReason,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+D = TypeVar('D', bound=Document)
+
+_MAGIC = b'DOCBRIDX'
+_HEADER = struct.Struct('<8s8sQQQ')
+"""Magic number, document kind, number of values, Bloom filter bits and hash functions."""
+
+_DATA_OFFSET = 64
+"""Offset of the sorted values, after the padded header."""
+
+_MASK = (1 << 64) - 1
+_CHUNK_SIZE = 65536
+"""Number of documents validated at once while building an index."""
+
+
+def _numpy_values(docs: List[str], engine: CheckDigitEngine, skip_invalid: bool) -> array:
+    """Validate document strings at once with NumPy and get their integer values.
+
+    :param docs: The document strings.
+    :param engine: The check-digit engine of the document type.
+    :param skip_invalid: Whether to skip invalid document strings instead of raising.
+    :return: The integer values of the valid documents.
+    :raises InvalidDocumentError: If a document string is invalid and skip_invalid is False.
+    """
+    valid, plain = validate_many(docs, engine)
+    if not skip_invalid and not valid.all():
+        raise invalid_error(docs[int(np.argmin(valid))], engine)
+
+    values = array('Q')
+    values.frombytes(plain_to_ints(plain[valid], engine.size).tobytes())
+    return values
+
+
+def _python_values(docs: List[str], engine: CheckDigitEngine, skip_invalid: bool) -> array:
+    """Validate document strings one by one and get their integer values.
+
+    :param docs: The document strings.
+    :param engine: The check-digit engine of the document type.
+    :param skip_invalid: Whether to skip invalid document strings instead of raising.
+    :return: The integer values of the valid documents.
+    :raises InvalidDocumentError: If a document string is invalid and skip_invalid is False.
+    """
+    if not skip_invalid:
+        return array('Q', (int(engine.sanitize(doc)) for doc in docs))
+
+    parsed = (engine.parse(doc) for doc in docs)
+    return array('Q', (int(p) for p in parsed if not isinstance(p, InvalidReason)))
+
+
+def _mix(value: int) -> int:
+    """Scramble a 64-bit value with the splitmix64 finalizer.
+
+    :param value: The value.
+    :return: The scrambled value.
+    """
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK
+    return value ^ (value >> 31)
+
+
+def _mix_array(values: 'np.ndarray') -> 'np.ndarray':
+    """Scramble 64-bit values with the splitmix64 finalizer, like _mix.
+
+    :param values: The uint64 values.
+    :return: The scrambled values.
+    """
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+_SEED = 0x9E3779B97F4A7C15
+"""Constant mixed into the value to derive the second Bloom filter hash."""
+
+
+def _bloom_size(count: int, false_positive_rate: float) -> tuple:
+    """Compute the optimal number of bits and hash functions of a Bloom filter.
+
+    :param count: The number of values.
+    :param false_positive_rate: The target false positive rate.
+    :return: The number of bits, a multiple of 64, and the number of hash functions.
+    """
+    bits = -max(count, 1) * math.log(false_positive_rate) / math.log(2) ** 2
+    bits = max(64, math.ceil(bits / 64) * 64)
+    hashes = max(1, round(bits / max(count, 1) * math.log(2)))
+    return bits, hashes
+
+
+_BIT = np.left_shift(1, np.arange(8, dtype=np.uint8)).astype(np.uint8) if np is not None else None
+"""Bit masks of the 8 positions of a byte."""
+
+
+def _bloom_positions(values: 'np.ndarray', bits: int, hashes: int) -> Iterable['np.ndarray']:
+    """Compute the Bloom filter bit positions of values, one array per hash function.
+
+    Uses the double hashing of two splitmix64 hashes, like _bloom_position_list.
+
+    :param values: The uint64 values.
+    :param bits: The number of bits of the filter.
+    :param hashes: The number of hash functions.
+    :return: An iterator over the bit positions of each hash function.
+    """
+    first = _mix_array(values)
+    second = _mix_array(values ^ np.uint64(_SEED)) | np.uint64(1)
+    for i in range(hashes):
+        yield (first + np.uint64(i) * second) % np.uint64(bits)
+
+
+def _bloom_position_list(value: int, bits: int, hashes: int) -> Iterable[int]:
+    """Compute the Bloom filter bit positions of a value.
+
+    :param value: The integer value.
+    :param bits: The number of bits of the filter.
+    :param hashes: The number of hash functions.
+    :return: An iterator over the bit positions.
+    """
+    first = _mix(value)
+    second = _mix(value ^ _SEED) | 1
+    return (((first + i * second) & _MASK) % bits for i in range(hashes))
+
+
+class DocumentIndex(Generic[D]):
+    """
+    Read-only set of documents persisted as a sorted array of 64-bit integers in a file.
+
+    The file is memory mapped, so opening an index loads nothing: the operating system pages
+    the touched parts in and shares them between all the processes using the same file.
+    Membership tests are binary searches, optionally preceded by a Bloom filter that answers
+    most negative lookups with a few bit probes.
+
+    Build the index once with :meth:`build`, then open it in every process.
+
+    Examples:
+        >>> CPFIndex.build('blocklist.idx', ['529.982.247-25', '337231923'])
+        2
+        >>> with CPFIndex('blocklist.idx') as blocklist:
+        ...     '003.372.319-23' in blocklist
+        True
+
+    Args:
+        path (str | os.PathLike): The index file path.
+
+    Raises:
+        ValueError: If the file is not an index of the document type.
+    """
+
+    document_class: Type[D]
+    """The document class of the indexed documents."""
+
+    _engine: CheckDigitEngine
+    """The check-digit engine used to normalize the document strings."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, kind, count, bits, hashes = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic = None
+
+        if magic != _MAGIC or kind.rstrip(b'\0').decode() != self._engine.name:
+            self._mmap.close()
+            raise ValueError(f'{os.fspath(path)!r} is not a {self._engine.name} index.')
+
+        self._count = count
+        self._bloom_bits = bits
+        self._bloom_hashes = hashes
+        bloom_offset = _DATA_OFFSET + 8 * count
+        bloom_end = bloom_offset + bits // 8
+        self._values = memoryview(self._mmap)[_DATA_OFFSET:bloom_offset].cast('Q')
+        self._bloom = memoryview(self._mmap)[bloom_offset:bloom_end]
+
+    @classmethod
+    def build(
+        cls,
+        path: Union[str, os.PathLike],
+        docs: Iterable[Union[str, D]],
+        bloom_false_positive_rate: Optional[float] = 0.01,
+        skip_invalid: bool = False,
+    ) -> int:
+        """
+        Build an index file from documents.
+
+        Document strings are normalized and validated with the sanitize rules of the document
+        type, with NumPy when it is installed. Duplicates are removed. The values are sorted
+        in memory, taking 8 bytes per document, and the file is written atomically.
+
+        :param path: The index file path.
+        :param docs: The document strings or document objects.
+        :param bloom_false_positive_rate: The target false positive rate of the Bloom filter,
+                                          or None to build no Bloom filter.
+        :param skip_invalid: Whether to skip invalid document strings instead of raising.
+        :return: The number of distinct indexed documents.
+        :raises ValueError: If a document string is invalid and skip_invalid is False, or the
+                            false positive rate is not between 0 and 1.
+        """
+        if bloom_false_positive_rate is not None and not 0 < bloom_false_positive_rate < 1:
+            raise ValueError('The false positive rate must be between 0 and 1.')
+
+        values = array('Q')
+        iterator = iter(docs)
+        while chunk := list(islice(iterator, _CHUNK_SIZE)):
+            values.extend(cls._to_values(chunk, skip_invalid))
+
+        values = cls._sorted_unique(values)
+        count = len(values)
+        bits, hashes = 0, 0
+        if bloom_false_positive_rate is not None:
+            bits, hashes = _bloom_size(count, bloom_false_positive_rate)
+
+        path = os.fspath(path)
+        fd, tmp_path = tempfile.mkstemp(
+            suffix='.tmp', prefix=f'.{os.path.basename(path)}.', dir=os.path.dirname(path) or '.'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                header = _HEADER.pack(_MAGIC, cls._engine.name.encode(), count, bits, hashes)
+                file.write(header.ljust(_DATA_OFFSET, b'\0'))
+                file.write(values.tobytes() if isinstance(values, array) else values)
+                if bits:
+                    file.write(cls._bloom_filter(values, bits, hashes))
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        return count
+
+    @classmethod
+    def _to_values(cls, docs: List[Union[str, D]], skip_invalid: bool) -> array:
+        """Validate a chunk of documents and get their integer values.
+
+        :param docs: The document strings or document objects.
+        :param skip_invalid: Whether to skip invalid document strings instead of raising.
+        :return: The integer values of the valid documents.
+        :raises ValueError: If a document string is invalid and skip_invalid is False.
+        """
+        docs = [d.plain if isinstance(d, cls.document_class) else d for d in docs]
+        to_values = _numpy_values if np is not None else _python_values
+        return to_values(docs, cls._engine, skip_invalid)
+
+    @staticmethod
+    def _sorted_unique(values: array) -> Union[array, bytes]:
+        """Sort and deduplicate integer values.
+
+        :param values: The integer values.
+        :return: The sorted distinct values, as an array or as native uint64 bytes.
+        """
+        if np is None:
+            return array('Q', sorted(set(values)))
+
+        data = np.frombuffer(values, dtype=np.uint64).copy()
+        data.sort()
+        if len(data):
+            data = data[np.concatenate(([True], data[1:] != data[:-1]))]
+        return data
+
+    @staticmethod
+    def _bloom_filter(values: Union[array, 'np.ndarray'], bits: int, hashes: int) -> bytes:
+        """Build the bit array of a Bloom filter.
+
+        :param values: The integer values.
+        :param bits: The number of bits.
+        :param hashes: The number of hash functions.
+        :return: The bit array.
+        """
+        if np is not None:
+            bloom = np.zeros(bits // 8, dtype=np.uint8)
+            values = np.asarray(values, dtype=np.uint64)
+            for start in range(0, len(values), _CHUNK_SIZE):
+                end = start + _CHUNK_SIZE
+                for position in _bloom_positions(values[start:end], bits, hashes):
+                    np.bitwise_or.at(bloom, position >> np.uint64(3), _BIT[position & np.uint64(7)])
+            return bloom.tobytes()
+
+        bloom = bytearray(bits // 8)
+        for value in values:
+            for position in _bloom_position_list(value, bits, hashes):
+                bloom[position >> 3] |= 1 << (position & 7)
+        return bytes(bloom)
+
+    def __contains__(self, doc: object) -> bool:
+        """Check whether a document is in the index.
+
+        :param doc: The document string or document object.
+        :return: True if the document is valid and indexed, False otherwise.
+        """
+        if isinstance(doc, self.document_class):
+            value = int(doc)
+        elif isinstance(doc, str):
+            plain = self._engine.parse(doc)
+            if isinstance(plain, InvalidReason):
+                return False
+            value = int(plain)
+        else:
+            return False
+
+        return self._has(value)
+
+    def _has(self, value: int) -> bool:
+        """Check whether an integer value is in the index.
+
+        :param value: The integer value of a document.
+        :return: True if the value is indexed, False otherwise.
+        """
+        bits = self._bloom_bits
+        if bits:
+            bloom = self._bloom
+            position = _mix(value)
+            step = _mix(value ^ _SEED) | 1
+            for _ in range(self._bloom_hashes):
+                bit = position % bits
+                if not bloom[bit >> 3] & (1 << (bit & 7)):
+                    return False
+                position = (position + step) & _MASK
+
+        values = self._values
+        index = bisect_left(values, value)
+        return index < self._count and values[index] == value
+
+    def contains_many(self, docs: Iterable[Union[str, D]]) -> List[bool]:
+        """Check whether many documents are in the index at once, with NumPy when installed.
+
+        :param docs: The document strings or document objects.
+        :return: Whether each document is valid and indexed, in the same order.
+        """
+        if np is None:
+            return [doc in self for doc in docs]
+
+        docs = [d.plain if isinstance(d, self.document_class) else d for d in docs]
+        if not docs:
+            return []
+
+        valid, plain = validate_many(docs, self._engine)
+        values = np.zeros(len(docs), dtype=np.uint64)
+        values[valid] = plain_to_ints(plain[valid], self._engine.size)
+        found = valid.copy()
+
+        if self._bloom_bits:
+            bloom = np.frombuffer(self._bloom, dtype=np.uint8)
+            for position in _bloom_positions(values, self._bloom_bits, self._bloom_hashes):
+                found &= (bloom[position >> np.uint64(3)] & _BIT[position & np.uint64(7)]) != 0
+
+        indexed = np.frombuffer(self._values, dtype=np.uint64)
+        candidates = np.flatnonzero(found)
+        positions = np.searchsorted(indexed, values[candidates])
+        hit = positions < self._count
+        hit[hit] = indexed[positions[hit]] == values[candidates[hit]]
+        found[candidates] = hit
+        return found.tolist()
+
+    def close(self) -> None:
+        """Release the memory map of the index file."""
+        if self._mmap.closed:
+            return
+
+        self._values.release()
+        self._bloom.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return self._count
+
+    def __enter__(self) -> 'DocumentIndex[D]':
+        """Use the index as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the index."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return the string representation of the index."""
+        bloom = f', bloom={self._bloom_bits} bits' if self._bloom_bits else ''
+        return f'{type(self).__name__}(<{self._count} documents>{bloom})'
+
+
+class CPFIndex(DocumentIndex[CPF]):
+    """Persistent memory-mapped index of CPF documents."""
+
+    document_class = CPF
+    _engine = CPF_ENGINE
+
+
+class CNPJIndex(DocumentIndex[CNPJ]):
+    """Persistent memory-mapped index of CNPJ documents."""
+
+    document_class = CNPJ
+    _engine = CNPJ_ENGINE
+
+
+def open_index(path: Union[str, os.PathLike]) -> DocumentIndex:
+    """Open an index file of any document type.
+
+    :param path: The index file path.
+    :return: The CPF or CNPJ index.
+    :raises ValueError: If the file is not a document index.
+    """
+    with open(path, 'rb') as file:
+        header = file.read(_HEADER.size)
+
+    if len(header) == _HEADER.size:
+        magic, kind, *_ = _HEADER.unpack(header)
+        for index_class in (CPFIndex, CNPJIndex):
+            if magic == _MAGIC and kind.rstrip(b'\0').decode() == index_class._engine.name:
+                return index_class(path)
+
+    raise ValueError(f'{os.fspath(path)!r} is not a document index.')
@@ -0,0 +1,449 @@
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from doc_br.types import CNPJ, CPF, Document
+from doc_br.types.check_digit import (
+    InvalidDocumentError,
+    InvalidReason,
+    ParseFailure,
+)
+
+DEFAULT_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2)
+"""Default upper bounds, in seconds, of the timing histogram buckets."""
+
+TIMED_METHODS = ('sanitize', 'validate', 'apply_mask', '_mask_valid')
+"""Document methods whose durations are recorded."""
+
+_METHOD_LABELS = {'_mask_valid': 'masked'}
+"""Label recorded for the timed methods not named after a public method."""
+
+_VALIDATING_METHODS = ('sanitize', 'validate', 'apply_mask')
+"""Timed methods counting the document strings they find valid."""
+
+Listener = Callable[[str, Dict[str, str], float], None]
+"""Callback receiving the metric name, its labels and the counted or observed value."""
+
+
+class HistogramSnapshot(NamedTuple):
+    """Statistics of a timing histogram."""
+
+    buckets: Tuple[float, ...]
+    """Upper bounds of the buckets, in seconds. The last, unbounded, bucket is implicit."""
+
+    counts: Tuple[int, ...]
+    """Number of observations in each bucket, the last one above all the bounds."""
+
+    count: int
+    """Total number of observations."""
+
+    sum: float
+    """Sum of the observed durations, in seconds."""
+
+
+class Histogram:
+    """
+    Histogram of durations with fixed buckets.
+
+    It is not thread-safe by itself, the registry serializes the observations.
+
+    Args:
+        buckets (Iterable[float]): Sorted upper bounds of the buckets, in seconds.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record a duration.
+
+        :param seconds: The duration, in seconds.
+        """
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Get the current statistics of the histogram.
+
+        :return: The histogram snapshot.
+        """
+        return HistogramSnapshot(self.buckets, tuple(self.counts), self.count, self.sum)
+
+
+class MetricsSnapshot(NamedTuple):
+    """Point-in-time copy of the metrics of a registry."""
+
+    constructed: Dict[str, int]
+    """Number of documents constructed, by document type."""
+
+    validated: Dict[str, int]
+    """Number of document strings found valid, by document type."""
+
+    rejected: Dict[Tuple[str, InvalidReason], int]
+    """Number of document strings rejected, by document type and reason."""
+
+    timings: Dict[Tuple[str, str], HistogramSnapshot]
+    """Duration histograms, by document type and method name."""
+
+
+class MetricsRegistry:
+    """
+    Collector of the document handling metrics.
+
+    It keeps counters of the documents constructed, validated and rejected, by document type
+    and rejection reason, and histograms of the durations of the sanitize, validate and
+    apply_mask methods and of the lazy masking of the masked property. Listeners are notified
+    of every recorded value, to export them to other metrics systems.
+
+    Args:
+        buckets (Iterable[float]): Upper bounds of the timing histogram buckets, in seconds.
+
+    Examples:
+        >>> registry = MetricsRegistry()
+        >>> registry.add_listener(lambda name, labels, value: print(name, labels, value))
+        >>> registry.count_rejected('CPF', InvalidReason.INVALID_LENGTH)
+        docbr_documents_rejected {'type': 'CPF', 'reason': 'INVALID_LENGTH'} 1
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._lock = Lock()
+        self._listeners: List[Listener] = []
+        self.reset()
+
+    def add_listener(self, listener: Listener) -> None:
+        """Register a callback notified of every recorded value.
+
+        Counter increments are notified with the value 1 and durations in seconds. Listeners
+        are called synchronously, so they should be fast.
+
+        :param listener: The callback, receiving the metric name, its labels and the value.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """Unregister a callback.
+
+        :param listener: The callback registered before.
+        :raises ValueError: If the callback is not registered.
+        """
+        self._listeners.remove(listener)
+
+    def count_constructed(self, document_type: str) -> None:
+        """Count a constructed document.
+
+        :param document_type: The name of the document type.
+        """
+        with self._lock:
+            self._constructed[document_type] = self._constructed.get(document_type, 0) + 1
+
+        self._notify('docbr_documents_constructed', {'type': document_type}, 1)
+
+    def count_validated(self, document_type: str) -> None:
+        """Count a document string found valid.
+
+        :param document_type: The name of the document type.
+        """
+        with self._lock:
+            self._validated[document_type] = self._validated.get(document_type, 0) + 1
+
+        self._notify('docbr_documents_validated', {'type': document_type}, 1)
+
+    def count_rejected(self, document_type: str, reason: InvalidReason) -> None:
+        """Count a rejected document string.
+
+        :param document_type: The name of the document type.
+        :param reason: The reason why the document string is invalid.
+        """
+        key = (document_type, reason)
+        with self._lock:
+            self._rejected[key] = self._rejected.get(key, 0) + 1
+
+        self._notify('docbr_documents_rejected', {'type': document_type, 'reason': reason.name}, 1)
+
+    def observe(self, document_type: str, method: str, seconds: float) -> None:
+        """Record the duration of a document method call.
+
+        :param document_type: The name of the document type.
+        :param method: The method name.
+        :param seconds: The duration, in seconds.
+        """
+        key = (document_type, method)
+        with self._lock:
+            histogram = self._timings.get(key)
+            if histogram is None:
+                histogram = self._timings[key] = Histogram(self._buckets)
+            histogram.observe(seconds)
+
+        self._notify(
+            'docbr_method_duration_seconds', {'type': document_type, 'method': method}, seconds
+        )
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get a copy of the current metrics.
+
+        :return: The metrics snapshot.
+        """
+        with self._lock:
+            return MetricsSnapshot(
+                dict(self._constructed),
+                dict(self._validated),
+                dict(self._rejected),
+                {key: histogram.snapshot() for key, histogram in self._timings.items()},
+            )
+
+    def reset(self) -> None:
+        """Reset all the counters and histograms, keeping the listeners."""
+        with self._lock:
+            self._constructed: Dict[str, int] = {}
+            self._validated: Dict[str, int] = {}
+            self._rejected: Dict[Tuple[str, InvalidReason], int] = {}
+            self._timings: Dict[Tuple[str, str], Histogram] = {}
+
+    def _notify(self, name: str, labels: Dict[str, str], value: float) -> None:
+        """Notify the listeners of a recorded value.
+
+        :param name: The metric name.
+        :param labels: The metric labels.
+        :param value: The counted or observed value.
+        """
+        for listener in self._listeners:
+            listener(name, labels, value)
+
+
+_registry: Optional[MetricsRegistry] = None
+"""The registry receiving the metrics while instrumentation is enabled."""
+
+_originals: Dict[Type[Document], Dict[str, Any]] = {}
+"""Original attributes of the instrumented document classes."""
+
+_state_lock = Lock()
+
+_calls = local()
+"""Per-thread nesting depth of the instrumented method calls."""
+
+
+def _timed(document_type: str, name: str, method: Callable) -> Callable:
+    """Wrap a validating document method to record its duration and outcome.
+
+    Every call records its duration, but only the outermost instrumented call counts the
+    document string as validated or rejected, so a method validating through another one,
+    as apply_mask does through sanitize, counts it once.
+
+    :param document_type: The name of the document type.
+    :param name: The method name recorded in the metrics.
+    :param method: The original method.
+    :return: The instrumented method.
+    """
+
+    @wraps(method)
+    def wrapper(self: Document, *args: Any, **kwargs: Any) -> Any:
+        depth = getattr(_calls, 'depth', 0)
+        _calls.depth = depth + 1
+        start = perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except InvalidDocumentError as e:
+            _record(document_type, name, perf_counter() - start, depth == 0, e.reason)
+            raise
+        finally:
+            _calls.depth = depth
+
+        _record(document_type, name, perf_counter() - start, depth == 0, None)
+        return result
+
+    return wrapper
+
+
+def _record(
+    document_type: str,
+    name: str,
+    seconds: float,
+    outermost: bool,
+    reason: Optional[InvalidReason],
+) -> None:
+    """Record the duration and outcome of an instrumented method call.
+
+    :param document_type: The name of the document type.
+    :param name: The method name recorded in the metrics.
+    :param seconds: The duration of the call, in seconds.
+    :param outermost: Whether the call was not made by another instrumented method.
+    :param reason: The reason why the document string was rejected, or None if it was not.
+    """
+    registry = _registry
+    if registry is None:
+        return
+
+    registry.observe(document_type, name, seconds)
+    if not outermost:
+        return
+
+    if reason is not None:
+        registry.count_rejected(document_type, reason)
+    elif name in _VALIDATING_METHODS:
+        registry.count_validated(document_type)
+
+
+def _counted_init(document_type: str, init: Callable) -> Callable:
+    """Wrap a document constructor to count the constructed documents.
+
+    :param document_type: The name of the document type.
+    :param init: The original constructor.
+    :return: The instrumented constructor.
+    """
+
+    @wraps(init)
+    def wrapper(self: Document, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+        registry = _registry
+        if registry is not None:
+            registry.count_constructed(document_type)
+
+    return wrapper
+
+
+def _counted_try_parse(document_type: str, try_parse: Callable) -> classmethod:
+    """Wrap the try_parse class method to count the valid and rejected document strings.
+
+    :param document_type: The name of the document type.
+    :param try_parse: The original function of the class method.
+    :return: The instrumented class method.
+    """
+
+    @wraps(try_parse)
+    def wrapper(cls: Type[Document], doc: str) -> Any:
+        result = try_parse(cls, doc)
+        registry = _registry
+        if registry is None:
+            return result
+
+        if isinstance(result, ParseFailure):
+            registry.count_rejected(document_type, result.reason)
+        else:
+            registry.count_validated(document_type)
+        return result
+
+    return classmethod(wrapper)
+
+
+def _instrument(document_class: Type[Document]) -> None:
+    """Replace the methods of a document class by instrumented ones.
+
+    :param document_class: The document class.
+    """
+    document_type = document_class.__name__
+    attributes = vars(document_class)
+    _originals[document_class] = originals = {}
+
+    for name in TIMED_METHODS + ('__init__', 'try_parse'):
+        if name in attributes:
+            originals[name] = attributes[name]
+
+    for name in TIMED_METHODS:
+        label = _METHOD_LABELS.get(name, name)
+        setattr(document_class, name, _timed(document_type, label, getattr(document_class, name)))
+
+    document_class.__init__ = _counted_init(document_type, document_class.__init__)
+
+    if 'try_parse' in originals:
+        document_class.try_parse = _counted_try_parse(
+            document_type, originals['try_parse'].__func__
+        )
+
+
+def _uninstrument(document_class: Type[Document]) -> None:
+    """Restore the original methods of a document class.
+
+    :param document_class: The document class.
+    """
+    originals = _originals.pop(document_class)
+    for name in TIMED_METHODS + ('__init__', 'try_parse'):
+        if name in originals:
+            setattr(document_class, name, originals[name])
+        elif name in vars(document_class):
+            delattr(document_class, name)
+
+
+def enable(
+    registry: Optional[MetricsRegistry] = None,
+    document_classes: Iterable[Type[Document]] = (CPF, CNPJ),
+) -> MetricsRegistry:
+    """
+    Start recording the document handling metrics.
+
+    The methods of the document classes are replaced by instrumented ones, so disabled
+    instrumentation costs nothing. Only the calls going through those methods are recorded:
+    the constructors, try_parse, sanitize, validate, apply_mask and the lazy masking of the
+    masked property, recorded as 'masked'.
+
+    Documents built without validation, as by from_trusted, are not counted, and neither are
+    the document strings validated directly by the check-digit engines: the NumPy batch
+    validation, :mod:`doc_br.stream`, :func:`doc_br.types.detect.parse_document` and its
+    variants, and the pydantic integration.
+
+    Examples:
+        >>> registry = enable()
+        >>> CPF('529.982.247-25').masked
+        '529.982.247-25'
+        >>> registry.snapshot().constructed
+        {'CPF': 1}
+        >>> disable()
+
+    :param registry: The registry receiving the metrics. A new one is created if omitted.
+    :param document_classes: The document classes to be instrumented.
+    :return: The registry receiving the metrics.
+    """
+    global _registry
+
+    with _state_lock:
+        _registry = registry or _registry or MetricsRegistry()
+        for document_class in document_classes:
+            if document_class not in _originals:
+                _instrument(document_class)
+
+        return _registry
+
+
+def disable() -> None:
+    """Stop recording metrics, restoring the original methods of the document classes.
+
+    The registry keeps the metrics recorded so far.
+    """
+    global _registry
+
+    with _state_lock:
+        for document_class in list(_originals):
+            _uninstrument(document_class)
+        _registry = None
+
+
+def is_enabled() -> bool:
+    """Check whether the metrics are being recorded.
+
+    :return: True if the instrumentation is enabled, False otherwise.
+    """
+    return _registry is not None
+
+
+def get_registry() -> Optional[MetricsRegistry]:
+    """Get the registry receiving the metrics.
+
+    :return: The registry, or None if the instrumentation is disabled.
+    """
+    return _registry
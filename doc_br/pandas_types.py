@@ -0,0 +1,603 @@
+"""
+pandas extension types for CPF and CNPJ documents.
+
+Importing this module registers the 'cpf' and 'cnpj' dtypes and the ``.docbr`` Series accessor.
+
+Examples:
+    >>> import pandas as pd
+    >>> import doc_br.pandas_types  # noqa: F401
+    >>> cpfs = pd.Series(['529.982.247-25', '337231923'], dtype='cpf')
+    >>> cpfs.docbr.masked().tolist()
+    ['529.982.247-25', '003.372.319-23']
+    >>> pd.Series(['529.982.247-25', '11.222.333/0001-81', 'x']).docbr.kind().tolist()
+    ['cpf', 'cnpj', <NA>]
+"""
+from typing import Any, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+)
+from pandas.api.indexers import check_array_indexer
+
+from doc_br.batch import (
+    DIGIT_ZERO,
+    classify_many,
+    invalid_error,
+    plain_to_ints,
+    valid_digits,
+    validate_many,
+)
+from doc_br.types import CNPJ, CPF, Document
+from doc_br.types.check_digit import (
+    CNPJ_ENGINE,
+    CPF_ENGINE,
+    CheckDigitEngine,
+    InvalidReason,
+)
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+class DocumentDtype(ExtensionDtype):
+    """
+    Base pandas dtype of documents stored as 64-bit unsigned integers.
+
+    Missing values are stored as 0, which is never a valid document.
+    """
+
+    document_class: Type[Document]
+    """The document class of the scalars."""
+
+    _engine: CheckDigitEngine
+    """The check-digit engine of the document type."""
+
+    na_value = pd.NA
+
+    @property
+    def type(self) -> Type[Document]:
+        """Get the scalar type of the dtype."""
+        return self.document_class
+
+    @classmethod
+    def construct_array_type(cls) -> Type['DocumentExtensionArray']:
+        """Get the array type of the dtype.
+
+        :return: The document extension array class.
+        """
+        return DocumentExtensionArray
+
+    def __from_arrow__(
+        self, array: Union['pa.Array', 'pa.ChunkedArray']
+    ) -> 'DocumentExtensionArray':
+        """Build a document array from an Arrow array of integers or strings.
+
+        Arrays of 64-bit integers without nulls are used without copying, as the validated
+        values are only reinterpreted as unsigned. Other integer arrays are converted to
+        uint64, and string arrays are parsed.
+
+        :param array: The Arrow array or chunked array.
+        :return: The document extension array.
+        :raises ValueError: If a value is not a valid document.
+        """
+        chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+        arrays = []
+
+        for chunk in chunks:
+            if pa.types.is_integer(chunk.type):
+                if chunk.null_count:
+                    chunk = chunk.fill_null(0)
+                values = chunk.to_numpy(zero_copy_only=False)
+                arrays.append(DocumentExtensionArray(_check_values(values, self), self))
+            else:
+                values = chunk.to_numpy(zero_copy_only=False)
+                arrays.append(DocumentExtensionArray._from_sequence(values, dtype=self))
+
+        if not arrays:
+            return DocumentExtensionArray(np.zeros(0, dtype=np.uint64), self)
+
+        if len(arrays) == 1:
+            return arrays[0]
+
+        return DocumentExtensionArray._concat_same_type(arrays)
+
+
+@register_extension_dtype
+class CPFDtype(DocumentDtype):
+    """pandas dtype of CPF documents, named 'cpf'."""
+
+    name = 'cpf'
+    document_class = CPF
+    _engine = CPF_ENGINE
+
+
+@register_extension_dtype
+class CNPJDtype(DocumentDtype):
+    """pandas dtype of CNPJ documents, named 'cnpj'."""
+
+    name = 'cnpj'
+    document_class = CNPJ
+    _engine = CNPJ_ENGINE
+
+
+_DTYPES = {
+    'cpf': CPFDtype(),
+    'cnpj': CNPJDtype(),
+}
+"""Dtype of each supported document kind."""
+
+
+def _check_values(values: np.ndarray, dtype: DocumentDtype) -> np.ndarray:
+    """Ensure an array of integers only holds valid documents or missing values (0).
+
+    :param values: The integer values.
+    :param dtype: The document dtype.
+    :return: The values as uint64, without a copy if they are 64-bit integers.
+    :raises ValueError: If a value is not a valid document.
+    """
+    engine = dtype._engine
+    if values.dtype.kind == 'i' and (values < 0).any():
+        raise engine.error(InvalidReason.INVALID_CHARACTER)
+
+    if values.dtype.itemsize == 8:
+        values = values.view(np.uint64)
+    else:
+        values = values.astype(np.uint64)
+
+    present = values != 0
+    valid = _valid_ints(values[present], engine)
+    if not valid.all():
+        invalid = int(values[present][np.argmin(valid)])
+        if invalid >= 10**engine.size:
+            raise engine.error(InvalidReason.INVALID_LENGTH)
+        raise invalid_error(str(invalid), engine)
+
+    return values
+
+
+def _valid_ints(values: np.ndarray, engine: CheckDigitEngine) -> np.ndarray:
+    """Check the integer values of documents.
+
+    :param values: The uint64 values.
+    :param engine: The check-digit engine of the document type.
+    :return: The boolean validity mask.
+    """
+    valid = values < np.uint64(10**engine.size)
+    return valid & valid_digits(_digits(values, engine.size).astype(np.int64), engine)
+
+
+def _digits(values: np.ndarray, size: int) -> np.ndarray:
+    """Split integer values into a matrix of digits.
+
+    :param values: The uint64 values.
+    :param size: The number of digits.
+    :return: The (rows, size) uint64 digit matrix.
+    """
+    powers = 10 ** np.arange(size - 1, -1, -1, dtype=np.uint64)
+    return values[:, None] // powers % np.uint64(10)
+
+
+def _to_strings(values: np.ndarray, engine: CheckDigitEngine, masked: bool) -> np.ndarray:
+    """Format integer values of valid documents as plain or masked strings.
+
+    :param values: The uint64 values.
+    :param engine: The check-digit engine of the document type.
+    :param masked: Whether to apply the mask.
+    :return: The NumPy unicode array of document strings.
+    """
+    codes = (_digits(values, engine.size) + np.uint64(DIGIT_ZERO)).astype(np.uint32)
+
+    if masked:
+        template = np.frombuffer(
+            engine.mask('0' * engine.size).encode('utf-32-le'), dtype=np.uint32
+        )
+        masked_codes = np.tile(template, (len(values), 1))
+        masked_codes[:, template == DIGIT_ZERO] = codes
+        codes = masked_codes
+
+    codes = np.ascontiguousarray(codes)
+    return codes.view(f'U{codes.shape[1]}').ravel()
+
+
+def _to_values(scalars: Any, dtype: DocumentDtype) -> np.ndarray:
+    """Validate documents given as strings, integers or document objects.
+
+    The values never share memory with the scalars, so they cannot be changed afterwards
+    without validation.
+
+    :param scalars: The documents. Missing values are accepted.
+    :param dtype: The document dtype.
+    :return: The uint64 values, 0 for missing values.
+    :raises ValueError: If a document is invalid.
+    :raises TypeError: If a scalar is not a supported document representation.
+    """
+    if isinstance(scalars, DocumentExtensionArray):
+        if scalars.dtype != dtype:
+            raise TypeError(f'Cannot convert {scalars.dtype} documents to {dtype}.')
+        return scalars._data.copy()
+
+    if not isinstance(scalars, np.ndarray):
+        scalars = np.array(list(scalars), dtype=object)
+
+    if scalars.dtype.kind in 'iu':
+        values = _check_values(scalars, dtype)
+        return values.copy() if np.shares_memory(values, scalars) else values
+
+    return _objects_to_values(scalars.astype(object, copy=False), dtype)
+
+
+def _objects_to_values(scalars: np.ndarray, dtype: DocumentDtype) -> np.ndarray:
+    """Validate documents given as an object array of strings, integers or document objects.
+
+    :param scalars: The documents. Missing values are accepted.
+    :param dtype: The document dtype.
+    :return: The uint64 values, 0 for missing values.
+    :raises ValueError: If a document is invalid.
+    :raises TypeError: If a scalar is not a supported document representation.
+    """
+    values = np.zeros(len(scalars), dtype=np.uint64)
+    missing = pd.isna(scalars)
+
+    is_str = np.fromiter((isinstance(s, str) for s in scalars), dtype=bool, count=len(scalars))
+    if is_str.any():
+        values[is_str] = _strings_to_values(scalars[is_str], dtype._engine)
+
+    for i in np.flatnonzero(~is_str & ~missing):
+        values[i] = _scalar_to_value(scalars[i], dtype)
+
+    return values
+
+
+def _strings_to_values(docs: np.ndarray, engine: CheckDigitEngine) -> np.ndarray:
+    """Validate document strings at once.
+
+    :param docs: The document strings, masked or not.
+    :param engine: The check-digit engine of the document type.
+    :return: The uint64 values.
+    :raises InvalidDocumentError: If a document string is invalid.
+    """
+    valid, plain = validate_many(docs, engine)
+    if not valid.all():
+        raise invalid_error(docs[np.argmin(valid)], engine)
+
+    return plain_to_ints(plain, engine.size)
+
+
+def _scalar_to_value(scalar: Any, dtype: DocumentDtype) -> int:
+    """Validate a document given as a document object or an integer.
+
+    :param scalar: The document.
+    :param dtype: The document dtype.
+    :return: The integer value.
+    :raises ValueError: If the document is invalid.
+    :raises TypeError: If the scalar is not a supported document representation.
+    """
+    if isinstance(scalar, dtype.document_class):
+        return int(scalar)
+
+    if isinstance(scalar, (int, np.integer)) and not isinstance(scalar, bool):
+        return _check_values(np.array([scalar]), dtype)[0]
+
+    raise TypeError(f'Cannot convert {type(scalar).__name__} to a {dtype._engine.name}.')
+
+
+class DocumentExtensionArray(ExtensionArray):
+    """
+    pandas extension array of documents stored as 64-bit unsigned integers.
+
+    Each document takes 8 bytes and document objects are only built when accessing scalars.
+    Missing values are stored as 0.
+
+    Args:
+        values (numpy.ndarray): The uint64 values of valid documents, already validated.
+        dtype (DocumentDtype): The document dtype.
+    """
+
+    def __init__(self, values: np.ndarray, dtype: DocumentDtype):
+        self._data = values
+        self._dtype = dtype
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars: Any, *, dtype: Optional[Any] = None, copy: bool = False
+    ) -> 'DocumentExtensionArray':
+        """Build an array from document strings, integers or document objects.
+
+        :param scalars: The documents.
+        :param dtype: The document dtype, or its name.
+        :param copy: Unused, the values are always converted.
+        :return: The document extension array.
+        :raises ValueError: If a document is invalid.
+        """
+        dtype = pd.api.types.pandas_dtype(dtype) if dtype is not None else None
+        if not isinstance(dtype, DocumentDtype):
+            if not isinstance(scalars, DocumentExtensionArray):
+                raise TypeError('A document dtype is required.')
+            dtype = scalars.dtype
+
+        return cls(_to_values(scalars, dtype), dtype)
+
+    @classmethod
+    def _from_factorized(
+        cls, values: np.ndarray, original: 'DocumentExtensionArray'
+    ) -> 'DocumentExtensionArray':
+        """Build an array from the factorized values of another one."""
+        return cls(values.astype(np.uint64), original.dtype)
+
+    @classmethod
+    def _concat_same_type(
+        cls, to_concat: Sequence['DocumentExtensionArray']
+    ) -> 'DocumentExtensionArray':
+        """Concatenate arrays of the same dtype."""
+        return cls(np.concatenate([array._data for array in to_concat]), to_concat[0].dtype)
+
+    @property
+    def dtype(self) -> DocumentDtype:
+        """Get the document dtype."""
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        """Get the number of bytes used by the values."""
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return len(self._data)
+
+    def __getitem__(self, item: Any) -> Any:
+        """Get a document, or a new array for slices and indexer arrays."""
+        if isinstance(item, (int, np.integer)):
+            value = int(self._data[item])
+            return self._dtype.document_class._from_int(value) if value else pd.NA
+
+        if isinstance(item, slice):
+            result = type(self)(self._data[item], self._dtype)
+            # pandas 3 flags the arrays of read-only views, earlier versions have no such flag.
+            result._readonly = getattr(self, '_readonly', False)
+            return result
+
+        return type(self)(self._data[check_array_indexer(self, item)], self._dtype)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Validate and set documents."""
+        if getattr(self, '_readonly', False):
+            raise ValueError('Cannot modify read-only array')
+
+        if not self._data.flags.writeable:
+            self._data = self._data.copy()
+
+        key = check_array_indexer(self, key)
+        if pd.api.types.is_scalar(value) or isinstance(value, Document):
+            self._data[key] = _to_values([value], self._dtype)[0]
+        else:
+            self._data[key] = _to_values(value, self._dtype)
+
+    def __eq__(self, other: Any) -> Any:
+        """Compare element-wise with a document, a document string or another array."""
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+
+        if pd.api.types.is_list_like(other):
+            if len(other) != len(self):
+                raise ValueError('Lengths must match to compare.')
+            other = self._comparable(other)
+        else:
+            other = self._comparable([other])[0]
+
+        result = pd.array(self._data == other, dtype='boolean')
+        result[self.isna() | (np.asarray(other) == 0)] = pd.NA
+        return result
+
+    def _comparable(self, other: Any) -> np.ndarray:
+        """Convert the operand of a comparison to values, invalid documents being never equal.
+
+        :param other: The documents.
+        :return: The uint64 values, with 0 for missing values and an impossible value for
+                 invalid documents.
+        """
+        try:
+            return _to_values(other, self._dtype)
+        except (TypeError, ValueError):
+            values = []
+            for scalar in other:
+                try:
+                    values.append(_to_values([scalar], self._dtype)[0])
+                except (TypeError, ValueError):
+                    values.append(np.iinfo(np.uint64).max)
+            return np.array(values, dtype=np.uint64)
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        """Convert to a NumPy object array of documents, or of plain strings for str dtypes.
+
+        Only conversions to uint64 may avoid a copy.
+        """
+        dtype = np.dtype(dtype) if dtype is not None else None
+        if dtype == np.uint64 and not copy:
+            return self._data
+
+        if copy is False:
+            raise ValueError('Unable to avoid a copy while converting documents.')
+
+        if dtype is not None and dtype.kind == 'U':
+            return self.plain()
+
+        if dtype is not None and dtype.kind in 'iuf':
+            return self._data.astype(dtype)
+
+        return np.array(list(self), dtype=object)
+
+    def __arrow_array__(self, type: Optional['pa.DataType'] = None) -> 'pa.Array':
+        """Convert to an Arrow uint64 array, sharing the values without copying them.
+
+        Only the validity bitmap of the missing values is built.
+
+        :param type: The requested Arrow type, ignored.
+        :return: The Arrow array, with nulls for missing values.
+        """
+        missing = self.isna()
+        return pa.array(self._data, type=pa.uint64(), mask=missing if missing.any() else None)
+
+    def isna(self) -> np.ndarray:
+        """Get the boolean mask of the missing values."""
+        return self._data == 0
+
+    def take(
+        self, indices: Sequence[int], allow_fill: bool = False, fill_value: Any = None
+    ) -> 'DocumentExtensionArray':
+        """Take documents by position, -1 meaning a missing value when allow_fill is True."""
+        from pandas.api.extensions import take
+
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill_value = _to_values([fill_value], self._dtype)[0]
+        else:
+            fill_value = 0
+
+        values = take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value)
+        return type(self)(values.astype(np.uint64, copy=False), self._dtype)
+
+    def copy(self) -> 'DocumentExtensionArray':
+        """Copy the array."""
+        return type(self)(self._data.copy(), self._dtype)
+
+    def _values_for_factorize(self) -> Tuple[np.ndarray, int]:
+        """Get the values used to factorize the array, 0 marking missing values."""
+        return self._data, 0
+
+    def _values_for_argsort(self) -> np.ndarray:
+        """Get the values used to sort the array."""
+        return self._data
+
+    def plain(self) -> np.ndarray:
+        """Get the plain document strings, empty for missing values.
+
+        :return: The NumPy unicode array.
+        """
+        return np.where(self.isna(), '', _to_strings(self._data, self._dtype._engine, False))
+
+    def masked(self) -> np.ndarray:
+        """Get the masked document strings, empty for missing values.
+
+        :return: The NumPy unicode array.
+        """
+        return np.where(self.isna(), '', _to_strings(self._data, self._dtype._engine, True))
+
+
+@register_series_accessor('docbr')
+class DocumentAccessor:
+    """
+    Vectorized document operations on pandas Series, available as ``series.docbr``.
+
+    Series of the 'cpf' and 'cnpj' dtypes hold valid documents only. Series of strings are
+    validated at once with NumPy. Without an explicit kind, each string is classified like
+    :func:`doc_br.types.detect.detect_document_class` does, as a CNPJ if it has a slash or more
+    than 11 digits and as a CPF otherwise, and is validated as that kind only.
+
+    Args:
+        series (pandas.Series): The Series of documents or document strings.
+    """
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+
+    def is_valid(self, kind: Optional[str] = None) -> pd.Series:
+        """Check whether each value is a valid document.
+
+        :param kind: The document kind, 'cpf' or 'cnpj'. If None, any of them.
+        :return: A boolean Series, False for missing values.
+        :raises ValueError: If the document kind is not supported.
+        """
+        return self._result(self._parse(kind)[0] != '', dtype=bool)
+
+    def plain(self, kind: Optional[str] = None) -> pd.Series:
+        """Get the plain document strings.
+
+        :param kind: The document kind, 'cpf' or 'cnpj'. If None, any of them.
+        :return: A string Series, with missing values for invalid documents.
+        :raises ValueError: If the document kind is not supported.
+        """
+        return self._strings(kind, masked=False)
+
+    def masked(self, kind: Optional[str] = None) -> pd.Series:
+        """Get the masked document strings.
+
+        :param kind: The document kind, 'cpf' or 'cnpj'. If None, any of them.
+        :return: A string Series, with missing values for invalid documents.
+        :raises ValueError: If the document kind is not supported.
+        """
+        return self._strings(kind, masked=True)
+
+    def kind(self) -> pd.Series:
+        """Get the kind of each document, 'cpf' or 'cnpj'.
+
+        :return: A string Series, with missing values for invalid documents.
+        """
+        kinds = self._parse(None)[0]
+        return self._result(np.where(kinds == '', None, kinds), dtype='string')
+
+    def _strings(self, kind: Optional[str], masked: bool) -> pd.Series:
+        """Format the valid documents as plain or masked strings.
+
+        :param kind: The document kind, or None for any of them.
+        :param masked: Whether to apply the mask.
+        :return: A string Series, with missing values for invalid documents.
+        """
+        kinds, values = self._parse(kind)
+        strings = np.full(len(values), None, dtype=object)
+
+        for name, dtype in _DTYPES.items():
+            is_kind = kinds == name
+            if is_kind.any():
+                strings[is_kind] = _to_strings(values[is_kind], dtype._engine, masked)
+
+        return self._result(strings, dtype='string')
+
+    def _parse(self, kind: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the kind and the integer value of each valid document.
+
+        :param kind: The document kind, or None for any of them.
+        :return: The kinds, empty for invalid documents, and the uint64 values.
+        :raises ValueError: If the document kind is not supported.
+        """
+        if kind is not None and kind.lower() not in _DTYPES:
+            raise ValueError(f'Unsupported document kind: {kind!r}.')
+
+        series_dtype = self._series.dtype
+        if isinstance(series_dtype, DocumentDtype):
+            values = self._series.array._data
+            valid = (values != 0) & (kind is None or series_dtype.name == kind.lower())
+            return np.where(valid, series_dtype.name, ''), values
+
+        docs = self._series.to_numpy(dtype=object, na_value=None)
+        if kind is not None:
+            selections = [(_DTYPES[kind.lower()], np.ones(len(docs), dtype=bool))]
+        else:
+            is_cnpj = classify_many(docs, CPF_ENGINE.size)
+            selections = [(_DTYPES['cpf'], ~is_cnpj), (_DTYPES['cnpj'], is_cnpj)]
+
+        kinds = np.full(len(docs), '', dtype='U4')
+        values = np.zeros(len(docs), dtype=np.uint64)
+        for dtype, selected in selections:
+            indexes = np.flatnonzero(selected)
+            valid, plain = validate_many(docs[indexes], dtype._engine)
+            found = indexes[valid]
+            kinds[found] = dtype.name
+            values[found] = plain_to_ints(plain[valid], dtype._engine.size)
+
+        return kinds, values
+
+    def _result(self, values: Any, dtype: Any) -> pd.Series:
+        """Wrap the results in a Series aligned with the accessed one.
+
+        :param values: The result values.
+        :param dtype: The result dtype.
+        :return: The Series.
+        """
+        return pd.Series(values, index=self._series.index, name=self._series.name, dtype=dtype)
@@ -0,0 +1,157 @@
+"""
+pydantic v2 integration of CPF and CNPJ documents.
+
+Document classes can be used directly as pydantic field types. The shape and length of input
+strings are checked by pydantic-core, then the check digits are validated once, without going
+through the document constructor. Documents are serialized to JSON as plain strings, or as
+masked strings when annotated with ``SerializeAs('masked')``.
+
+Examples:
+    >>> from typing import Annotated
+    >>> from pydantic import BaseModel
+    >>> from doc_br.types import CNPJ, CPF
+    >>> class Customer(BaseModel):
+    ...     cpf: CPF
+    ...     cnpj: Annotated[CNPJ, SerializeAs('masked')]
+    >>> customer = Customer(cpf='529.982.247-25', cnpj='11222333000181')
+    >>> customer.model_dump_json()
+    '{"cpf":"52998224725","cnpj":"11.222.333/0001-81"}'
+"""
+import re
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Tuple, Type
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from doc_br.types import Document
+from doc_br.types.check_digit import CheckDigitEngine, InvalidReason
+from doc_br.types.detect import ENGINES
+
+_FORMATS = ('plain', 'masked')
+"""Supported serialization formats."""
+
+
+class SerializeAs:
+    """
+    Annotation choosing the JSON serialization format of a document field.
+
+    Args:
+        format (str): 'plain' or 'masked'.
+
+    Raises:
+        ValueError: If the format is not supported.
+
+    Examples:
+        >>> from typing import Annotated
+        >>> from doc_br.types import CPF
+        >>> MaskedCPF = Annotated[CPF, SerializeAs('masked')]
+    """
+
+    __slots__ = ('format',)
+
+    def __init__(self, format: str):
+        if format not in _FORMATS:
+            raise ValueError(f'Unsupported serialization format: {format!r}.')
+
+        self.format = format
+
+    def __get_pydantic_core_schema__(
+        self, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Get the core schema of the annotated document class.
+
+        :param source_type: The annotated document class.
+        :param handler: The pydantic schema handler.
+        :return: The core schema.
+        :raises TypeError: If the annotated type is not a CPF or CNPJ class.
+        """
+        return document_core_schema(source_type, self.format)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the annotation."""
+        return f'SerializeAs({self.format!r})'
+
+
+def _engine_of(document_class: Type[Document]) -> CheckDigitEngine:
+    """Get the check-digit engine of a document class or of its document base class.
+
+    :param document_class: The document class.
+    :return: The check-digit engine.
+    :raises TypeError: If the class is not a CPF or CNPJ class.
+    """
+    for base in getattr(document_class, '__mro__', ()):
+        if base in ENGINES:
+            return ENGINES[base]
+
+    raise TypeError(f'{document_class!r} is not a CPF or CNPJ class.')
+
+
+@lru_cache(maxsize=None)
+def _validators(document_class: Type[Document]) -> Tuple[Callable[..., Any], ...]:
+    """Build the validation functions of a document class, once per class.
+
+    :param document_class: The document class.
+    :return: The function validating a string of the right shape and the wrap function
+             accepting document objects as they are.
+    """
+    engine = _engine_of(document_class)
+    parse = engine.parse
+    from_plain = document_class._from_plain
+
+    def validate_str(value: str) -> Document:
+        plain = parse(value)
+        if isinstance(plain, InvalidReason):
+            raise engine.error(plain)
+
+        return from_plain(plain)
+
+    def validate_python(value: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
+        if isinstance(value, document_class):
+            return value
+
+        return handler(value)
+
+    return validate_str, validate_python
+
+
+def document_core_schema(
+    document_class: Type[Document], format: str = 'plain'
+) -> core_schema.CoreSchema:
+    """
+    Build the pydantic core schema of a CPF or CNPJ class.
+
+    Strings are checked by pydantic-core to have only digits and mask characters and at most
+    the length of a masked document, so only well-formed strings reach the Python check-digit
+    validation. In Python mode, document objects of the class are accepted as they are.
+
+    :param document_class: The CPF or CNPJ class, or one of their subclasses.
+    :param format: The JSON serialization format, 'plain' or 'masked'.
+    :return: The core schema.
+    :raises TypeError: If the class is not a CPF or CNPJ class.
+    :raises ValueError: If the format is not supported.
+    """
+    if format not in _FORMATS:
+        raise ValueError(f'Unsupported serialization format: {format!r}.')
+
+    engine = _engine_of(document_class)
+    validate_str, validate_python = _validators(document_class)
+
+    from_str = core_schema.chain_schema(
+        [
+            core_schema.str_schema(
+                pattern=f'^[0-9{re.escape(engine.mask_characters)}]+$',
+                max_length=len(engine.mask('0' * engine.size)),
+            ),
+            core_schema.no_info_plain_validator_function(validate_str),
+        ]
+    )
+
+    return core_schema.json_or_python_schema(
+        json_schema=from_str,
+        python_schema=core_schema.no_info_wrap_validator_function(validate_python, from_str),
+        serialization=core_schema.plain_serializer_function_ser_schema(
+            attrgetter(format), when_used='json-unless-none'
+        ),
+    )
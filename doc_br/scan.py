@@ -0,0 +1,303 @@
+import mmap
+import os
+import re
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from doc_br.batch import DIGIT_ZERO, valid_digits
+from doc_br.types import CNPJ, CPF, Document
+from doc_br.types.check_digit import CNPJ_ENGINE, CPF_ENGINE, CheckDigitEngine
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_PATTERN = (
+    r'(?<![0-9])(?:'
+    r'(?P<cnpj>[0-9]{2}\.[0-9]{3}\.[0-9]{3}/[0-9]{4}-[0-9]{2})'
+    r'|(?P<cpf>[0-9]{3}\.[0-9]{3}\.[0-9]{3}-[0-9]{2})'
+    r'|(?P<plain>[0-9]{11}(?:[0-9]{3})?)'
+    r')(?![0-9])'
+)
+"""Masked CPF and CNPJ documents, and runs of exactly 11 or 14 digits."""
+
+_TEXT_PATTERN = re.compile(_PATTERN)
+_BYTES_PATTERN = re.compile(_PATTERN.encode('ascii'))
+
+_MAX_MATCH_SIZE = 18
+"""Length of the longest candidate, a masked CNPJ."""
+
+_KINDS = {
+    'cpf': (CPF_ENGINE, CPF),
+    'cnpj': (CNPJ_ENGINE, CNPJ),
+}
+"""Check-digit engine and document class of each supported document kind."""
+
+_MASK_CHARACTERS = b'./-'
+"""Mask characters of both document kinds."""
+
+_BATCH_SIZE = 4096
+"""Number of candidates validated at once."""
+
+_CHUNK_SIZE = 1 << 20
+"""Number of bytes or characters read at once from file objects."""
+
+
+class DocumentMatch(NamedTuple):
+    """A valid document found in a text."""
+
+    kind: str
+    """The document kind, 'cpf' or 'cnpj'."""
+
+    start: int
+    """Offset of the first character of the document. Offsets are in bytes for binary
+    sources and in characters for text sources."""
+
+    end: int
+    """Offset after the last character of the document."""
+
+    text: str
+    """The document as found in the text, masked or not."""
+
+    plain: str
+    """The plain document string."""
+
+    @property
+    def masked(self) -> bool:
+        """Whether the document was found masked."""
+        return len(self.text) != len(self.plain)
+
+    @property
+    def document(self) -> Document:
+        """Build the CPF or CNPJ object of the document."""
+        return _KINDS[self.kind][1].from_trusted(self.plain)
+
+
+class _Scanner:
+    """
+    Finder of valid documents in str or bytes buffers.
+
+    Candidates are validated in batches, at once with NumPy when it is installed.
+
+    Args:
+        kinds (Iterable[str]): The document kinds to be found.
+        binary (bool): Whether the buffers are bytes instead of str.
+    """
+
+    def __init__(self, kinds: Iterable[str], binary: bool):
+        kinds = {kind.lower() for kind in kinds}
+        unsupported = kinds - _KINDS.keys()
+        if unsupported:
+            raise ValueError(f'Unsupported document kind: {sorted(unsupported)[0]!r}.')
+
+        self.kinds = kinds
+        self.binary = binary
+        self.pattern = _BYTES_PATTERN if binary else _TEXT_PATTERN
+
+    def scan(self, buffer: Any) -> Iterator[DocumentMatch]:
+        """Find the valid documents of a whole buffer.
+
+        :param buffer: The str, bytes or memory mapped buffer.
+        :return: An iterator over the document matches.
+        """
+        candidates = (self._candidate(match, 0) for match in self.pattern.finditer(buffer))
+        return self._validate(candidates)
+
+    def scan_chunks(self, chunks: Iterable[Any]) -> Iterator[DocumentMatch]:
+        """Find the valid documents of a stream of chunks, including the ones across chunks.
+
+        :param chunks: The str or bytes chunks, in order.
+        :return: An iterator over the document matches.
+        """
+        return self._validate(self._chunk_candidates(chunks))
+
+    def _chunk_candidates(self, chunks: Iterable[Any]) -> Iterator[Optional[tuple]]:
+        """Find the candidates of a stream of chunks.
+
+        Candidates ending at the end of a chunk are deferred to the next one, and the tail of
+        each chunk that may hold the start of a candidate is kept before the next chunk.
+
+        :param chunks: The str or bytes chunks, in order.
+        :return: An iterator over the candidates.
+        """
+        buffer = b'' if self.binary else ''
+        offset = 0
+        pos = 0
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            buffer += chunk
+            resume = max(pos, len(buffer) - _MAX_MATCH_SIZE)
+            for match in self.pattern.finditer(buffer, pos):
+                if match.end() == len(buffer):
+                    resume = min(resume, match.start())
+                    break
+
+                resume = max(resume, match.end())
+                yield self._candidate(match, offset)
+
+            # One more character is kept so the lookbehind still sees the preceding digit.
+            keep = max(resume - 1, 0)
+            buffer = buffer[keep:]
+            offset += keep
+            pos = resume - keep
+
+        for match in self.pattern.finditer(buffer, pos):
+            yield self._candidate(match, offset)
+
+    def _candidate(self, match: Any, offset: int) -> Optional[tuple]:
+        """Get the kind, offsets, text and plain digits of a candidate.
+
+        :param match: The regular expression match.
+        :param offset: The offset of the searched buffer in the whole source.
+        :return: The candidate, or None if its kind is not searched.
+        """
+        kind = match.lastgroup
+        if kind == 'plain':
+            kind = 'cpf' if match.end() - match.start() == CPF_ENGINE.size else 'cnpj'
+
+        if kind not in self.kinds:
+            return None
+
+        text = match.group()
+        if not self.binary:
+            text = text.encode('ascii')
+
+        return kind, offset + match.start(), offset + match.end(), text
+
+    def _validate(self, candidates: Iterator[Optional[tuple]]) -> Iterator[DocumentMatch]:
+        """Validate the candidates a batch at a time.
+
+        :param candidates: The candidates, None for the ones to be skipped.
+        :return: An iterator over the valid document matches, in order.
+        """
+        candidates = filter(None, candidates)
+        while batch := list(islice(candidates, _BATCH_SIZE)):
+            plains = [text.translate(None, _MASK_CHARACTERS) for _, _, _, text in batch]
+            valid = self._check_batch(batch, plains)
+
+            for (kind, start, end, text), plain, is_valid in zip(batch, plains, valid):
+                if is_valid:
+                    yield DocumentMatch(kind, start, end, text.decode(), plain.decode())
+
+    def _check_batch(self, batch: List[tuple], plains: List[bytes]) -> List[bool]:
+        """Check a batch of candidates, each kind being checked at once.
+
+        :param batch: The candidates.
+        :param plains: The plain digits of the candidates, as ASCII bytes.
+        :return: Whether each candidate is valid.
+        """
+        valid = [False] * len(batch)
+        for kind in self.kinds:
+            indexes = [i for i, candidate in enumerate(batch) if candidate[0] == kind]
+            if indexes:
+                kind_valid = _check(_KINDS[kind][0], [plains[i] for i in indexes])
+                for i, is_valid in zip(indexes, kind_valid):
+                    valid[i] = is_valid
+
+        return valid
+
+
+def _check(engine: CheckDigitEngine, plains: List[bytes]) -> List[bool]:
+    """Check the plain documents of a kind, known to have the right number of digits.
+
+    :param engine: The check-digit engine of the document type.
+    :param plains: The plain document digits, as ASCII bytes.
+    :return: Whether each document is valid.
+    """
+    if np is None:
+        return [engine.is_valid(plain.decode()) for plain in plains]
+
+    digits = np.frombuffer(b''.join(plains), dtype=np.uint8).reshape(len(plains), engine.size)
+    return valid_digits(digits.astype(np.int64) - DIGIT_ZERO, engine).tolist()
+
+
+def _read_chunks(file: IO, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    """Lazily read the chunks of a file object.
+
+    :param file: The text or binary file object.
+    :param chunk_size: The number of characters or bytes read at once.
+    :return: An iterator over the chunks.
+    """
+    return iter(lambda: file.read(chunk_size), file.read(0))
+
+
+def _scan_path(
+    scanner: _Scanner, path: Union[str, os.PathLike], use_mmap: bool, chunk_size: int
+) -> Iterator[DocumentMatch]:
+    """Find the valid documents of a file.
+
+    :param scanner: The binary scanner.
+    :param path: The file path.
+    :param use_mmap: Whether to search the file through a memory map.
+    :param chunk_size: The number of bytes read at once when not using a memory map.
+    :return: An iterator over the document matches.
+    """
+    with open(path, 'rb') as file:
+        if not use_mmap:
+            yield from scanner.scan_chunks(_read_chunks(file, chunk_size))
+            return
+
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from scanner.scan(mapped)
+
+
+def find_documents(
+    text_or_file: Union[str, bytes, os.PathLike, IO],
+    kinds: Iterable[str] = ('cpf', 'cnpj'),
+    use_mmap: bool = True,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[DocumentMatch]:
+    """
+    Find the valid CPF and CNPJ documents in a text, masked or not.
+
+    Candidates are masked documents and runs of exactly 11 or 14 digits not surrounded by
+    other digits. Runs of 11 digits are taken as CPF documents and runs of 14 digits as CNPJ
+    documents. Their check digits are validated in batches, with NumPy when it is installed,
+    without building document objects.
+
+    Large inputs are never loaded at once: files given by path are searched through a memory
+    map, or read in chunks, and file objects are read in chunks. Documents across chunks are
+    found as well.
+
+    Examples:
+        >>> for match in find_documents('CPF 529.982.247-25, CNPJ 11222333000181.'):
+        ...     print(match.kind, match.start, match.plain)
+        cpf 4 52998224725
+        cnpj 25 11222333000181
+
+    :param text_or_file: The text, as str or bytes, a file path or an open file object.
+                         A str is always searched as text, use a pathlib.Path for file paths.
+    :param kinds: The document kinds to be found, 'cpf' and/or 'cnpj'.
+    :param use_mmap: Whether to search files given by path through a memory map.
+    :param chunk_size: The number of bytes or characters read at once when reading in chunks.
+    :return: An iterator over the matches, in order. Offsets are in characters for text
+             inputs and text file objects, and in bytes otherwise.
+    :raises ValueError: If a document kind is not supported.
+    """
+    if isinstance(text_or_file, str):
+        return _Scanner(kinds, binary=False).scan(text_or_file)
+
+    if isinstance(text_or_file, (bytes, bytearray, memoryview, mmap.mmap)):
+        return _Scanner(kinds, binary=True).scan(text_or_file)
+
+    if isinstance(text_or_file, os.PathLike):
+        return _scan_path(_Scanner(kinds, binary=True), text_or_file, use_mmap, chunk_size)
+
+    binary = isinstance(text_or_file.read(0), bytes)
+    return _Scanner(kinds, binary).scan_chunks(_read_chunks(text_or_file, chunk_size))
@@ -1,2 +1,68 @@
-from .cnpj_type import CNPJTypeDecorator  # noqa: F401
-from .cpf_type import CPFTypeDecorator  # noqa: F401
+"""
+SQLAlchemy column types, SQL functions and bulk helpers for documents.
+
+Names are imported from their submodules on first access, so that using the column types
+does not load the ORM, which is only needed by :func:`bulk_insert_documents`.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .bulk import bulk_insert_documents  # noqa: F401
+    from .cnpj_big_integer_type import (  # noqa: F401
+        CNPJBigIntegerTypeDecorator,
+    )
+    from .cnpj_type import CNPJTypeDecorator  # noqa: F401
+    from .cpf_big_integer_type import CPFBigIntegerTypeDecorator  # noqa: F401
+    from .cpf_or_cnpj_type import CPFOrCNPJTypeDecorator  # noqa: F401
+    from .cpf_type import CPFTypeDecorator  # noqa: F401
+    from .document_big_integer_type import (  # noqa: F401
+        DocumentBigIntegerTypeDecorator,
+    )
+    from .document_type import DocumentTypeDecorator  # noqa: F401
+    from .functions import (  # noqa: F401
+        install_sqlite_functions,
+        is_valid_cnpj,
+        is_valid_cpf,
+        is_valid_cpf_or_cnpj,
+        register_sqlite_functions,
+    )
+
+_EXPORTS = {
+    'bulk_insert_documents': 'bulk',
+    'CNPJBigIntegerTypeDecorator': 'cnpj_big_integer_type',
+    'CNPJTypeDecorator': 'cnpj_type',
+    'CPFBigIntegerTypeDecorator': 'cpf_big_integer_type',
+    'CPFOrCNPJTypeDecorator': 'cpf_or_cnpj_type',
+    'CPFTypeDecorator': 'cpf_type',
+    'DocumentBigIntegerTypeDecorator': 'document_big_integer_type',
+    'DocumentTypeDecorator': 'document_type',
+    'install_sqlite_functions': 'functions',
+    'is_valid_cnpj': 'functions',
+    'is_valid_cpf': 'functions',
+    'is_valid_cpf_or_cnpj': 'functions',
+    'register_sqlite_functions': 'functions',
+}
+"""Submodule defining each exported name."""
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access.
+
+    :param name: The attribute name.
+    :return: The exported object.
+    :raises AttributeError: If the name is not exported.
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the ones not imported yet."""
+    return sorted(set(globals()) | _EXPORTS.keys())
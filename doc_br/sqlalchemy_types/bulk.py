@@ -0,0 +1,111 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+from sqlalchemy import Column, Table, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from doc_br.sqlalchemy_types.document_type import DocumentTypeDecorator
+from doc_br.types import Document, parse_document, parse_documents
+
+
+def _validate_chunk(
+    document_class: Type[Document], chunk: List[Union[str, Document]], skip_invalid: bool
+) -> List[Document]:
+    """Validate a chunk of documents, building the missing document objects.
+
+    Document strings are validated at once with NumPy when it is installed.
+
+    :param document_class: The document class of the column, Document for columns mixing
+                           CPF and CNPJ documents.
+    :param chunk: The document strings or document objects.
+    :param skip_invalid: Whether to skip invalid document strings instead of raising.
+    :return: The valid documents.
+    :raises ValueError: If a document string is invalid and skip_invalid is False.
+    """
+    docs = [doc.plain if isinstance(doc, document_class) else doc for doc in chunk]
+
+    if document_class is Document:
+        parsed = parse_documents(docs)
+        parse = parse_document
+    else:
+        parsed = _parse_many(document_class, docs)
+        parse = document_class
+
+    if not skip_invalid:
+        for doc, document in zip(docs, parsed):
+            if not document:
+                parse(doc)
+
+    return [document for document in parsed if document]
+
+
+def _parse_many(document_class: Type[Document], docs: List[str]) -> List[Any]:
+    """Parse many document strings of a single kind, at once with NumPy when it is installed.
+
+    :param document_class: The document class.
+    :param docs: The document strings.
+    :return: The documents, or falsy values for the invalid document strings.
+    """
+    try:
+        valid, plain = document_class.validate_many(docs)
+    except ImportError:
+        return [document_class.try_parse(doc) for doc in docs]
+
+    from_trusted = document_class.from_trusted
+    return [from_trusted(p) if v else None for v, p in zip(valid.tolist(), plain.tolist())]
+
+
+def bulk_insert_documents(
+    connection: Union[Session, Connection],
+    table: Any,
+    column: Union[str, Column],
+    docs: Iterable[Union[str, Document]],
+    values: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 10000,
+    skip_invalid: bool = False,
+) -> int:
+    """
+    Validate and insert many documents without building ORM objects.
+
+    Documents are validated a chunk at a time and each chunk is inserted with a single
+    executemany statement, which SQLAlchemy may run as an "insertmanyvalues" batch.
+
+    Examples:
+        >>> bulk_insert_documents(  # doctest: +SKIP
+        ...     session, CPFTable, 'cpf', ['529.982.247-25', '337231923']
+        ... )
+        2
+
+    :param connection: The session or connection used to run the statements.
+    :param table: The table or ORM mapped class.
+    :param column: The name of the document column, or the column itself.
+                   Its type must be one of the document type decorators.
+    :param docs: The document strings or document objects.
+    :param values: Constant values of the other columns, inserted with every document.
+    :param chunk_size: The number of documents validated and inserted at once.
+    :param skip_invalid: Whether to skip invalid document strings instead of raising.
+    :return: The number of inserted documents.
+    :raises TypeError: If the column type is not a document type decorator.
+    :raises ValueError: If a document string is invalid and skip_invalid is False. The
+                        chunks before the invalid document are already inserted.
+    """
+    table: Table = getattr(table, '__table__', table)
+    column = table.c[column] if isinstance(column, str) else column
+
+    if not isinstance(column.type, DocumentTypeDecorator):
+        raise TypeError(f'Column {column.key!r} is not a document column.')
+
+    document_class = column.type.document_class
+    statement = insert(table)
+    values = values or {}
+    iterator = iter(docs)
+    inserted = 0
+
+    while chunk := list(islice(iterator, chunk_size)):
+        documents = _validate_chunk(document_class, chunk, skip_invalid)
+        if documents:
+            connection.execute(statement, [{**values, column.key: doc} for doc in documents])
+            inserted += len(documents)
+
+    return inserted
@@ -0,0 +1,21 @@
+from doc_br.sqlalchemy_types.document_big_integer_type import (
+    DocumentBigIntegerTypeDecorator,
+)
+from doc_br.sqlalchemy_types.functions import is_valid_cnpj
+from doc_br.types import CNPJ
+from doc_br.types.check_digit import CNPJ_ENGINE
+
+
+class CNPJBigIntegerTypeDecorator(DocumentBigIntegerTypeDecorator):
+    """
+    Custom SQLAlchemy type for storing CNPJ documents as BigInteger.
+
+    This type decorator is used to convert CNPJ objects to their integer value when storing them
+    in the database, and to convert the integer value back to CNPJ objects, with their leading
+    zeros, when retrieving them from the database.
+    """
+
+    document_class = CNPJ
+    validation_function = is_valid_cnpj
+    _engine = CNPJ_ENGINE
+    cache_ok = True
@@ -1,12 +1,9 @@
-from typing import Optional
-
-from sqlalchemy.engine.interfaces import Dialect
-from sqlalchemy.types import String, TypeDecorator
-
+from doc_br.sqlalchemy_types.document_type import DocumentTypeDecorator
+from doc_br.sqlalchemy_types.functions import is_valid_cnpj
 from doc_br.types import CNPJ
 
 
-class CNPJTypeDecorator(TypeDecorator):
+class CNPJTypeDecorator(DocumentTypeDecorator):
     """
     Custom SQLAlchemy type for storing CNPJ documents.
 
@@ -14,28 +11,11 @@ class CNPJTypeDecorator(TypeDecorator):
     when storing them in the
     database, and to convert the plain string representation back to CNPJ objects when
     retrieving them from the database.
-    """
-
-    impl = String
 
-    def process_bind_param(self, value: Optional[CNPJ], dialect: Dialect) -> Optional[str]:
-        """
-        Convert a CNPJ object to its plain string representation for storage.
-
-        :param value: The CNPJ object to be converted.
-        :param dialect: The SQLAlchemy dialect in use.
-        :return: The plain string representation of the CNPJ object.
-        """
-        if value is not None:
-            return value.plain
-
-    def process_result_value(self, value: Optional[str], dialect: Dialect) -> Optional[CNPJ]:
-        """
-        Convert a plain string representing a CNPJ to a CNPJ object when retrieving from the db.
+    Loaded values are trusted and not validated again, unless the type is created with
+    ``strict=True``, e.g. ``Column(CNPJTypeDecorator(strict=True))``.
+    """
 
-        :param value: The plain string representation of the CNPJ.
-        :param dialect: The SQLAlchemy dialect in use.
-        :return: The CNPJ object.
-        """
-        if value is not None:
-            return CNPJ(value)
+    document_class = CNPJ
+    validation_function = is_valid_cnpj
+    cache_ok = True
@@ -0,0 +1,21 @@
+from doc_br.sqlalchemy_types.document_big_integer_type import (
+    DocumentBigIntegerTypeDecorator,
+)
+from doc_br.sqlalchemy_types.functions import is_valid_cpf
+from doc_br.types import CPF
+from doc_br.types.check_digit import CPF_ENGINE
+
+
+class CPFBigIntegerTypeDecorator(DocumentBigIntegerTypeDecorator):
+    """
+    Custom SQLAlchemy type for storing CPF documents as BigInteger.
+
+    This type decorator is used to convert CPF objects to their integer value when storing them
+    in the database, and to convert the integer value back to CPF objects, with their leading
+    zeros, when retrieving them from the database.
+    """
+
+    document_class = CPF
+    validation_function = is_valid_cpf
+    _engine = CPF_ENGINE
+    cache_ok = True
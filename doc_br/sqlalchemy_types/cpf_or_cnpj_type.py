@@ -0,0 +1,40 @@
+from typing import Any, Callable, Union
+
+from doc_br.sqlalchemy_types.document_type import DocumentTypeDecorator
+from doc_br.sqlalchemy_types.functions import is_valid_cpf_or_cnpj
+from doc_br.types import CNPJ, CPF, Document, parse_document
+from doc_br.types.check_digit import CPF_ENGINE
+
+
+class CPFOrCNPJTypeDecorator(DocumentTypeDecorator):
+    """
+    Custom SQLAlchemy type for columns mixing CPF and CNPJ documents.
+
+    Both CPF and CNPJ objects are stored as their plain string representation, and loaded
+    back as a CPF or a CNPJ object by the length of the stored string: up to 11 characters,
+    as CPF documents stored without their leading zeros, it is a CPF, otherwise a CNPJ.
+
+    Loaded values are trusted and not validated again, unless the type is created with
+    ``strict=True``, e.g. ``Column(CPFOrCNPJTypeDecorator(14, strict=True))``.
+    """
+
+    document_class = Document
+    validation_function = is_valid_cpf_or_cnpj
+    cache_ok = True
+
+    def _result_converter(self) -> Callable[[Any], Union[CPF, CNPJ]]:
+        """Get the function converting a non-null database value to a CPF or CNPJ object.
+
+        :return: The conversion function.
+        """
+        if self.strict:
+            return parse_document
+
+        cpf_from_trusted = CPF.from_trusted
+        cnpj_from_trusted = CNPJ.from_trusted
+        cpf_size = CPF_ENGINE.size
+
+        def convert(value: str) -> Union[CPF, CNPJ]:
+            return cpf_from_trusted(value) if len(value) <= cpf_size else cnpj_from_trusted(value)
+
+        return convert
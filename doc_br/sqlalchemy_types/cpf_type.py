@@ -1,12 +1,9 @@
-from typing import Optional
-
-from sqlalchemy.engine.interfaces import Dialect
-from sqlalchemy.types import String, TypeDecorator
-
+from doc_br.sqlalchemy_types.document_type import DocumentTypeDecorator
+from doc_br.sqlalchemy_types.functions import is_valid_cpf
 from doc_br.types import CPF
 
 
-class CPFTypeDecorator(TypeDecorator):
+class CPFTypeDecorator(DocumentTypeDecorator):
     """
     Custom SQLAlchemy type for storing CPF documents.
 
@@ -14,28 +11,11 @@ class CPFTypeDecorator(TypeDecorator):
     when storing them in the
     database, and to convert the plain string representation back to CPF objects when
     retrieving them from the database.
-    """
-
-    impl = String
 
-    def process_bind_param(self, value: Optional[CPF], dialect: Dialect) -> Optional[str]:
-        """
-        Convert a CPF object to its plain string representation for storage.
-
-        :param value: The CPF object to be converted.
-        :param dialect: The SQLAlchemy dialect in use.
-        :return: The plain string representation of the CPF object.
-        """
-        if value is not None:
-            return value.plain
-
-    def process_result_value(self, value: Optional[str], dialect: Dialect) -> Optional[CPF]:
-        """
-        Convert a plain string representing a CPF to a CPF object when retrieving from the database.
+    Loaded values are trusted and not validated again, unless the type is created with
+    ``strict=True``, e.g. ``Column(CPFTypeDecorator(strict=True))``.
+    """
 
-        :param value: The plain string representation of the CPF.
-        :param dialect: The SQLAlchemy dialect in use.
-        :return: The CPF object.
-        """
-        if value is not None:
-            return CPF(value)
+    document_class = CPF
+    validation_function = is_valid_cpf
+    cache_ok = True
@@ -0,0 +1,87 @@
+from typing import Any, Callable
+
+from sqlalchemy.types import BigInteger, TypeDecorator
+
+from doc_br.sqlalchemy_types.document_type import DocumentTypeDecorator
+from doc_br.types import Document
+from doc_br.types.check_digit import CheckDigitEngine
+
+
+class DocumentBigIntegerTypeDecorator(DocumentTypeDecorator):
+    """
+    Base SQLAlchemy type for storing documents as 64-bit integers.
+
+    Documents are stored as their integer value, which makes indexes and joins smaller and
+    faster than on strings, and are restored with their leading zeros when loaded.
+
+    Document strings, masked or not, are accepted wherever a document is expected, so
+    expressions such as ``column == '529.982.247-25'`` compare against the normalized value.
+
+    Args:
+        strict (bool): Whether to validate the values loaded from the database.
+        create_constraint (bool): Whether to add a CHECK constraint to the table.
+    """
+
+    impl = BigInteger
+
+    _engine: CheckDigitEngine
+    """The check-digit engine used to normalize document strings."""
+
+    def __init__(self, strict: bool = False, create_constraint: bool = False, **kwargs: Any):
+        super().__init__(strict=strict, create_constraint=create_constraint, **kwargs)
+
+    class Comparator(TypeDecorator.Comparator):
+        """Comparator that normalizes document strings and objects to integers."""
+
+        def operate(self, op: Any, *other: Any, **kwargs: Any) -> Any:
+            """Normalize the operands, then apply the operator.
+
+            :param op: The operator.
+            :param other: The operands.
+            :param kwargs: Extra keyword arguments of the operator.
+            :return: The SQL expression.
+            """
+            normalize = self.type.normalize
+            other = [
+                [normalize(o) for o in operand]
+                if isinstance(operand, (list, tuple, set))
+                else normalize(operand)
+                for operand in other
+            ]
+            return super().operate(op, *other, **kwargs)
+
+    comparator_factory = Comparator
+
+    def normalize(self, value: Any) -> Any:
+        """Convert a document or document string to its integer value.
+
+        Other values, such as SQL expressions, are returned unchanged.
+
+        :param value: The value to be normalized.
+        :return: The integer value of the document, or the unchanged value.
+        :raises ValueError: If the document string is invalid.
+        """
+        if isinstance(value, self.document_class):
+            return int(value)
+
+        if isinstance(value, str):
+            return int(self._engine.sanitize(value))
+
+        return value
+
+    def _bind_converter(self) -> Callable[[Any], Any]:
+        """Get the function converting a non-null document to its integer value.
+
+        :return: The conversion function.
+        """
+        return self.normalize
+
+    def _result_converter(self) -> Callable[[Any], Document]:
+        """Get the function converting a non-null integer value to a document.
+
+        :return: The conversion function.
+        """
+        if self.strict:
+            return lambda value: self.document_class(str(value))
+
+        return self.document_class.from_trusted
@@ -0,0 +1,157 @@
+from typing import Any, Callable, Optional, Type
+
+from sqlalchemy import CheckConstraint, Column, Table
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.types import String, TypeDecorator
+
+from doc_br.sqlalchemy_types.functions import is_valid_document
+from doc_br.types import Document
+
+
+class DocumentTypeDecorator(TypeDecorator):
+    """
+    Base SQLAlchemy type for storing documents as their plain string representation.
+
+    Values loaded from the database are trusted by default, since they were validated when
+    stored, so documents are built without being validated again. Pass ``strict=True`` to
+    fully validate every loaded value.
+
+    Pass ``create_constraint=True`` to attach a CHECK constraint validating the check digits
+    inside the database to the table of the column, so that bulk loads and raw updates are
+    validated too. On SQLite, the validation functions must be registered first, see
+    :func:`doc_br.sqlalchemy_types.functions.install_sqlite_functions`.
+
+    Args:
+        length (Optional[int]): The length of the string column.
+        strict (bool): Whether to validate the values loaded from the database.
+        create_constraint (bool): Whether to add a CHECK constraint to the table.
+    """
+
+    impl = String
+
+    document_class: Type[Document]
+    """The document class stored by the type."""
+
+    validation_function: Type[is_valid_document]
+    """The SQL function validating the stored documents."""
+
+    def __init__(
+        self,
+        length: Optional[int] = None,
+        strict: bool = False,
+        create_constraint: bool = False,
+        **kwargs: Any,
+    ):
+        if length is not None:
+            kwargs['length'] = length
+
+        super().__init__(**kwargs)
+        # The statement cache key is built from the instance attributes named after the
+        # parameters of __init__, here length, strict and create_constraint.
+        self.length = length
+        self.strict = strict
+        self.create_constraint = create_constraint
+
+    def _set_parent(self, parent: Column, outer: bool = False, **kw: Any) -> None:
+        """Attach the CHECK constraint once the column is attached to a table, if requested.
+
+        :param parent: The column using the type.
+        :param outer: Whether the type is wrapped by another type.
+        """
+        super()._set_parent(parent, outer=outer, **kw)
+
+        if self.create_constraint:
+            parent._on_table_attach(self._attach_check_constraint)
+
+    def _attach_check_constraint(self, column: Column, table: Table) -> None:
+        """Add a CHECK constraint validating the documents of a column to its table.
+
+        :param column: The document column.
+        :param table: The table of the column.
+        """
+        constraint = CheckConstraint(
+            self.validation_function(column), name=f'ck_{table.name}_{column.name}_valid'
+        )
+        table.append_constraint(constraint)
+
+    def _bind_converter(self) -> Callable[[Any], Any]:
+        """Get the function converting a non-null document to its database value.
+
+        :return: The conversion function.
+        """
+        return lambda value: value.plain
+
+    def _result_converter(self) -> Callable[[Any], Document]:
+        """Get the function converting a non-null database value to a document.
+
+        :return: The conversion function.
+        """
+        return self.document_class if self.strict else self.document_class.from_trusted
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        """
+        Convert a document to its database value for storage.
+
+        :param value: The document object to be converted.
+        :param dialect: The SQLAlchemy dialect in use.
+        :return: The database value of the document.
+        """
+        if value is not None:
+            return self._bind_converter()(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[Document]:
+        """
+        Convert a database value to a document object when retrieving from the database.
+
+        :param value: The database value of the document.
+        :param dialect: The SQLAlchemy dialect in use.
+        :return: The document object.
+        """
+        if value is not None:
+            return self._result_converter()(value)
+
+    def bind_processor(self, dialect: Dialect) -> Optional[Callable[[Any], Any]]:
+        """Provide a precompiled bound value processing function.
+
+        :param dialect: The SQLAlchemy dialect in use.
+        :return: The processing function.
+        """
+        convert = self._bind_converter()
+        impl_processor = self.impl_instance.bind_processor(dialect)
+
+        if impl_processor is None:
+
+            def process(value: Any) -> Any:
+                return None if value is None else convert(value)
+
+        else:
+
+            def process(value: Any) -> Any:
+                return impl_processor(None if value is None else convert(value))
+
+        return process
+
+    def result_processor(
+        self, dialect: Dialect, coltype: Any
+    ) -> Optional[Callable[[Any], Optional[Document]]]:
+        """Provide a precompiled result value processing function.
+
+        :param dialect: The SQLAlchemy dialect in use.
+        :param coltype: The DBAPI column type.
+        :return: The processing function.
+        """
+        convert = self._result_converter()
+        impl_processor = self.impl_instance.result_processor(dialect, coltype)
+
+        if impl_processor is None:
+
+            def process(value: Any) -> Optional[Document]:
+                return None if value is None else convert(value)
+
+        else:
+
+            def process(value: Any) -> Optional[Document]:
+                value = impl_processor(value)
+                return None if value is None else convert(value)
+
+        return process
@@ -0,0 +1,220 @@
+from functools import partial
+from typing import Any, Optional
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Integer,
+    String,
+    and_,
+    case,
+    cast,
+    event,
+    false,
+    func,
+    literal,
+    null,
+    type_coerce,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+
+from doc_br.types.check_digit import CNPJ_ENGINE, CPF_ENGINE, CheckDigitEngine
+
+
+class is_valid_document(FunctionElement):
+    """
+    Base SQL function checking the check digits of a stored document.
+
+    Documents may be stored as plain strings or as integers, as done by the document type
+    decorators. NULL values are neither valid nor invalid, so they pass CHECK constraints.
+
+    On SQLite it renders a call to a Python function registered with
+    :func:`register_sqlite_functions`. On other dialects it renders an equivalent SQL
+    expression, which relies on CAST raising an error for non-digit characters in strings.
+    """
+
+    type = Boolean()
+    inherit_cache = True
+
+    engine: CheckDigitEngine
+    """The check-digit engine of the document type."""
+
+
+class is_valid_cpf(is_valid_document):
+    """SQL function checking the check digits of a stored CPF document."""
+
+    name = 'docbr_is_valid_cpf'
+    inherit_cache = True
+    engine = CPF_ENGINE
+
+
+class is_valid_cnpj(is_valid_document):
+    """SQL function checking the check digits of a stored CNPJ document."""
+
+    name = 'docbr_is_valid_cnpj'
+    inherit_cache = True
+    engine = CNPJ_ENGINE
+
+
+class is_valid_cpf_or_cnpj(is_valid_document):
+    """
+    SQL function checking the check digits of a stored CPF or CNPJ document.
+
+    The kind is told by the length of the stored plain string, 11 characters for a CPF and 14
+    for a CNPJ, so it only supports documents stored as strings.
+    """
+
+    name = 'docbr_is_valid_cpf_or_cnpj'
+    inherit_cache = True
+    engines = (CPF_ENGINE, CNPJ_ENGINE)
+    """The check-digit engines of the document types, with distinct sizes."""
+
+
+def _check_digit(digits: list, weights: tuple) -> ColumnElement:
+    """Build the SQL expression of a modulo 11 check digit.
+
+    :param digits: The SQL expressions of the weighted digits.
+    :param weights: The weight of each digit.
+    :return: The SQL expression of the check digit.
+    """
+    total = sum(digit * weight for digit, weight in zip(digits, weights))
+    return total * 10 % 11 % 10
+
+
+def document_check_expression(engine: CheckDigitEngine, expr: ColumnElement) -> ColumnElement:
+    """Build a portable SQL expression validating a stored document.
+
+    :param engine: The check-digit engine of the document type.
+    :param expr: The SQL expression of the stored document, a plain string or an integer.
+    :return: The boolean SQL expression.
+    """
+    size = engine.size
+
+    if isinstance(getattr(expr.type, 'impl_instance', expr.type), Integer):
+        value = type_coerce(expr, BigInteger())
+        digits = [value // 10 ** (size - 1 - i) % 10 for i in range(size)]
+        well_formed = and_(value >= 0, value < 10**size)
+        repeated = [literal(int(str(d) * size), BigInteger()) for d in range(10)]
+    else:
+        value = type_coerce(expr, String())
+        digits = [cast(func.substr(value, i + 1, 1), Integer()) for i in range(size)]
+        well_formed = func.length(value) == size
+        repeated = [literal(str(d) * size, String()) for d in range(10)]
+
+    return and_(
+        well_formed,
+        value.not_in(repeated),
+        digits[-2] == _check_digit(digits[:-2], engine.weights[1:]),
+        digits[-1] == _check_digit(digits[:-1], engine.weights),
+    )
+
+
+def cpf_or_cnpj_check_expression(expr: ColumnElement) -> ColumnElement:
+    """Build a portable SQL expression validating a stored CPF or CNPJ document string.
+
+    The kind is told by the length of the plain string. As for a single document type, the
+    expression is NULL for a NULL value.
+
+    :param expr: The SQL expression of the stored plain document string.
+    :return: The boolean SQL expression.
+    """
+    value = type_coerce(expr, String())
+    return case(
+        (value.is_(None), null()),
+        *(
+            (func.length(value) == engine.size, document_check_expression(engine, value))
+            for engine in is_valid_cpf_or_cnpj.engines
+        ),
+        else_=false(),
+    )
+
+
+@compiles(is_valid_document)
+def _compile_is_valid_document(element: is_valid_document, compiler: SQLCompiler, **kw: Any) -> str:
+    """Render the validation function as a portable SQL expression."""
+    (expr,) = element.clauses.clauses
+    return compiler.process(document_check_expression(element.engine, expr), **kw)
+
+
+@compiles(is_valid_cpf_or_cnpj)
+def _compile_is_valid_cpf_or_cnpj(
+    element: is_valid_cpf_or_cnpj, compiler: SQLCompiler, **kw: Any
+) -> str:
+    """Render the validation function as a portable SQL expression choosing the kind by length."""
+    (expr,) = element.clauses.clauses
+    return compiler.process(cpf_or_cnpj_check_expression(expr), **kw)
+
+
+@compiles(is_valid_document, 'sqlite')
+@compiles(is_valid_cpf_or_cnpj, 'sqlite')
+def _compile_is_valid_document_sqlite(
+    element: is_valid_document, compiler: SQLCompiler, **kw: Any
+) -> str:
+    """Render the validation function as a call to the registered SQLite function."""
+    return f'{element.name}({compiler.process(element.clauses, **kw)})'
+
+
+def _sqlite_is_valid(engine: CheckDigitEngine, value: Any) -> Optional[int]:
+    """Check a stored document from SQLite.
+
+    :param engine: The check-digit engine of the document type.
+    :param value: The stored plain document string or integer value.
+    :return: 1 if the document is valid, 0 if not, or None if the value is NULL.
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, int):
+        return int(
+            0 <= value < 10 ** engine.size and engine.is_valid(str(value).zfill(engine.size))
+        )
+
+    return int(isinstance(value, str) and engine.is_valid(value))
+
+
+def _sqlite_is_valid_cpf_or_cnpj(value: Any) -> Optional[int]:
+    """Check a stored CPF or CNPJ plain document string from SQLite.
+
+    :param value: The stored plain document string.
+    :return: 1 if the document is valid, 0 if not, or None if the value is NULL.
+    """
+    if value is None:
+        return None
+
+    for engine in is_valid_cpf_or_cnpj.engines:
+        if isinstance(value, str) and len(value) == engine.size:
+            return int(engine.is_valid(value))
+
+    return 0
+
+
+def register_sqlite_functions(dbapi_connection: Any) -> None:
+    """Register the document validation functions on a SQLite DBAPI connection.
+
+    :param dbapi_connection: The sqlite3 connection.
+    """
+    for function in (is_valid_cpf, is_valid_cnpj):
+        dbapi_connection.create_function(
+            function.name, 1, partial(_sqlite_is_valid, function.engine), deterministic=True
+        )
+    dbapi_connection.create_function(
+        is_valid_cpf_or_cnpj.name, 1, _sqlite_is_valid_cpf_or_cnpj, deterministic=True
+    )
+
+
+def install_sqlite_functions(engine: Engine) -> None:
+    """Register the document validation functions on every new connection of a SQLite engine.
+
+    It must be called before the engine opens its first connection.
+
+    :param engine: The SQLite engine.
+    """
+
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        register_sqlite_functions(dbapi_connection)
+
+    event.listen(engine, 'connect', on_connect)
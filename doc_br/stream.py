@@ -0,0 +1,176 @@
+import csv
+import mmap
+import os
+from typing import Iterator, NamedTuple, Optional, Tuple, Type, Union
+
+from doc_br.types import CNPJ, CPF, Document
+from doc_br.types.check_digit import CNPJ_ENGINE, CPF_ENGINE, CheckDigitEngine
+
+_KINDS = {
+    'cpf': (CPF_ENGINE, CPF),
+    'cnpj': (CNPJ_ENGINE, CNPJ),
+}
+"""Check-digit engine and document class of each supported document kind."""
+
+
+class ValidationRecord(NamedTuple):
+    """Result of validating a single document read from a file."""
+
+    line_number: int
+    """Number of the line where the record ends, starting at 1."""
+
+    plain: str
+    """The plain document string, or the raw value if the document is invalid."""
+
+    masked: Optional[str]
+    """The masked document string, or None if the document is invalid."""
+
+    valid: bool
+    """Whether the document is valid."""
+
+    document: Optional[Document] = None
+    """The document object, only built when requested and the document is valid."""
+
+
+def _resolve_kind(kind: str) -> Tuple[CheckDigitEngine, Type[Document]]:
+    """Get the check-digit engine and document class of a document kind.
+
+    :param kind: The document kind, 'cpf' or 'cnpj'.
+    :return: The check-digit engine and the document class.
+    :raises ValueError: If the document kind is not supported.
+    """
+    try:
+        return _KINDS[kind.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(f'Unsupported document kind: {kind!r}.') from None
+
+
+def _iter_lines(path: Union[str, os.PathLike], encoding: str, use_mmap: bool) -> Iterator[str]:
+    """Lazily read the lines of a text file.
+
+    :param path: The file path.
+    :param encoding: The file encoding.
+    :param use_mmap: Whether to read the file through a memory map instead of buffered reads.
+    :return: An iterator over the lines of the file, keeping their line endings.
+    """
+    if not use_mmap:
+        with open(path, encoding=encoding, newline='') as file:
+            yield from file
+        return
+
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b''):
+                yield line.decode(encoding)
+
+
+def _iter_line_values(lines: Iterator[str], skip_header: bool) -> Iterator[Tuple[int, str]]:
+    """Extract the document values of a file with one document per line.
+
+    :param lines: The lines of the file.
+    :param skip_header: Whether to skip the first line.
+    :return: An iterator over (line number, value) pairs.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if line_number > 1 or not skip_header:
+            yield line_number, line.strip()
+
+
+def _iter_column_values(
+    lines: Iterator[str],
+    column: Union[int, str],
+    delimiter: str,
+    skip_header: bool,
+) -> Iterator[Tuple[int, str]]:
+    """Extract the document values of a CSV column.
+
+    :param lines: The lines of the file.
+    :param column: The CSV column index or header name.
+    :param delimiter: The CSV delimiter.
+    :param skip_header: Whether to skip the first row when column is an index.
+    :return: An iterator over (line number, value) pairs.
+    :raises ValueError: If the column name is not found in the header.
+    """
+    reader = csv.reader(lines, delimiter=delimiter)
+    if isinstance(column, str):
+        header = next(reader, [])
+        if column not in header:
+            raise ValueError(f'Column {column!r} not found in the header.')
+        column = header.index(column)
+    elif skip_header:
+        next(reader, None)
+
+    for row in reader:
+        if row:
+            yield reader.line_num, row[column].strip() if column < len(row) else ''
+
+
+def _iter_values(
+    lines: Iterator[str],
+    column: Union[int, str, None],
+    delimiter: str,
+    skip_header: bool,
+) -> Iterator[Tuple[int, str]]:
+    """Extract the document values from the lines of a file.
+
+    :param lines: The lines of the file.
+    :param column: The CSV column index or header name. If None, each line is a document.
+    :param delimiter: The CSV delimiter.
+    :param skip_header: Whether to skip the first row.
+    :return: An iterator over (line number, value) pairs.
+    :raises ValueError: If the column name is not found in the header.
+    """
+    if column is None:
+        return _iter_line_values(lines, skip_header)
+
+    return _iter_column_values(lines, column, delimiter, skip_header)
+
+
+def validate_file(
+    path: Union[str, os.PathLike],
+    kind: str = 'cpf',
+    column: Union[int, str, None] = None,
+    delimiter: str = ',',
+    skip_header: bool = False,
+    encoding: str = 'utf-8',
+    use_mmap: bool = False,
+    documents: bool = False,
+) -> Iterator[ValidationRecord]:
+    """
+    Validate the documents of a CSV or newline-delimited file, one record at a time.
+
+    The file is read lazily, so memory usage does not depend on the file size.
+
+    Examples:
+        >>> for record in validate_file('extract.csv', kind='cnpj', column='cnpj'):
+        ...     if not record.valid:
+        ...         print(record.line_number, record.plain)  # doctest: +SKIP
+
+    :param path: The file path.
+    :param kind: The document kind, 'cpf' or 'cnpj'.
+    :param column: The CSV column index or header name holding the documents.
+                   If a name is given, the first row is read as the header.
+                   If None, the file is read as one document per line.
+    :param delimiter: The CSV delimiter.
+    :param skip_header: Whether to skip the first row when column is not a header name.
+    :param encoding: The file encoding.
+    :param use_mmap: Whether to read the file through a memory map.
+    :param documents: Whether to build a CPF/CNPJ object for each valid record.
+    :return: An iterator over the validation records.
+    :raises ValueError: If the document kind is not supported or the column is not found.
+    """
+    engine, document_class = _resolve_kind(kind)
+    lines = _iter_lines(path, encoding, use_mmap)
+
+    for line_number, value in _iter_values(lines, column, delimiter, skip_header):
+        try:
+            plain = engine.sanitize(value)
+        except ValueError:
+            yield ValidationRecord(line_number, value, None, False)
+            continue
+
+        document = document_class._from_plain(plain) if documents else None
+        yield ValidationRecord(line_number, plain, engine.mask(plain), True, document)
@@ -1,3 +1,16 @@
+from .cache import CacheInfo, DocumentCache  # noqa: F401
+from .check_digit import (  # noqa: F401
+    CheckDigitEngine,
+    InvalidDocumentError,
+    InvalidReason,
+    ParseFailure,
+)
 from .cnpj import CNPJ  # noqa: F401
 from .cpf import CPF  # noqa: F401
+from .detect import (  # noqa: F401
+    detect_document_class,
+    parse_document,
+    parse_documents,
+    try_parse_document,
+)
 from .doc import Document  # noqa: F401
@@ -0,0 +1,115 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, NamedTuple, Type, TypeVar
+
+from doc_br.types.doc import Document
+
+D = TypeVar('D', bound=Document)
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a document cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DocumentCache(Generic[D]):
+    """
+    Bounded LRU cache of documents keyed on the raw document string.
+
+    Repeated document strings return the same, already validated, document object instead of
+    sanitizing, validating and masking them again. Invalid document strings are not cached.
+
+    Args:
+        document_class (Type[Document]): The document class to be instantiated on a miss.
+        maxsize (int): The maximum number of cached documents.
+
+    Raises:
+        ValueError: If maxsize is not positive.
+
+    Examples:
+        >>> from doc_br.types import CPF
+        >>> cache = DocumentCache(CPF, maxsize=2)
+        >>> cache.get('529.982.247-25') is cache.get('529.982.247-25')
+        True
+        >>> cache.info()
+        CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, document_class: Type[D], maxsize: int = 65536):
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive.')
+
+        self.document_class = document_class
+        self._maxsize = maxsize
+        self._documents: 'OrderedDict[str, D]' = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, doc: str) -> D:
+        """Get the document of a document string, building and caching it on a miss.
+
+        :param doc: The document string.
+        :return: The document object.
+        :raises ValueError: If the document string is invalid.
+        """
+        with self._lock:
+            document = self._documents.get(doc)
+            if document is not None:
+                self._documents.move_to_end(doc)
+                self._hits += 1
+                return document
+
+            self._misses += 1
+
+        document = self.document_class(doc)
+
+        with self._lock:
+            # Another thread may have cached the same document string meanwhile.
+            cached = self._documents.get(doc)
+            if cached is not None:
+                self._documents.move_to_end(doc)
+                return cached
+
+            self._documents[doc] = document
+            if len(self._documents) > self._maxsize:
+                self._documents.popitem(last=False)
+
+        return document
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of cached documents, evicting the least recently used.
+
+        :param maxsize: The new maximum number of cached documents.
+        :raises ValueError: If maxsize is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive.')
+
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._documents) > maxsize:
+                self._documents.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the cached documents and reset the statistics."""
+        with self._lock:
+            self._documents.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get the cache statistics.
+
+        :return: The number of hits and misses, the maximum size and the current size.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._documents))
+
+    def __len__(self) -> int:
+        """Return the number of cached documents."""
+        return len(self._documents)
@@ -0,0 +1,269 @@
+from enum import Enum
+from operator import mul
+from typing import Optional, Tuple, Union
+
+
+class InvalidReason(Enum):
+    """Reason why a document string is invalid."""
+
+    INVALID_CHARACTER = 'invalid character'
+    """The document string has a character that is neither a digit nor a mask character."""
+
+    INVALID_LENGTH = 'invalid length'
+    """The document string has no digits or more digits than the document allows."""
+
+    REPEATED_DIGITS = 'repeated digits'
+    """All the digits of the document string are the same."""
+
+    INVALID_CHECK_DIGITS = 'invalid check digits'
+    """The check digits do not match the document base number."""
+
+
+class InvalidDocumentError(ValueError):
+    """
+    Error raised when a document string is invalid.
+
+    Args:
+        message (str): The error message.
+        reason (InvalidReason): The reason why the document string is invalid.
+    """
+
+    def __init__(self, message: str, reason: InvalidReason):
+        super().__init__(message)
+        self.reason = reason
+
+
+class ParseFailure:
+    """
+    Lightweight result of a failed document parsing.
+
+    It is falsy, so it can be told apart from a parsed document with a truth test.
+
+    Args:
+        doc (str): The document string that failed to be parsed.
+        reason (InvalidReason): The reason why the document string is invalid.
+
+    Examples:
+        >>> from doc_br.types import CPF
+        >>> result = CPF.try_parse('111.111.111-11')
+        >>> bool(result), result.reason
+        (False, <InvalidReason.REPEATED_DIGITS: 'repeated digits'>)
+    """
+
+    __slots__ = ('doc', 'reason')
+
+    def __init__(self, doc: str, reason: InvalidReason):
+        self.doc = doc
+        self.reason = reason
+
+    def __bool__(self) -> bool:
+        """Return False, as a failure is never a valid document."""
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two parse failures have the same document string and reason."""
+        if not isinstance(other, ParseFailure):
+            return NotImplemented
+        return self.doc == other.doc and self.reason == other.reason
+
+    def __hash__(self) -> int:
+        """Return the hash value of the parse failure."""
+        return hash((self.doc, self.reason))
+
+    def __repr__(self) -> str:
+        """Return the string representation of the parse failure."""
+        return f'ParseFailure({self.doc!r}, {self.reason})'
+
+
+class CheckDigitEngine:
+    """
+    Native modulo 11 check-digit engine shared by the document types.
+
+    Sanitizes, pads, validates and masks a document string using only built-in string
+    operations, so a document is normalized with a single validation and no helper objects.
+
+    Args:
+        name (str): Name of the document, used in error messages.
+        size (int): Number of digits in the plain document string.
+        weights (Tuple[int, ...]): Weights of the second check digit. The weights of the
+            first check digit are the same sequence without its first element.
+        mask_characters (str): Characters accepted as part of a mask.
+        mask_format (str): Format string with one placeholder per mask group.
+        mask_groups (Tuple[int, ...]): Size of each mask group, in order.
+
+    Examples:
+        >>> engine = CheckDigitEngine(
+        ...     'CPF', 11, tuple(range(11, 1, -1)), '.-', '{}.{}.{}-{}', (3, 3, 3, 2)
+        ... )
+        >>> engine.sanitize('529.982.247-25')
+        '52998224725'
+        >>> engine.mask('52998224725')
+        '529.982.247-25'
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        weights: Tuple[int, ...],
+        mask_characters: str,
+        mask_format: str,
+        mask_groups: Tuple[int, ...],
+    ):
+        self.name = name
+        self.size = size
+        self.weights = weights
+        self.mask_characters = mask_characters
+        self.mask_format = mask_format
+
+        slices = []
+        start = 0
+        for group in mask_groups:
+            slices.append(slice(start, start + group))
+            start += group
+        self._mask_slices = tuple(slices)
+        self._strip_table = str.maketrans('', '', mask_characters)
+
+        # Digits are weighted as ASCII codes, so the weighted codes of '0' are subtracted.
+        self._first_weights = weights[1:]
+        self._first_offset = ord('0') * sum(weights[1:])
+        self._second_offset = ord('0') * sum(weights[:-1])
+
+    def compute_check_digits(self, base: str) -> str:
+        """Compute the two check digits of a document base number.
+
+        :param base: The document digits without the check digits.
+        :return: The two check digits.
+        """
+        digits = base.encode('ascii')
+        first = self._check_digit(sum(map(mul, digits, self._first_weights)) - self._first_offset)
+        second = self._check_digit(
+            sum(map(mul, digits, self.weights)) - self._second_offset + first * self.weights[-1]
+        )
+        return f'{first}{second}'
+
+    def check(self, plain: str) -> Optional[InvalidReason]:
+        """Check a plain, zero-filled document string.
+
+        :param plain: The plain document string.
+        :return: The reason why the document string is invalid, or None if it is valid.
+        """
+        size = self.size
+        if len(plain) != size:
+            return InvalidReason.INVALID_LENGTH
+
+        if not plain.isascii() or not plain.isdigit():
+            return InvalidReason.INVALID_CHARACTER
+
+        if plain == plain[0] * size:
+            return InvalidReason.REPEATED_DIGITS
+
+        if plain[-2:] != self.compute_check_digits(plain[:-2]):
+            return InvalidReason.INVALID_CHECK_DIGITS
+
+        return None
+
+    def is_valid(self, plain: str) -> bool:
+        """Check whether a plain, zero-filled document string is valid.
+
+        :param plain: The plain document string.
+        :return: True if the document string is valid, False otherwise.
+        """
+        return self.check(plain) is None
+
+    def parse(self, doc: str) -> Union[str, InvalidReason]:
+        """Strip the mask, fill with leading zeros and validate a document string without raising.
+
+        :param doc: The document string, masked or not.
+        :return: The plain document string, or the reason why it is invalid.
+        """
+        if not doc:
+            return InvalidReason.INVALID_LENGTH
+
+        if not isinstance(doc, str):
+            return InvalidReason.INVALID_CHARACTER
+
+        plain = doc.translate(self._strip_table)
+        if not plain:
+            return InvalidReason.INVALID_LENGTH
+
+        if not plain.isascii() or not plain.isdigit():
+            return InvalidReason.INVALID_CHARACTER
+
+        plain = plain.zfill(self.size)
+        return self.check(plain) or plain
+
+    def sanitize(self, doc: str) -> str:
+        """Strip the mask, fill with leading zeros and validate a document string.
+
+        :param doc: The document string, masked or not.
+        :return: The plain document string.
+        :raises InvalidDocumentError: If the document string is invalid.
+        """
+        plain = self.parse(doc)
+        if isinstance(plain, InvalidReason):
+            raise self.error(plain)
+
+        return plain
+
+    def validate(self, doc: str) -> None:
+        """Strip the mask and validate a document string, without filling it with leading zeros.
+
+        :param doc: The document string, masked or not.
+        :raises InvalidDocumentError: If the document string is invalid or lacks leading zeros.
+        """
+        if doc and not isinstance(doc, str):
+            raise self.error(InvalidReason.INVALID_CHARACTER)
+
+        reason = self.check((doc or '').translate(self._strip_table))
+        if reason is not None:
+            raise self.error(reason)
+
+    def error(self, reason: InvalidReason) -> InvalidDocumentError:
+        """Build the error raised for an invalid document string.
+
+        :param reason: The reason why the document string is invalid.
+        :return: The error.
+        """
+        return InvalidDocumentError(f'Invalid {self.name} document: {reason.value}.', reason)
+
+    def mask(self, plain: str) -> str:
+        """Apply the mask to a plain document string known to be valid.
+
+        No validation is performed.
+
+        :param plain: The plain document string.
+        :return: The masked document string.
+        """
+        return self.mask_format.format(*map(plain.__getitem__, self._mask_slices))
+
+    @staticmethod
+    def _check_digit(total: int) -> int:
+        """Compute a single modulo 11 check digit.
+
+        :param total: The weighted sum of the digits.
+        :return: The check digit.
+        """
+        remainder = total % 11
+        return 0 if remainder < 2 else 11 - remainder
+
+
+CPF_ENGINE = CheckDigitEngine(
+    name='CPF',
+    size=11,
+    weights=tuple(range(11, 1, -1)),
+    mask_characters='.-',
+    mask_format='{}.{}.{}-{}',
+    mask_groups=(3, 3, 3, 2),
+)
+"""Check-digit engine for CPF documents."""
+
+CNPJ_ENGINE = CheckDigitEngine(
+    name='CNPJ',
+    size=14,
+    weights=(6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+    mask_characters='.-/',
+    mask_format='{}.{}.{}/{}-{}',
+    mask_groups=(2, 3, 3, 4, 2),
+)
+"""Check-digit engine for CNPJ documents."""
@@ -1,7 +1,11 @@
-import validate_docbr
+from typing import TYPE_CHECKING, Iterable, Tuple, Union
 
+from doc_br.types.check_digit import CNPJ_ENGINE, InvalidReason, ParseFailure
 from doc_br.types.doc import Document
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class CNPJ(Document):
     """
@@ -13,28 +17,32 @@ class CNPJ(Document):
        doc (str): The CNPJ document string.
 
     Raises:
-       ValueError: If the document string is invalid.
+       InvalidDocumentError: If the document string is invalid.
 
     Attributes:
-       _plain (str): The plain CNPJ document string.
-       _masked (str): The masked CNPJ document string.
+       _value (int): The CNPJ document as an integer.
 
     Examples:
-       >>> cnpj = CNPJ('12345678901234')  # consider as valid CNPJ document string
+       >>> cnpj = CNPJ('11222333000181')
        >>> cnpj.plain
-       '12345678901234'
+       '11222333000181'
        >>> cnpj.masked
-       '12.345.678/9012-34'
+       '11.222.333/0001-81'
 
-       >>> cnpj = CNPJ('12345678')  # Invalid CNPJ
+       >>> cnpj = CNPJ('11.222.333/0001-80')  # Invalid CNPJ
        Traceback (most recent call last):
            ...
-       ValueError: Invalid CNPJ document string.
+       doc_br.types.check_digit.InvalidDocumentError: Invalid CNPJ document: invalid check digits.
     """
 
+    __slots__ = ()
+
     _PLAIN_DIGITS = 14
     """Number of digits in a CNPJ document string without mask."""
 
+    _TYPE_TAG = 2
+    """Tag of the CNPJ class in the binary form of documents."""
+
     def sanitize(self, doc: str) -> str:
         """
         Sanitize and standardize a CNPJ string by removing formatting and unwanted characters.
@@ -45,14 +53,7 @@ class CNPJ(Document):
         :return: The sanitized and standardized CNPJ document string.
         :raises ValueError: If the document string is invalid.
         """
-        if doc is None:
-            raise ValueError('Invalid CNPJ document.')
-
-        self._validate_input(doc, mask_characters={'.', '-', '/'})
-        plain_doc = self.remove_mask(doc, validate_unmasked=False)
-        plain_doc = self._fill_with_zeros(plain_doc, self._PLAIN_DIGITS)
-        self.validate(plain_doc)
-        return plain_doc
+        return CNPJ_ENGINE.sanitize(doc)
 
     def validate(self, doc: str) -> None:
         """Validate a CNPJ document string.
@@ -60,8 +61,7 @@ class CNPJ(Document):
         :param doc: The CNPJ document string to be validated.
         :raises ValueError: If the document string is invalid.
         """
-        if doc is None or not validate_docbr.CNPJ().validate(doc):
-            raise ValueError('Invalid CNPJ document.')
+        CNPJ_ENGINE.validate(doc)
 
     def apply_mask(self, doc: str) -> str:
         """Apply mask to a CNPJ document string.
@@ -73,10 +73,15 @@ class CNPJ(Document):
         if doc is None:
             raise ValueError('Invalid CNPJ document.')
 
-        plain_doc = self.sanitize(doc)
-        return '{}.{}.{}/{}-{}'.format(
-            plain_doc[:2], plain_doc[2:5], plain_doc[5:8], plain_doc[8:12], plain_doc[12:]
-        )
+        return CNPJ_ENGINE.mask(self.sanitize(doc))
+
+    def _mask_valid(self, plain: str) -> str:
+        """Apply mask to a CNPJ document string already known to be valid.
+
+        :param plain: The plain CNPJ document string.
+        :return: The masked CNPJ document string.
+        """
+        return CNPJ_ENGINE.mask(plain)
 
     def remove_mask(self, masked_document: str, validate_unmasked: bool) -> str:
         """Remove a mask from a CNPJ document string.
@@ -91,12 +96,41 @@ class CNPJ(Document):
 
         return ''.join(filter(str.isdigit, masked_document))
 
+    @classmethod
+    def try_parse(cls, doc: str) -> Union['CNPJ', ParseFailure]:
+        """Parse a CNPJ document string without raising an exception.
+
+        :param doc: The CNPJ document string.
+        :return: The CNPJ object, or a falsy ParseFailure carrying the reason why the
+                 document string is invalid.
+        """
+        plain = CNPJ_ENGINE.parse(doc)
+        if isinstance(plain, InvalidReason):
+            return ParseFailure(doc, plain)
+
+        return cls._from_plain(plain)
+
+    @staticmethod
+    def validate_many(docs: Iterable[str]) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+        """Validate and normalize many CNPJ document strings at once using NumPy.
+
+        :param docs: A sequence or NumPy array of CNPJ document strings, masked or not.
+        :return: A boolean mask of the valid documents and an array with their plain strings.
+                 Invalid documents have an empty plain string.
+        :raises ImportError: If NumPy is not installed.
+        """
+        from doc_br.batch import validate_many
+
+        return validate_many(docs, CNPJ_ENGINE)
+
     @staticmethod
     def generate() -> 'CNPJ':
         """Generate a random CNPJ document.
 
         :return: The generated CNPJ document.
         """
+        import validate_docbr
+
         return CNPJ(validate_docbr.CNPJ().generate())
 
     def __init__(self, doc: str):
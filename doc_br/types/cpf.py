@@ -1,7 +1,11 @@
-import validate_docbr
+from typing import TYPE_CHECKING, Iterable, Tuple, Union
 
+from doc_br.types.check_digit import CPF_ENGINE, InvalidReason, ParseFailure
 from doc_br.types.doc import Document
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class CPF(Document):
     """
@@ -13,28 +17,32 @@ class CPF(Document):
         doc (str): The CPF document string.
 
     Raises:
-        ValueError: If the document string is invalid.
+        InvalidDocumentError: If the document string is invalid.
 
     Attributes:
-        _plain (str): The plain CPF document string.
-        _masked (str): The masked CPF document string.
+        _value (int): The CPF document as an integer.
 
     Examples:
-        >>> cpf = CPF('12345678900') # consider as valid CPF document string
+        >>> cpf = CPF('52998224725')
         >>> cpf.plain
-        '12345678900'
+        '52998224725'
         >>> cpf.masked
-        '123.456.789-00'
+        '529.982.247-25'
 
-        >>> cpf = CPF('12345678')  # Invalid CPF
+        >>> cpf = CPF('123.456.789-01')  # Invalid CPF
         Traceback (most recent call last):
             ...
-        ValueError: Invalid CPF document string.
+        doc_br.types.check_digit.InvalidDocumentError: Invalid CPF document: invalid check digits.
     """
 
+    __slots__ = ()
+
     _PLAIN_DIGITS = 11
     """Number of digits in a CPF document string without mask."""
 
+    _TYPE_TAG = 1
+    """Tag of the CPF class in the binary form of documents."""
+
     def sanitize(self, doc: str) -> str:
         """
         Sanitize and standardize a CPF string by removing formatting and unwanted characters.
@@ -45,14 +53,7 @@ class CPF(Document):
         :return: The sanitized and standardized CPF document string.
         :raises ValueError: If the document string is invalid.
         """
-        if doc is None:
-            raise ValueError('Invalid CPF document.')
-
-        self._validate_input(doc, mask_characters={'-', '.'})
-        plain_doc = self.remove_mask(doc, validate_unmasked=False)
-        plain_doc = self._fill_with_zeros(plain_doc, self._PLAIN_DIGITS)
-        self.validate(plain_doc)
-        return plain_doc
+        return CPF_ENGINE.sanitize(doc)
 
     def validate(self, doc: str) -> None:
         """Validate a CPF document string.
@@ -60,8 +61,7 @@ class CPF(Document):
         :param doc: The CPF document string to be validated.
         :raises ValueError: If the document string is invalid.
         """
-        if doc is None or not validate_docbr.CPF().validate(doc):
-            raise ValueError('Invalid CPF document.')
+        CPF_ENGINE.validate(doc)
 
     def apply_mask(self, doc: str) -> str:
         """Apply mask to a CPF document string.
@@ -70,8 +70,15 @@ class CPF(Document):
         :return: The masked CPF document string.
         :raises ValueError: If the document string is invalid.
         """
-        plain_doc = self.sanitize(doc)
-        return '{}.{}.{}-{}'.format(plain_doc[:3], plain_doc[3:6], plain_doc[6:9], plain_doc[9:])
+        return CPF_ENGINE.mask(self.sanitize(doc))
+
+    def _mask_valid(self, plain: str) -> str:
+        """Apply mask to a CPF document string already known to be valid.
+
+        :param plain: The plain CPF document string.
+        :return: The masked CPF document string.
+        """
+        return CPF_ENGINE.mask(plain)
 
     def remove_mask(self, masked_document: str, validate_unmasked: bool) -> str:
         """Remove a mask from a CPF document string.
@@ -89,12 +96,41 @@ class CPF(Document):
 
         return ''.join(filter(str.isdigit, masked_document))
 
+    @classmethod
+    def try_parse(cls, doc: str) -> Union['CPF', ParseFailure]:
+        """Parse a CPF document string without raising an exception.
+
+        :param doc: The CPF document string.
+        :return: The CPF object, or a falsy ParseFailure carrying the reason why the
+                 document string is invalid.
+        """
+        plain = CPF_ENGINE.parse(doc)
+        if isinstance(plain, InvalidReason):
+            return ParseFailure(doc, plain)
+
+        return cls._from_plain(plain)
+
+    @staticmethod
+    def validate_many(docs: Iterable[str]) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+        """Validate and normalize many CPF document strings at once using NumPy.
+
+        :param docs: A sequence or NumPy array of CPF document strings, masked or not.
+        :return: A boolean mask of the valid documents and an array with their plain strings.
+                 Invalid documents have an empty plain string.
+        :raises ImportError: If NumPy is not installed.
+        """
+        from doc_br.batch import validate_many
+
+        return validate_many(docs, CPF_ENGINE)
+
     @staticmethod
     def generate() -> 'CPF':
         """Generate a random CPF document.
 
         :return: The generated CPF document.
         """
+        import validate_docbr
+
         return CPF(validate_docbr.CPF().generate())
 
     def __init__(self, doc: str):
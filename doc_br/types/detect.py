@@ -0,0 +1,152 @@
+from typing import Iterable, List, Type, Union
+
+from doc_br.types.check_digit import (
+    CNPJ_ENGINE,
+    CPF_ENGINE,
+    CheckDigitEngine,
+    InvalidReason,
+    ParseFailure,
+)
+from doc_br.types.cnpj import CNPJ
+from doc_br.types.cpf import CPF
+
+_STRIP_TABLE = str.maketrans('', '', '.-/')
+"""Translation table removing the mask characters of both document kinds."""
+
+ENGINES = {CPF: CPF_ENGINE, CNPJ: CNPJ_ENGINE}
+"""Check-digit engine of each document class."""
+
+
+def _classify(doc: str, digit_count: int) -> Type[Union[CPF, CNPJ]]:
+    """Tell the document class of a document string by its mask shape and digit count.
+
+    :param doc: The document string, masked or not.
+    :param digit_count: The number of digits of the document string.
+    :return: CNPJ if the string has a slash or more digits than a CPF, CPF otherwise.
+    """
+    if digit_count > CPF_ENGINE.size or '/' in doc:
+        return CNPJ
+
+    return CPF
+
+
+def detect_document_class(doc: str) -> Type[Union[CPF, CNPJ]]:
+    """
+    Tell whether a document string is a CPF or a CNPJ, without validating it.
+
+    Strings with a slash, as in the CNPJ mask, or with more than 11 digits are CNPJ
+    documents. Any other string is a CPF document, so unmasked CNPJ documents must keep
+    their leading zeros to be told apart. Values that are not strings are told as CPF
+    documents too, and are rejected by its validation.
+
+    Examples:
+        >>> detect_document_class('11.222.333/0001-81')
+        <class 'doc_br.types.cnpj.CNPJ'>
+        >>> detect_document_class('52998224725')
+        <class 'doc_br.types.cpf.CPF'>
+
+    :param doc: The document string, masked or not.
+    :return: The CPF or CNPJ class.
+    """
+    if not isinstance(doc, str):
+        return CPF
+
+    return _classify(doc, sum(map(str.isdigit, doc)))
+
+
+def try_parse_document(doc: str) -> Union[CPF, CNPJ, ParseFailure]:
+    """
+    Classify and parse a CPF or CNPJ document string without raising an exception.
+
+    The mask is stripped once, the kind is told by :func:`detect_document_class` and the
+    check digits are validated only against that kind.
+
+    :param doc: The document string, masked or not.
+    :return: The CPF or CNPJ object, or a falsy ParseFailure carrying the reason why the
+             document string is invalid.
+    """
+    if not doc:
+        return ParseFailure(doc, InvalidReason.INVALID_LENGTH)
+
+    if not isinstance(doc, str):
+        return ParseFailure(doc, InvalidReason.INVALID_CHARACTER)
+
+    plain = doc.translate(_STRIP_TABLE)
+    if not plain:
+        return ParseFailure(doc, InvalidReason.INVALID_LENGTH)
+
+    if not plain.isascii() or not plain.isdigit():
+        return ParseFailure(doc, InvalidReason.INVALID_CHARACTER)
+
+    document_class = _classify(doc, len(plain))
+    engine = ENGINES[document_class]
+    plain = plain.zfill(engine.size)
+    reason = engine.check(plain)
+    if reason is not None:
+        return ParseFailure(doc, reason)
+
+    return document_class._from_plain(plain)
+
+
+def parse_document(doc: str) -> Union[CPF, CNPJ]:
+    """
+    Classify and parse a CPF or CNPJ document string.
+
+    Examples:
+        >>> type(parse_document('529.982.247-25')).__name__
+        'CPF'
+        >>> parse_document('11222333000181').masked
+        '11.222.333/0001-81'
+
+    :param doc: The document string, masked or not.
+    :return: The CPF or CNPJ object.
+    :raises InvalidDocumentError: If the document string is invalid for its kind.
+    """
+    parsed = try_parse_document(doc)
+    if not parsed:
+        raise _engine_of(doc).error(parsed.reason)
+
+    return parsed
+
+
+def parse_documents(docs: Iterable[str]) -> List[Union[CPF, CNPJ, ParseFailure]]:
+    """
+    Classify and parse many CPF or CNPJ document strings.
+
+    With NumPy installed, the documents are classified at once and each kind is validated in
+    bulk, so only the invalid documents are parsed one by one to get their failure reasons.
+
+    :param docs: The document strings, masked or not.
+    :return: The CPF or CNPJ objects, or falsy ParseFailure objects for the invalid document
+             strings, in the same order as the document strings.
+    """
+    docs = docs if isinstance(docs, list) else list(docs)
+
+    try:
+        from doc_br.batch import classify_many, validate_many
+
+        is_cnpj = classify_many(docs, CPF_ENGINE.size)
+    except ImportError:
+        return [try_parse_document(doc) for doc in docs]
+
+    results: List[Union[CPF, CNPJ, ParseFailure, None]] = [None] * len(docs)
+    for document_class, selected in ((CPF, ~is_cnpj), (CNPJ, is_cnpj)):
+        indexes = selected.nonzero()[0].tolist()
+        if not indexes:
+            continue
+
+        valid, plain = validate_many([docs[i] for i in indexes], ENGINES[document_class])
+        from_trusted = document_class.from_trusted
+        for i, is_valid, value in zip(indexes, valid.tolist(), plain.tolist()):
+            results[i] = from_trusted(value) if is_valid else try_parse_document(docs[i])
+
+    return results
+
+
+def _engine_of(doc: str) -> CheckDigitEngine:
+    """Get the check-digit engine of the kind of a document string.
+
+    :param doc: The document string, masked or not.
+    :return: The check-digit engine.
+    """
+    return ENGINES[detect_document_class(doc)]
@@ -1,5 +1,47 @@
+import struct
+import sys
 from abc import ABC, abstractmethod
-from typing import Set
+from array import array
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from doc_br.types.cache import DocumentCache
+
+_TAG_SHIFT = 56
+"""Bit offset of the type tag in the binary form of a document."""
+
+_VALUE_MASK = (1 << _TAG_SHIFT) - 1
+"""Mask of the integer value in the binary form of a document."""
+
+_PACKED = struct.Struct('<Q')
+"""Binary form of a document: a little-endian unsigned 64-bit integer."""
+
+_CLASSES_BY_TAG: Dict[int, Type['Document']] = {}
+"""Document class of each type tag."""
+
+_INTERN_CACHE_LOCK = Lock()
+"""Lock guarding the creation of the intern cache of each document class."""
+
+
+def _restore(cls: Type['Document'], value: int) -> 'Document':
+    """Rebuild a pickled document without validating it again.
+
+    :param cls: The document class.
+    :param value: The integer value of the document.
+    :return: The document object.
+    """
+    return cls._from_int(value)
 
 
 class Document(ABC):
@@ -7,20 +49,46 @@ class Document(ABC):
     Abstract base class for document objects.
 
     Provides methods for sanitizing, masking, unmasking, and validating document strings.
+
+    Documents are stored compactly as a single integer in a slot, the plain document string
+    being derived from it on access. The masked document string is only computed on its first
+    access, by slicing the plain one without validating it again, and then cached.
+
+    Documents are pickled as their class and integer value, and are not validated again when
+    unpickled. Their binary form, see :meth:`to_bytes`, is an unsigned 64-bit little-endian
+    integer holding the type tag of the document class in its most significant byte and the
+    integer value of the document in the others.
     """
 
-    _plain: str = ''
-    _masked: str = ''
+    __slots__ = ('_value', '_masked')
+
+    _PLAIN_DIGITS: int = 0
+    """Number of digits in a document string without mask. Defined by subclasses."""
+
+    _TYPE_TAG: int = 0
+    """Nonzero tag of the document class in the binary form. Defined by subclasses."""
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """Register the type tag of a document class."""
+        super().__init_subclass__(**kwargs)
+
+        tag = cls.__dict__.get('_TYPE_TAG')
+        if tag:
+            _CLASSES_BY_TAG.setdefault(tag, cls)
 
     @property
     def plain(self) -> str:
         """Get the plain document string."""
-        return self._plain
+        return str(self._value).zfill(self._PLAIN_DIGITS)
 
     @property
     def masked(self) -> str:
         """Get the masked document string."""
-        return self._masked
+        try:
+            return self._masked
+        except AttributeError:
+            self._masked = self._mask_valid(self.plain)
+            return self._masked
 
     @abstractmethod
     def sanitize(self, doc: str) -> str:
@@ -64,6 +132,17 @@ class Document(ABC):
         :raises ValueError: If the document string is invalid.
         """
 
+    def _mask_valid(self, plain: str) -> str:
+        """
+        Apply a mask to a plain document string already known to be valid.
+
+        Subclasses may override this method to skip the revalidation done by apply_mask.
+
+        :param plain: The plain document string.
+        :return: The masked document string.
+        """
+        return self.apply_mask(plain)
+
     @staticmethod
     def _validate_input(input_data: str | None, mask_characters: Set[str] | None = None) -> None:
         """
@@ -96,20 +175,217 @@ class Document(ABC):
 
         return doc.zfill(digits)
 
+    @classmethod
+    def intern(cls, doc: str) -> 'Document':
+        """Get a document from the intern cache of the class, building it on a miss.
+
+        Repeated document strings return the same, already validated, document object.
+
+        :param doc: The document string.
+        :return: The document object.
+        :raises ValueError: If the document string is invalid.
+        """
+        return cls.intern_cache().get(doc)
+
+    @classmethod
+    def intern_cache(cls) -> 'DocumentCache':
+        """Get the bounded LRU intern cache of the class, creating it on first use.
+
+        Use it to resize the cache, clear it or read its hit/miss statistics.
+
+        :return: The intern cache of the class.
+        """
+        cache = cls.__dict__.get('_intern_cache')
+        if cache is not None:
+            return cache
+
+        from doc_br.types.cache import DocumentCache
+
+        with _INTERN_CACHE_LOCK:
+            cache = cls.__dict__.get('_intern_cache')
+            if cache is None:
+                cache = DocumentCache(cls)
+                cls._intern_cache = cache
+
+        return cache
+
+    @classmethod
+    def from_trusted(cls, value: Union[str, int]) -> 'Document':
+        """Build a document from a value already known to be valid, skipping validation.
+
+        Use it only for values validated before, such as the ones loaded from a database where
+        they were stored by this library. Leading zeros may be omitted.
+
+        :param value: The plain document string or the integer value of the document.
+        :return: The document object.
+        """
+        return cls._from_int(int(value))
+
+    @classmethod
+    def _from_plain(cls, plain: str) -> 'Document':
+        """Build a document from a plain document string already known to be valid.
+
+        :param plain: The plain document string.
+        :return: The document object.
+        """
+        return cls._from_int(int(plain))
+
+    @classmethod
+    def _from_int(cls, value: int) -> 'Document':
+        """Build a document from its integer value, already known to be valid.
+
+        :param value: The integer value of the document.
+        :return: The document object.
+        """
+        document = cls.__new__(cls)
+        document._value = value
+        return document
+
+    def to_bytes(self) -> bytes:
+        """Get the 8-byte binary form of the document, including its type tag.
+
+        :return: The binary form of the document.
+        """
+        return _PACKED.pack(self._TYPE_TAG << _TAG_SHIFT | self._value)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Document':
+        """Build a document from its binary form, skipping validation of the check digits.
+
+        Called on Document, the document class is chosen by the type tag. Called on a document
+        class, the type tag must be the one of that class.
+
+        :param data: The 8-byte binary form of the document, as made by to_bytes.
+        :return: The document object.
+        :raises ValueError: If the data is not the binary form of a document of the class.
+        """
+        try:
+            (packed,) = _PACKED.unpack(data)
+        except (struct.error, TypeError):
+            raise ValueError(f'Invalid binary {cls.__name__} document.') from None
+
+        document_class, limit = cls._class_of_tag(packed >> _TAG_SHIFT)
+        value = packed & _VALUE_MASK
+        if value >= limit:
+            raise ValueError(f'Invalid binary {cls.__name__} document.')
+
+        return document_class._from_int(value)
+
+    @staticmethod
+    def pack_many(docs: Iterable['Document']) -> bytes:
+        """Get the concatenated binary forms of many documents, of any document classes.
+
+        :param docs: The document objects.
+        :return: The binary forms of the documents, 8 bytes per document.
+        """
+        packed = array('Q', [doc._TYPE_TAG << _TAG_SHIFT | doc._value for doc in docs])
+        if sys.byteorder == 'big':  # pragma: no cover
+            packed.byteswap()
+
+        return packed.tobytes()
+
+    @classmethod
+    def unpack_many(cls, data: bytes) -> List['Document']:
+        """Build many documents from their concatenated binary forms, skipping validation.
+
+        Called on Document, each document class is chosen by its type tag. Called on a
+        document class, all the type tags must be the one of that class.
+
+        :param data: The binary forms of the documents, as made by pack_many.
+        :return: The document objects, in order.
+        :raises ValueError: If the data is not made of binary forms of documents of the class.
+        """
+        if len(data) % _PACKED.size:
+            raise ValueError(f'Invalid binary {cls.__name__} documents.')
+
+        packed = array('Q')
+        packed.frombytes(data)
+        if sys.byteorder == 'big':  # pragma: no cover
+            packed.byteswap()
+
+        classes: Dict[int, Tuple[Type['Document'], int]] = {}
+        documents = []
+        for item in packed:
+            tag = item >> _TAG_SHIFT
+            entry = classes.get(tag)
+            if entry is None:
+                entry = classes[tag] = cls._class_of_tag(tag)
+
+            document_class, limit = entry
+            value = item & _VALUE_MASK
+            if value >= limit:
+                raise ValueError(f'Invalid binary {cls.__name__} documents.')
+
+            document = document_class.__new__(document_class)
+            document._value = value
+            documents.append(document)
+
+        return documents
+
+    @classmethod
+    def _class_of_tag(cls, tag: int) -> Tuple[Type['Document'], int]:
+        """Get the document class of a type tag, which must be the class or one of its subclasses.
+
+        :param tag: The type tag.
+        :return: The document class and the upper bound of its integer values.
+        :raises ValueError: If the type tag is unknown or of another document class.
+        """
+        document_class = _CLASSES_BY_TAG.get(tag)
+        if document_class is not None:
+            if issubclass(cls, document_class):
+                return cls, 10**cls._PLAIN_DIGITS
+            if issubclass(document_class, cls):
+                return document_class, 10**document_class._PLAIN_DIGITS
+
+        raise ValueError(f'Invalid binary {cls.__name__} document type tag: {tag}.')
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> Any:
+        """Get the pydantic v2 core schema of the document class, serialized as plain strings.
+
+        See :mod:`doc_br.pydantic_types` for the masked serialization.
+
+        :param source_type: The document class.
+        :param handler: The pydantic schema handler.
+        :return: The core schema.
+        """
+        from doc_br.pydantic_types import document_core_schema
+
+        return document_core_schema(cls)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the document as its class and integer value, to skip validation on unpickling.
+
+        :return: The function rebuilding the document and its arguments.
+        """
+        return _restore, (self.__class__, self._value)
+
+    def __int__(self) -> int:
+        """Return the integer value of the document.
+
+        :return: The integer value.
+        """
+        return self._value
+
     def __hash__(self) -> int:
         """Return the hash value of the Document object.
 
-        :return: The hash value.
+        :return: The hash value of the integer value of the document.
         """
-        return hash(self._plain)
+        return hash(self._value)
 
-    def __eq__(self, other: 'Document') -> bool:
-        """Check if two CPF objects are equal.
+    def __eq__(self, other: object) -> bool:
+        """Check if two documents are equal.
 
-        :param other: The other CPF object to compare.
+        Documents are equal if they have the same integer value and number of digits.
+
+        :param other: The other document to compare.
         :return: True if the objects are equal, False otherwise.
         """
-        return self._plain == other._plain
+        if not isinstance(other, Document):
+            return NotImplemented
+
+        return self._value == other._value and self._PLAIN_DIGITS == other._PLAIN_DIGITS
 
     def __repr__(self) -> str:
         """Return the string representation of the object.
@@ -124,5 +400,4 @@ class Document(ABC):
         :param doc: The document string.
         :raises ValueError: If the document string is invalid.
         """
-        self._plain = self.sanitize(doc)
-        self._masked = self.apply_mask(self._plain)
+        self._value = int(self.sanitize(doc))
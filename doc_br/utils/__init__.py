@@ -1,3 +1,3 @@
 from .cnpj_utils import CNPJDocumentUtils  # noqa F401
 from .cpf_utils import CPFDocumentUtils  # noqa F401
-from .document_utils import DocumentUtils  # noqa F40
+from .document_utils import DocumentUtils, ValidationResult  # noqa F401
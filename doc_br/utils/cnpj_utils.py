@@ -1,4 +1,5 @@
 from doc_br.types import CNPJ
+from doc_br.types.check_digit import CNPJ_ENGINE
 from doc_br.utils.document_utils import DocumentUtils
 
 
@@ -9,6 +10,9 @@ class CNPJDocumentUtils(DocumentUtils):
     Provides methods for generating, sanitizing, validating, and masking CNPJ document strings.
     """
 
+    document_class = CNPJ
+    _engine = CNPJ_ENGINE
+
     def generate(self, mask: bool = False) -> CNPJ:
         """Generate a random CNPJ document string.
 
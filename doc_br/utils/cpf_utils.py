@@ -1,4 +1,5 @@
 from doc_br.types import CPF
+from doc_br.types.check_digit import CPF_ENGINE
 from doc_br.utils.document_utils import DocumentUtils
 
 
@@ -9,6 +10,9 @@ class CPFDocumentUtils(DocumentUtils):
     Provides methods for generating, sanitizing, validating, and masking CPF document strings.
     """
 
+    document_class = CPF
+    _engine = CPF_ENGINE
+
     def generate(self, mask: bool = False) -> CPF:
         """Generate a random CPF document string.
 
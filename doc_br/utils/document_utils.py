@@ -1,7 +1,82 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Set
+from collections import deque
+from functools import partial
+from inspect import isabstract
+from itertools import islice
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
 
+from doc_br.types.check_digit import (
+    CheckDigitEngine,
+    InvalidReason,
+    ParseFailure,
+)
+from doc_br.types.detect import detect_document_class
 from doc_br.types.doc import Document
+from doc_br.utils.generator import generate_values
+
+
+class ValidationResult(NamedTuple):
+    """Result of validating a single document string in bulk."""
+
+    valid: bool
+    """Whether the document string is valid."""
+
+    plain: Optional[str]
+    """The sanitized document string, or None if the document string is invalid."""
+
+    reason: Optional[InvalidReason]
+    """The reason why the document string is invalid, or None if it is valid."""
+
+
+def _validate_chunk(utils: 'DocumentUtils', docs: List[str]) -> List[ValidationResult]:
+    """Validate a chunk of document strings, collecting the failure reasons.
+
+    :param utils: The document utils used to parse the document strings.
+    :param docs: The document strings to be validated.
+    :return: The validation results, in the same order as the document strings.
+    """
+    results = []
+    for doc in docs:
+        parsed = utils.try_parse(doc)
+        if parsed:
+            results.append(ValidationResult(True, parsed.plain, None))
+        else:
+            results.append(ValidationResult(False, None, parsed.reason))
+
+    return results
+
+
+def _chunked(iterable: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Split an iterable into lists of at most chunk_size items.
+
+    :param iterable: The iterable to be split.
+    :param chunk_size: The maximum number of items per chunk.
+    :return: An iterator over the chunks.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _subclasses(cls: type) -> Iterator[type]:
+    """Walk the subclasses of a class recursively, parents before their own subclasses.
+
+    :param cls: The class.
+    :return: An iterator over the direct and indirect subclasses.
+    """
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
 
 
 class DocumentUtils(ABC):
@@ -13,6 +88,32 @@ class DocumentUtils(ABC):
     these methods to handle specific types of documents.
     """
 
+    document_class: Type[Document]
+    """The document class handled by the utility class."""
+
+    _engine: CheckDigitEngine
+    """The check-digit engine of the document class."""
+
+    @staticmethod
+    def for_document(doc: str) -> 'DocumentUtils':
+        """
+        Get the document utils of the kind of a document string, CPF or CNPJ.
+
+        The kind is told by the mask shape and the digit count of the document string, see
+        :func:`doc_br.types.detect.detect_document_class`. The string is not validated.
+
+        :param doc: The document string, masked or not.
+        :return: The CPF or CNPJ document utils.
+        """
+        document_class = detect_document_class(doc)
+        for utils_class in _subclasses(DocumentUtils):
+            if isabstract(utils_class):
+                continue
+            if getattr(utils_class, 'document_class', None) is document_class:
+                return utils_class()
+
+        raise TypeError(f'No document utils for {document_class.__name__} documents.')
+
     @abstractmethod
     def sanitize(self, doc: str) -> str:
         """
@@ -52,6 +153,16 @@ class DocumentUtils(ABC):
         :raises ValueError: If the document is invalid.
         """
 
+    def try_parse(self, doc: str) -> Union[Document, ParseFailure]:
+        """
+        Parse the document string without raising an exception.
+
+        :param doc: The document string to be parsed.
+        :return: The document, or a falsy ParseFailure carrying the reason why the
+                 document string is invalid.
+        """
+        return self.document_class.try_parse(doc)
+
     @abstractmethod
     def generate(self) -> Document:
         """
@@ -60,16 +171,102 @@ class DocumentUtils(ABC):
         :return: The generated document.
         """
 
-    def generate_documents(self, n: int = 1) -> Set[Document]:
+    def generate_documents(self, n: int = 1, seed: Optional[int] = None) -> Set[Document]:
         """
-        Generate a set of documents.
+        Generate a set of unique documents.
 
         :param n: The number of documents to generate. Default to 1.
+        :param seed: The seed of the random generator, for reproducible documents.
         :return: A set of generated documents.
+        :raises ValueError: If n is negative or larger than the number of possible documents.
         """
-        docs = set()
+        return set(self.iter_documents(n, seed))
+
+    def iter_documents(self, n: int, seed: Optional[int] = None) -> Iterator[Document]:
+        """
+        Lazily generate unique documents.
+
+        Base numbers are drawn without replacement and check digits are computed in bulk, so
+        no document is validated again nor remembered to avoid duplicates.
+
+        :param n: The number of documents to generate.
+        :param seed: The seed of the random generator, for reproducible documents.
+        :return: An iterator over the generated documents.
+        :raises ValueError: If n is negative or larger than the number of possible documents.
+        """
+        from_int = self.document_class._from_int
+        return map(from_int, generate_values(self._engine, n, seed))
+
+    def validate_bulk(
+        self, docs: Iterable[str], workers: Optional[int] = None, chunk_size: int = 10000
+    ) -> List[ValidationResult]:
+        """
+        Validate many document strings in parallel using a pool of processes.
+
+        The document strings are split into chunks of chunk_size items, each chunk being
+        validated by a worker process. Invalid document strings do not raise, their
+        results carry the reason why they are invalid instead.
+
+        :param docs: The document strings to be validated.
+        :param workers: The number of worker processes. Default to the number of CPUs.
+                        If 1, the documents are validated in the current process.
+        :param chunk_size: The number of document strings sent to a worker at once.
+        :return: The validation results, in the same order as the document strings.
+        :raises ValueError: If workers or chunk_size is not positive.
+        """
+        return list(self.iter_validate_bulk(docs, workers, chunk_size))
+
+    def iter_validate_bulk(
+        self, docs: Iterable[str], workers: Optional[int] = None, chunk_size: int = 10000
+    ) -> Iterator[ValidationResult]:
+        """
+        Lazily validate many document strings in parallel using a pool of processes.
+
+        Like validate_bulk, but the results are yielded as soon as their chunk is validated
+        and the document strings are read lazily, at most two chunks per worker being in
+        flight. Memory usage does not depend on the number of document strings.
+
+        :param docs: The document strings to be validated.
+        :param workers: The number of worker processes. Default to the number of CPUs.
+                        If 1, the documents are validated in the current process.
+        :param chunk_size: The number of document strings sent to a worker at once.
+        :return: An iterator over the validation results, in the same order as the document
+                 strings.
+        :raises ValueError: If workers or chunk_size is not positive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or chunk_size < 1:
+            raise ValueError('workers and chunk_size must be positive.')
+
+        return self._iter_validate_bulk(docs, workers, chunk_size)
+
+    def _iter_validate_bulk(
+        self, docs: Iterable[str], workers: int, chunk_size: int
+    ) -> Iterator[ValidationResult]:
+        """Lazily validate many document strings in parallel using a pool of processes.
+
+        :param docs: The document strings to be validated.
+        :param workers: The number of worker processes.
+        :param chunk_size: The number of document strings sent to a worker at once.
+        :return: An iterator over the validation results.
+        """
+        validate = partial(_validate_chunk, self)
+        chunks = _chunked(docs, chunk_size)
+
+        if workers == 1:
+            for chunk_results in map(validate, chunks):
+                yield from chunk_results
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
 
-        while len(docs) < n:
-            docs.add(self.generate())
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(validate, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
 
-        return docs
+            while pending:
+                yield from pending.popleft().result()
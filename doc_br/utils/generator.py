@@ -0,0 +1,142 @@
+import random
+from math import gcd
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+from doc_br.types.check_digit import CheckDigitEngine
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_CHUNK_SIZE = 65536
+"""Number of documents generated at once when NumPy is available."""
+
+
+def _affine_permutation(space: int, rng: random.Random) -> tuple:
+    """Draw the parameters of a random affine permutation x -> (a * x + c) % space.
+
+    The multiplier is kept below 2**24, so a * x never overflows 64 bits for the base numbers
+    of CPF and CNPJ documents.
+
+    :param space: The number of values to be permuted.
+    :param rng: The random generator.
+    :return: The multiplier and the increment of the permutation.
+    """
+    while True:
+        multiplier = rng.randrange(2**23, 2**24)
+        if gcd(multiplier, space) == 1:
+            return multiplier, rng.randrange(space)
+
+
+def _python_chunk(engine: CheckDigitEngine, bases: List[int], rng: random.Random) -> List[int]:
+    """Compute the documents of a chunk of base numbers in pure Python.
+
+    :param engine: The check-digit engine of the document type.
+    :param bases: The base numbers.
+    :param rng: The random generator used to shuffle the documents.
+    :return: The integer values of the valid documents, shuffled.
+    """
+    width = engine.size - 2
+    values = []
+    for base in bases:
+        plain = str(base).zfill(width)
+        plain += engine.compute_check_digits(plain)
+        if plain != plain[0] * engine.size:
+            values.append(int(plain))
+
+    rng.shuffle(values)
+    return values
+
+
+def _numpy_chunk(
+    engine: CheckDigitEngine, bases: 'np.ndarray', rng: 'np.random.Generator'
+) -> List[int]:
+    """Compute the documents of a chunk of base numbers as weighted sums over a digit matrix.
+
+    :param engine: The check-digit engine of the document type.
+    :param bases: The base numbers, as a uint64 array.
+    :param rng: The random generator used to shuffle the documents.
+    :return: The integer values of the valid documents, shuffled.
+    """
+    import numpy as np
+
+    from doc_br.batch import mod11_check_digits
+
+    powers = 10 ** np.arange(engine.size - 3, -1, -1, dtype=np.uint64)
+    digits = ((bases[:, None] // powers) % 10).astype(np.int64)
+
+    weights = np.asarray(engine.weights, dtype=np.int64)
+    first = mod11_check_digits(digits @ weights[1:])
+    second = mod11_check_digits(digits @ weights[:-1] + first * weights[-1])
+
+    repeated = (digits == digits[:, :1]).all(axis=1) & (first == digits[:, 0])
+    repeated &= second == digits[:, 0]
+
+    values = (bases * 100 + (first * 10 + second).astype(np.uint64))[~repeated]
+    rng.shuffle(values)
+    return values.tolist()
+
+
+def generate_values(
+    engine: CheckDigitEngine, n: int, seed: Optional[int] = None, chunk_size: int = _CHUNK_SIZE
+) -> Iterator[int]:
+    """
+    Lazily generate the integer values of n unique valid documents.
+
+    Base numbers are drawn without replacement through a random affine permutation of all the
+    possible base numbers, so no generated document needs to be remembered to avoid
+    duplicates. Each chunk is shuffled to hide the stride of the permutation, which is fit
+    for test data but not for cryptographic purposes. Check digits are computed in bulk with
+    NumPy when it is installed.
+
+    :param engine: The check-digit engine of the document type.
+    :param n: The number of documents to generate.
+    :param seed: The seed of the random generator, for reproducible sequences.
+    :param chunk_size: The number of documents computed at once.
+    :return: An iterator over the integer values of the documents.
+    :raises ValueError: If n is negative or larger than the number of possible documents.
+    """
+    space = 10 ** (engine.size - 2)
+    if n < 0 or n > space - 10:
+        raise ValueError(f'Cannot generate {n} unique {engine.name} documents.')
+
+    return _generate_values(engine, n, random.Random(seed), chunk_size)
+
+
+def _generate_values(
+    engine: CheckDigitEngine, n: int, rng: random.Random, chunk_size: int
+) -> Iterator[int]:
+    """Lazily generate the integer values of n unique valid documents.
+
+    :param engine: The check-digit engine of the document type.
+    :param n: The number of documents to generate.
+    :param rng: The random generator.
+    :param chunk_size: The number of documents computed at once.
+    :return: An iterator over the integer values of the documents.
+    """
+    space = 10 ** (engine.size - 2)
+    multiplier, increment = _affine_permutation(space, rng)
+
+    # NumPy is slow to import, so it is only imported once documents are generated.
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    np_rng = np.random.default_rng(rng.getrandbits(64)) if np is not None else None
+    remaining = n
+    start = 0
+
+    while remaining > 0:
+        stop = min(start + remaining + 10, start + chunk_size, space)
+
+        if np is not None:
+            bases = np.arange(start, stop, dtype=np.uint64)
+            bases = (bases * np.uint64(multiplier) + np.uint64(increment)) % np.uint64(space)
+            values = _numpy_chunk(engine, bases, np_rng)
+        else:
+            bases = [(multiplier * x + increment) % space for x in range(start, stop)]
+            values = _python_chunk(engine, bases, rng)
+
+        yield from values[:remaining]
+        remaining -= min(len(values), remaining)
+        start = stop
@@ -9,4 +9,10 @@ setup(
     description='A library for handling and validating Brazilian CPF and CNPJ documents',
     packages=find_packages(),
     install_requires=['validate-docbr', 'SQLAlchemy'],
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['numpy', 'pandas>=2.0', 'pyarrow'],
+        'pydantic': ['pydantic>=2'],
+    },
+    entry_points={'console_scripts': ['doc-br = doc_br.cli:main']},
 )
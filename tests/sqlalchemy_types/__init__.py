@@ -1,2 +1,6 @@
+from .test_functions import *  # noqa F401
+from .test_bulk import *  # noqa F401
+from .test_big_integer_type_decorator import *  # noqa F401
 from .test_cnpj_type_decorator import *  # noqa F401
 from .test_cpf_type_decorator import *  # noqa F401
+from .test_cpf_or_cnpj_type_decorator import *  # noqa F401
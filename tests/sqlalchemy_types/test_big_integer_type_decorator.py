@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import Column, Integer, create_engine, select, text
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from doc_br.sqlalchemy_types import CNPJBigIntegerTypeDecorator, CPFBigIntegerTypeDecorator
+from doc_br.types import CNPJ, CPF
+
+Base = declarative_base()
+
+
+class BigIntegerTable(Base):
+    __tablename__ = 'big_integer_table'
+    id = Column(Integer, primary_key=True)
+    cpf = Column(CPFBigIntegerTypeDecorator)
+    cnpj = Column(CNPJBigIntegerTypeDecorator)
+
+
+@pytest.fixture(scope="module")
+def test_db():
+    engine = create_engine('sqlite:///:memory:')
+    session_maker = sessionmaker(bind=engine)
+    session = session_maker()
+    Base.metadata.create_all(engine)
+    session.add(BigIntegerTable(id=1, cpf=CPF('003.372.319-23'), cnpj=CNPJ('00.000.000/0001-91')))
+    session.commit()
+    return session
+
+
+def test_process_bind_param(test_db):
+    row = test_db.execute(text("SELECT cpf, cnpj FROM big_integer_table WHERE id=1")).first()
+    assert row == (337231923, 191)
+
+
+def test_process_result_value(test_db):
+    row = test_db.get(BigIntegerTable, 1)
+    assert row.cpf == CPF('00337231923')
+    assert row.cpf.plain == '00337231923'
+    assert row.cnpj.masked == '00.000.000/0001-91'
+
+
+def test_comparator_normalizes_literals(test_db):
+    query = select(BigIntegerTable.id)
+    assert test_db.scalar(query.where(BigIntegerTable.cpf == '003.372.319-23')) == 1
+    assert test_db.scalar(query.where(BigIntegerTable.cpf == CPF('337231923'))) == 1
+    assert test_db.scalar(query.where(BigIntegerTable.cnpj.in_(['191', '11222333000181']))) == 1
+    assert test_db.scalar(query.where(BigIntegerTable.cpf != '529.982.247-25')) == 1
+
+    with pytest.raises(ValueError):
+        BigIntegerTable.cpf == '111.111.111-11'
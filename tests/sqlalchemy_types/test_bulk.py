@@ -0,0 +1,70 @@
+import warnings
+
+import pytest
+from sqlalchemy import Column, Integer, String, cast, create_engine, literal, select
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from doc_br.sqlalchemy_types import (
+    CNPJBigIntegerTypeDecorator,
+    CPFTypeDecorator,
+    bulk_insert_documents,
+)
+from doc_br.types import CNPJ, CPF
+
+Base = declarative_base()
+
+
+class BulkTable(Base):
+    __tablename__ = 'bulk_table'
+    id = Column(Integer, primary_key=True)
+    source = Column(String)
+    cpf = Column(CPFTypeDecorator)
+    cnpj = Column(CNPJBigIntegerTypeDecorator)
+
+
+@pytest.fixture
+def test_db():
+    engine = create_engine('sqlite:///:memory:')
+    session = sessionmaker(bind=engine)()
+    Base.metadata.create_all(engine)
+    return session
+
+
+def test_bulk_insert_documents(test_db):
+    docs = ['529.982.247-25', CPF('337231923'), '111.111.111-11']
+
+    with pytest.raises(ValueError):
+        bulk_insert_documents(test_db, BulkTable, 'cpf', docs)
+
+    inserted = bulk_insert_documents(
+        test_db, BulkTable, BulkTable.cpf, docs, {'source': 'a'}, chunk_size=2, skip_invalid=True
+    )
+
+    assert inserted == 2
+    rows = test_db.execute(select(BulkTable.source, BulkTable.cpf)).all()
+    assert rows == [('a', CPF('52998224725')), ('a', CPF('00337231923'))]
+
+
+def test_bulk_insert_big_integer_column(test_db):
+    assert bulk_insert_documents(test_db.connection(), BulkTable.__table__, 'cnpj', ['191']) == 1
+    assert test_db.scalar(select(BulkTable.cnpj)) == CNPJ('00.000.000/0001-91')
+
+    with pytest.raises(TypeError):
+        bulk_insert_documents(test_db, BulkTable, 'source', ['191'])
+
+
+def test_statements_are_cacheable(test_db):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        test_db.execute(select(BulkTable).where(BulkTable.cpf == CPF('337231923'))).all()
+
+    assert CPFTypeDecorator(strict=True)._static_cache_key != CPFTypeDecorator()._static_cache_key
+
+
+def test_cache_key_depends_on_length():
+    value = literal('52998224725')
+    short = select(cast(value, CPFTypeDecorator(5)))
+    long = select(cast(value, CPFTypeDecorator(40)))
+
+    assert short._generate_cache_key() != long._generate_cache_key()
+    assert CPFTypeDecorator(5)._static_cache_key == CPFTypeDecorator(5)._static_cache_key
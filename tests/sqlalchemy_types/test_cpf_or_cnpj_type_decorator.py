@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import Column, Integer, create_engine, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from doc_br.sqlalchemy_types import (
+    CPFOrCNPJTypeDecorator,
+    bulk_insert_documents,
+    install_sqlite_functions,
+    is_valid_cpf_or_cnpj,
+)
+from doc_br.types import CNPJ, CPF
+
+Base = declarative_base()
+
+
+class CustomerTable(Base):
+    __tablename__ = 'customer_table'
+    id = Column(Integer, primary_key=True)
+    documento = Column(CPFOrCNPJTypeDecorator(14, create_constraint=True))
+    strict_documento = Column(CPFOrCNPJTypeDecorator(14, strict=True))
+    legacy_documento = Column(CPFOrCNPJTypeDecorator(14))
+
+
+@pytest.fixture
+def test_db():
+    engine = create_engine('sqlite:///:memory:')
+    install_sqlite_functions(engine)
+    session = sessionmaker(bind=engine)()
+    Base.metadata.create_all(engine)
+    return session
+
+
+def test_round_trip(test_db):
+    cpf = CPF('337231923')
+    cnpj = CNPJ('191')
+    test_db.add_all([
+        CustomerTable(id=1, documento=cpf, strict_documento=cpf),
+        CustomerTable(id=2, documento=cnpj, strict_documento=cnpj),
+    ])
+    test_db.commit()
+
+    stored = test_db.execute(text("SELECT documento FROM customer_table ORDER BY id")).all()
+    assert stored == [('00337231923',), ('00000000000191',)]
+
+    test_db.expire_all()
+    rows = test_db.scalars(select(CustomerTable).order_by(CustomerTable.id)).all()
+    assert [type(row.documento) for row in rows] == [CPF, CNPJ]
+    assert [row.documento for row in rows] == [cpf, cnpj]
+    assert [row.strict_documento for row in rows] == [cpf, cnpj]
+
+    query = select(CustomerTable.id).where(CustomerTable.documento == cnpj)
+    assert test_db.scalars(query).all() == [2]
+
+
+def test_loads_documents_without_leading_zeros(test_db):
+    for i, value in enumerate(['337231923', '11222333000181']):
+        test_db.execute(
+            text(f"INSERT INTO customer_table (id, legacy_documento) VALUES ({i}, '{value}')")
+        )
+
+    rows = test_db.scalars(select(CustomerTable).order_by(CustomerTable.id)).all()
+    assert [row.legacy_documento for row in rows] == [CPF('337231923'), CNPJ('11222333000181')]
+
+
+def test_check_constraint(test_db):
+    for value in ['11111111111', '52998224724', '11222333000180', '5299822472']:
+        with pytest.raises(IntegrityError):
+            test_db.execute(text(f"INSERT INTO customer_table (documento) VALUES ('{value}')"))
+        test_db.rollback()
+
+    test_db.execute(text(
+        "INSERT INTO customer_table (id, documento) VALUES (1, '52998224725'), "
+        "(2, '11222333000181'), (3, NULL)"
+    ))
+    query = select(CustomerTable.id).where(is_valid_cpf_or_cnpj(CustomerTable.documento))
+    assert test_db.scalars(query).all() == [1, 2]
+
+
+def test_check_constraint_ddl():
+    ddl = str(CreateTable(CustomerTable.__table__).compile(dialect=postgresql.dialect()))
+
+    assert 'CONSTRAINT ck_customer_table_documento_valid CHECK (CASE WHEN' in ddl
+
+
+def test_bulk_insert(test_db):
+    docs = ['529.982.247-25', CNPJ('191'), '11.222.333/0001-81', '111.111.111-11']
+
+    with pytest.raises(ValueError, match='CPF'):
+        bulk_insert_documents(test_db, CustomerTable, 'documento', docs)
+
+    inserted = bulk_insert_documents(test_db, CustomerTable, 'documento', docs, skip_invalid=True)
+    assert inserted == 3
+    assert [type(d) for d in test_db.scalars(select(CustomerTable.documento))] == [CPF, CNPJ, CNPJ]
@@ -47,3 +47,25 @@ def test_process_result_value(test_db):
 
     row = session.get(CPFTable, 2)
     assert row.cpf == CPF(cpf.plain)
+
+
+class StrictCPFTable(Base):
+    __tablename__ = 'strict_cpf_table'
+    id = Column(Integer, primary_key=True)
+    cpf = Column(CPFTypeDecorator(strict=True))
+
+
+def test_trusted_and_strict_loading(test_db):
+    session = test_db
+    session.execute(text("INSERT INTO cpf_table (id, cpf) VALUES (3, '337231923')"))
+    session.execute(text("INSERT INTO strict_cpf_table (id, cpf) VALUES (1, '11111111111')"))
+
+    assert session.get(CPFTable, 3).cpf.plain == '00337231923'
+
+    with pytest.raises(ValueError):
+        session.get(StrictCPFTable, 1)
+
+
+def test_from_trusted():
+    assert CPF.from_trusted('337231923') == CPF('003.372.319-23')
+    assert CPF.from_trusted(337231923).masked == '003.372.319-23'
@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Integer,
+    String,
+    create_engine,
+    literal,
+    select,
+    text,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from doc_br.sqlalchemy_types import CNPJBigIntegerTypeDecorator, CPFTypeDecorator
+from doc_br.sqlalchemy_types.functions import (
+    cpf_or_cnpj_check_expression,
+    document_check_expression,
+    install_sqlite_functions,
+    is_valid_cpf,
+)
+from doc_br.types import CNPJ, CPF
+from doc_br.types.check_digit import CNPJ_ENGINE, CPF_ENGINE
+
+Base = declarative_base()
+
+
+class CheckedTable(Base):
+    __tablename__ = 'checked_table'
+    id = Column(Integer, primary_key=True)
+    cpf = Column(CPFTypeDecorator(create_constraint=True))
+    cnpj = Column(CNPJBigIntegerTypeDecorator(create_constraint=True))
+
+
+@pytest.fixture
+def test_db():
+    engine = create_engine('sqlite:///:memory:')
+    install_sqlite_functions(engine)
+    session = sessionmaker(bind=engine)()
+    Base.metadata.create_all(engine)
+    return session
+
+
+def test_check_constraint_rejects_invalid_documents(test_db):
+    test_db.add(CheckedTable(id=1, cpf=CPF('529.982.247-25'), cnpj=CNPJ('11.222.333/0001-81')))
+    test_db.commit()
+
+    for values in ["'11111111111', 191", "'52998224725', 11222333000180", "'5299822472', 191"]:
+        with pytest.raises(IntegrityError):
+            test_db.execute(text(f"INSERT INTO checked_table (cpf, cnpj) VALUES ({values})"))
+        test_db.rollback()
+
+    test_db.execute(text("INSERT INTO checked_table (id, cpf, cnpj) VALUES (2, NULL, 191)"))
+    assert test_db.scalars(select(CheckedTable.id).where(is_valid_cpf(CheckedTable.cpf))).all() == [1]
+
+
+@pytest.mark.parametrize("engine, value, expected", [
+    (CPF_ENGINE, literal('52998224725'), True),
+    (CPF_ENGINE, literal('52998224724'), False),
+    (CPF_ENGINE, literal('11111111111'), False),
+    (CPF_ENGINE, literal('5299822472'), False),
+    (CNPJ_ENGINE, literal(191, BigInteger()), True),
+    (CNPJ_ENGINE, literal(11222333000180, BigInteger()), False),
+    (CNPJ_ENGINE, literal(0, BigInteger()), False),
+    (CPF_ENGINE, literal(None, String()), None),
+    (CNPJ_ENGINE, literal(None, BigInteger()), None),
+])
+def test_portable_expression(test_db, engine, value, expected):
+    assert test_db.scalar(select(document_check_expression(engine, value))) is expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ('52998224725', True),
+    ('11222333000181', True),
+    ('11222333000180', False),
+    ('5299822472', False),
+    (None, None),
+])
+def test_portable_cpf_or_cnpj_expression(test_db, value, expected):
+    expression = cpf_or_cnpj_check_expression(literal(value, String()))
+    assert test_db.scalar(select(expression)) is expected
+
+
+def test_check_constraint_ddl():
+    ddl = str(CreateTable(CheckedTable.__table__).compile(dialect=postgresql.dialect()))
+
+    assert 'CONSTRAINT ck_checked_table_cpf_valid CHECK (length(cpf) = 11' in ddl
+    assert 'CONSTRAINT ck_checked_table_cnpj_valid CHECK' in ddl
@@ -0,0 +1,43 @@
+import pytest
+import validate_docbr
+
+from doc_br.types import CNPJ, CPF
+
+np = pytest.importorskip('numpy')
+
+
+def test_validate_many_cpf():
+    valid, plain = CPF.validate_many(
+        ['529.982.247-25', '337231923', '11111111111', None, '', 'abc', '52998224724']
+    )
+    assert valid.tolist() == [True, True, False, False, False, False, False]
+    assert plain.tolist() == ['52998224725', '00337231923', '', '', '', '', '']
+
+
+def test_validate_many_cnpj_matches_constructor():
+    docs = [validate_docbr.CNPJ().generate(mask=True) for _ in range(100)]
+    docs += ['11.111.111/1111-11', '12.345.678/9012-34', '1234567890123456']
+    valid, plain = CNPJ.validate_many(np.array(docs))
+
+    for doc, is_valid, plain_doc in zip(docs, valid, plain):
+        try:
+            expected = CNPJ(doc).plain
+        except ValueError:
+            expected = ''
+        assert bool(is_valid) is bool(expected)
+        assert plain_doc == expected
+
+
+def test_validate_many_empty_input():
+    valid, plain = CPF.validate_many([])
+    assert valid.size == 0
+    assert plain.size == 0
+
+
+def test_validate_many_rejects_non_strings():
+    valid, plain = CPF.validate_many([52998224725, b'52998224725', '52998224725'])
+    assert valid.tolist() == [False, False, True]
+    assert plain.tolist() == ['', '', '52998224725']
+
+    valid, _ = CPF.validate_many(np.array([52998224725, 33723192300]))
+    assert not valid.any()
@@ -0,0 +1,105 @@
+import io
+import sys
+
+import pytest
+
+from doc_br.cli import main
+
+
+@pytest.fixture
+def lines(tmp_path):
+    path = tmp_path / 'docs.txt'
+    path.write_text('529.982.247-25\n52998224725\n\n123.456.789-01\n11111111111\n337231923\n')
+    return str(path)
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / 'docs.csv'
+    path.write_text('name;cpf\na;529.982.247-25\nb;52998224725\nc;x\nd;337231923\n')
+    return str(path)
+
+
+def test_validate(lines, capsys):
+    assert main(['validate', '-w', '1', lines]) == 1
+
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [
+        '529.982.247-25,valid,',
+        '52998224725,valid,',
+        '123.456.789-01,invalid,INVALID_CHECK_DIGITS',
+        '11111111111,invalid,REPEATED_DIGITS',
+        '337231923,valid,',
+    ]
+    assert 'total: 5\nvalid: 3\ninvalid: 2\n' in err
+
+
+def test_validate_invalid_only_exits_zero_when_all_valid(tmp_path, capsys):
+    path = tmp_path / 'docs.txt'
+    path.write_text('11.222.333/0001-81\n')
+
+    assert main(['validate', '-k', 'cnpj', '--invalid-only', '-q', str(path)]) == 0
+    assert capsys.readouterr() == ('', '')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_dedupe_masked(lines, capsys, workers):
+    assert main(['dedupe', '-m', '-w', str(workers), '--chunk-size', '1', lines]) == 0
+
+    out, err = capsys.readouterr()
+    assert out.splitlines() == ['529.982.247-25', '003.372.319-23']
+    assert 'duplicates: 1' in err
+
+
+def test_normalize_csv_column(table, tmp_path, capsys):
+    output = tmp_path / 'out.csv'
+    args = ['normalize', '-c', 'cpf', '-d', ';', '-w', '1', '-q', '-o', str(output), table]
+    assert main(args) == 0
+
+    assert output.read_text().splitlines() == [
+        'name;cpf', 'a;52998224725', 'b;52998224725', 'd;00337231923'
+    ]
+
+
+def test_normalize_keep_invalid_column_index(tmp_path, capsys):
+    path = tmp_path / 'docs.csv'
+    path.write_text('x,529.982.247-25\ny,bad\n')
+
+    assert main(['normalize', '-c', '1', '-m', '-w', '1', '-q', '--keep-invalid', str(path)]) == 0
+    assert capsys.readouterr().out.splitlines() == ['x,529.982.247-25', 'y,bad']
+
+
+def test_missing_column(table, capsys):
+    assert main(['normalize', '-c', 'cnpj', '-w', '1', table]) == 2
+    assert 'not found' in capsys.readouterr().err
+
+
+def test_normalize_writes_the_header_once(table, capsys):
+    assert main(['normalize', '-c', 'cpf', '-d', ';', '-w', '1', '-q', table, table]) == 0
+
+    out = capsys.readouterr().out.splitlines()
+    assert out.count('name;cpf') == 1
+    assert len(out) == 7
+
+
+def test_unwritable_output(lines, tmp_path, capsys):
+    output = tmp_path / 'missing' / 'out.csv'
+    assert main(['validate', '-w', '1', '-o', str(output), lines]) == 2
+    assert capsys.readouterr().err.startswith('doc-br: error:')
+
+
+def test_different_headers(table, tmp_path, capsys):
+    other = tmp_path / 'other.csv'
+    other.write_text('cpf;name\n529.982.247-25;a\n')
+
+    assert main(['normalize', '-c', 'cpf', '-d', ';', '-w', '1', table, str(other)]) == 2
+    assert 'headers of the input files differ' in capsys.readouterr().err
+
+
+def test_stdin_is_left_open(monkeypatch, capsys):
+    stdin = io.TextIOWrapper(io.BytesIO(b'529.982.247-25\n'))
+    monkeypatch.setattr(sys, 'stdin', stdin)
+
+    assert main(['validate', '-w', '1', '-q']) == 0
+    assert capsys.readouterr().out == '529.982.247-25,valid,\n'
+    assert not stdin.buffer.closed
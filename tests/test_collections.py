@@ -0,0 +1,54 @@
+import pytest
+
+import doc_br.collections
+from doc_br.collections import CNPJArray, CPFArray
+from doc_br.types import CPF
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'pure-python'])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(doc_br.collections, 'np', None)
+    elif doc_br.collections.np is None:
+        pytest.skip('NumPy is not installed')
+
+
+def test_append_and_membership(use_numpy):
+    cpfs = CPFArray(['529.982.247-25', '52998224725'])
+    cpfs.append(CPF('337231923'))
+
+    assert len(cpfs) == 2
+    assert '003.372.319-23' in cpfs
+    assert CPF('529.982.247-25') in cpfs
+    assert '111.111.111-11' not in cpfs
+    assert 52998224725 not in cpfs
+    assert list(cpfs) == [CPF('337231923'), CPF('52998224725')]
+    assert cpfs[1].masked == '529.982.247-25'
+
+
+def test_extend_is_atomic(use_numpy):
+    cpfs = CPFArray(['529.982.247-25'])
+    with pytest.raises(ValueError):
+        cpfs.extend(['337231923', '111.111.111-11'])
+
+    assert list(cpfs) == [CPF('529.982.247-25')]
+
+
+def test_set_operations(use_numpy):
+    docs = [CPF.generate() for _ in range(6)]
+    left = CPFArray(docs[:4])
+    right = CPFArray(doc.masked for doc in docs[2:])
+
+    assert set(left | right) == set(docs)
+    assert set(left & right) == set(docs[2:4])
+    assert set(left - right) == set(docs[:2])
+    assert left.union(CPFArray()) == left
+    assert len(CPFArray() & left) == 0
+
+
+def test_mixed_document_types():
+    with pytest.raises(TypeError):
+        CPFArray() | CNPJArray()
+
+    assert CPFArray() != CNPJArray()
+    assert '11.222.333/0001-81' in CNPJArray(['11222333000181'])
@@ -0,0 +1,68 @@
+import os
+import random
+from collections import Counter
+
+import pytest
+
+import doc_br.dedup
+from doc_br.dedup import DocumentCount, Deduplicator, deduplicate_files
+from doc_br.utils import CNPJDocumentUtils, CPFDocumentUtils
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'pure-python'])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(doc_br.dedup, 'np', None)
+    elif doc_br.dedup.np is None:
+        pytest.skip('NumPy is not installed')
+
+
+def _dataset(utils, unique, total, seed=0):
+    rng = random.Random(seed)
+    docs = list(utils.iter_documents(unique, seed=seed))
+    rows = [rng.choice(docs) for _ in range(total)]
+    strings = [doc.masked if rng.random() < 0.5 else doc.plain.lstrip('0') for doc in rows]
+    return strings, Counter(doc.plain for doc in rows)
+
+
+@pytest.mark.parametrize("run_size, fanout", [(10**6, 64), (37, 2), (100, 3)])
+def test_matches_in_memory_counting(use_numpy, tmp_path, run_size, fanout):
+    strings, expected = _dataset(CPFDocumentUtils(), 300, 2000)
+    strings += ['111.111.111-11', 'abc', '529.982.247-24']
+
+    with Deduplicator('CPF', run_size, fanout, temp_dir=tmp_path) as dedup:
+        dedup.add(strings[:1000])
+        dedup.add(iter(strings[1000:]))
+        result = list(dedup)
+
+        assert result == [DocumentCount(plain, expected[plain]) for plain in sorted(expected)]
+        assert list(dedup) == result
+        assert (dedup.total, dedup.invalid) == (2003, 3)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_deduplicate_files(tmp_path):
+    strings, expected = _dataset(CNPJDocumentUtils(), 50, 400, seed=1)
+    paths = []
+    for i in range(4):
+        path = tmp_path / f'part-{i}.txt'
+        path.write_text('\n'.join(strings[i::4]) + '\n\n', encoding='utf-8')
+        paths.append(path)
+
+    result = list(deduplicate_files(paths, kind='cnpj', run_size=25, fanout=2, temp_dir=tmp_path))
+
+    assert {entry.plain: entry.count for entry in result} == expected
+    assert sum(entry.duplicates for entry in result) == 400 - len(expected)
+    assert sorted(os.listdir(tmp_path)) == [f'part-{i}.txt' for i in range(4)]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        Deduplicator('rg')
+
+    with pytest.raises(ValueError):
+        Deduplicator(run_size=0)
+
+    with pytest.raises(ValueError):
+        deduplicate_files([], fanout=1)
@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import doc_br
+
+_HEAVY_MODULES = ['numpy', 'pandas', 'pydantic', 'sqlalchemy', 'validate_docbr',
+                  'concurrent.futures.process']
+
+
+def _run(code):
+    command = [sys.executable, '-c', code]
+    return subprocess.run(command, capture_output=True, text=True, check=True).stdout
+
+
+@pytest.mark.parametrize("statement", [
+    'import doc_br',
+    'import doc_br.types',
+    'from doc_br import CPF, CNPJDocumentUtils',
+    'from doc_br.types import parse_document',
+])
+def test_import_does_not_load_heavy_dependencies(statement):
+    stdout = _run(f'{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))')
+    loaded = set(json.loads(stdout))
+
+    assert [module for module in _HEAVY_MODULES if module in loaded] == []
+
+
+def test_sqlalchemy_types_do_not_load_the_orm():
+    stdout = _run(
+        'from doc_br.sqlalchemy_types import CPFTypeDecorator\n'
+        'import sys\nprint("sqlalchemy.orm" in sys.modules)'
+    )
+    assert stdout.strip() == 'False'
+
+
+def test_lazy_attributes():
+    from doc_br import types, utils
+
+    assert doc_br.CPF is types.CPF
+    assert doc_br.CPFDocumentUtils is utils.CPFDocumentUtils
+    assert doc_br.scan.find_documents
+    assert {'CPF', 'CNPJ', 'DocumentUtils', 'sqlalchemy_types'} <= set(dir(doc_br))
+
+    with pytest.raises(AttributeError):
+        doc_br.missing
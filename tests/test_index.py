@@ -0,0 +1,119 @@
+import multiprocessing
+
+import pytest
+
+from doc_br.index import CNPJIndex, CPFIndex, open_index
+from doc_br.types import CPF, InvalidDocumentError, InvalidReason
+from doc_br.utils import CPFDocumentUtils
+
+
+@pytest.fixture
+def cpfs():
+    return list(CPFDocumentUtils().iter_documents(2000, seed=0))
+
+
+@pytest.fixture
+def others():
+    return [doc for doc in CPFDocumentUtils().iter_documents(2000, seed=1)]
+
+
+@pytest.mark.parametrize('bloom', [0.01, None])
+def test_build_and_lookup(tmp_path, cpfs, others, bloom):
+    path = tmp_path / 'cpf.idx'
+    docs = [doc.masked for doc in cpfs[:1000]] + cpfs[1000:] + [cpfs[0].plain]
+    assert CPFIndex.build(path, docs, bloom_false_positive_rate=bloom) == 2000
+
+    with CPFIndex(path) as index:
+        assert len(index) == 2000
+        assert all(doc in index for doc in cpfs)
+        assert cpfs[0].masked in index
+        assert not any(doc in index for doc in others if doc not in set(cpfs))
+        assert 'x' not in index
+        assert 52998224725 not in index
+
+
+def test_contains_many(tmp_path, cpfs, others):
+    path = tmp_path / 'cpf.idx'
+    CPFIndex.build(path, cpfs)
+    expected = [doc in set(cpfs) for doc in others]
+
+    with CPFIndex(path) as index:
+        assert index.contains_many(cpfs) == [True] * len(cpfs)
+        assert index.contains_many(others) == expected
+        assert index.contains_many([cpfs[0].masked, 'invalid', '']) == [True, False, False]
+        assert index.contains_many([]) == []
+
+
+def test_build_without_numpy(tmp_path, monkeypatch, cpfs):
+    import doc_br.index
+
+    with_numpy = tmp_path / 'numpy.idx'
+    without_numpy = tmp_path / 'python.idx'
+    CPFIndex.build(with_numpy, cpfs + ['bad'], skip_invalid=True)
+
+    monkeypatch.setattr(doc_br.index, 'np', None)
+    CPFIndex.build(without_numpy, cpfs + ['bad'], skip_invalid=True)
+    assert with_numpy.read_bytes() == without_numpy.read_bytes()
+
+    with CPFIndex(without_numpy) as index:
+        assert index.contains_many(cpfs[:3] + ['bad']) == [True, True, True, False]
+
+
+def test_build_rejects_invalid_documents(tmp_path):
+    path = tmp_path / 'cpf.idx'
+    with pytest.raises(InvalidDocumentError) as error:
+        CPFIndex.build(path, ['529.982.247-25', '529.982.247-24'])
+    assert error.value.reason is InvalidReason.INVALID_CHECK_DIGITS
+    assert not path.exists()
+
+    with pytest.raises(ValueError):
+        CPFIndex.build(path, [], bloom_false_positive_rate=1.5)
+
+
+def test_failed_build_leaves_no_files(tmp_path, monkeypatch, cpfs):
+    def fail(*args):
+        raise OSError('No space left on device')
+
+    monkeypatch.setattr(CPFIndex, '_bloom_filter', fail)
+    with pytest.raises(OSError):
+        CPFIndex.build(tmp_path / 'cpf.idx', cpfs)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_open_checks_document_type(tmp_path):
+    path = tmp_path / 'cnpj.idx'
+    CNPJIndex.build(path, ['11.222.333/0001-81'])
+
+    with pytest.raises(ValueError):
+        CPFIndex(path)
+
+    with open_index(path) as index:
+        assert isinstance(index, CNPJIndex)
+        assert '11222333000181' in index
+
+    other = tmp_path / 'other.txt'
+    other.write_bytes(b'not an index at all, just some text padding it out....')
+    with pytest.raises(ValueError):
+        open_index(other)
+
+
+def test_empty_index(tmp_path):
+    path = tmp_path / 'empty.idx'
+    assert CPFIndex.build(path, []) == 0
+
+    with CPFIndex(path) as index:
+        assert '529.982.247-25' not in index
+        assert index.contains_many(['529.982.247-25']) == [False]
+
+
+def _lookup(path: str) -> bool:
+    with CPFIndex(path) as index:
+        return CPF('529.982.247-25') in index
+
+
+def test_lookup_from_other_processes(tmp_path):
+    path = tmp_path / 'cpf.idx'
+    CPFIndex.build(path, ['529.982.247-25'])
+
+    with multiprocessing.get_context('spawn').Pool(2) as pool:
+        assert pool.map(_lookup, [str(path)] * 2) == [True, True]
@@ -0,0 +1,113 @@
+import pytest
+
+from doc_br import metrics
+from doc_br.types import CNPJ, CPF, InvalidReason
+
+
+@pytest.fixture
+def registry():
+    registry = metrics.enable(metrics.MetricsRegistry())
+    yield registry
+    metrics.disable()
+
+
+def test_disabled_by_default_and_restores_methods():
+    init, sanitize, try_parse = CPF.__init__, CPF.sanitize, CPF.__dict__['try_parse']
+    mask_valid = CPF._mask_valid
+
+    metrics.enable()
+    assert metrics.is_enabled()
+    assert CPF.sanitize is not sanitize
+
+    metrics.disable()
+    assert not metrics.is_enabled()
+    assert metrics.get_registry() is None
+    assert CPF.__init__ is init
+    assert CPF.sanitize is sanitize
+    assert CPF._mask_valid is mask_valid
+    assert CPF.__dict__['try_parse'] is try_parse
+
+
+def test_counts_constructed_validated_and_rejected(registry):
+    CPF('529.982.247-25')
+    CNPJ('11.222.333/0001-81')
+    with pytest.raises(ValueError):
+        CPF('529.982.247-24')
+    assert not CPF.try_parse('123.456.789/01')
+    assert CPF.try_parse('337231923')
+
+    snapshot = registry.snapshot()
+    assert snapshot.constructed == {'CPF': 1, 'CNPJ': 1}
+    assert snapshot.validated == {'CPF': 2, 'CNPJ': 1}
+    assert snapshot.rejected == {
+        ('CPF', InvalidReason.INVALID_CHECK_DIGITS): 1,
+        ('CPF', InvalidReason.INVALID_CHARACTER): 1,
+    }
+
+
+def test_records_method_timings(registry):
+    cpf = CPF('529.982.247-25')
+    cpf.validate('52998224725')
+    cpf.apply_mask('52998224725')
+
+    timings = registry.snapshot().timings
+    assert timings[('CPF', 'sanitize')].count == 2
+    assert timings[('CPF', 'validate')].count == 1
+    assert timings[('CPF', 'apply_mask')].count == 1
+    assert sum(timings[('CPF', 'sanitize')].counts) == 2
+    assert timings[('CPF', 'sanitize')].sum > 0
+
+
+def test_nested_calls_count_documents_once(registry):
+    cpf = CPF('529.982.247-25')
+    assert cpf.apply_mask('52998224725') == '529.982.247-25'
+    with pytest.raises(ValueError):
+        cpf.apply_mask('52998224724')
+
+    snapshot = registry.snapshot()
+    assert snapshot.validated == {'CPF': 2}
+    assert snapshot.rejected == {('CPF', InvalidReason.INVALID_CHECK_DIGITS): 1}
+    assert snapshot.timings[('CPF', 'sanitize')].count == 3
+    assert snapshot.timings[('CPF', 'apply_mask')].count == 2
+
+
+def test_records_lazy_masking(registry):
+    cpf = CPF('529.982.247-25')
+    assert cpf.masked == '529.982.247-25'
+    assert cpf.masked == '529.982.247-25'
+
+    snapshot = registry.snapshot()
+    assert snapshot.timings[('CPF', 'masked')].count == 1
+    assert snapshot.validated == {'CPF': 1}
+
+
+def test_listeners_receive_values(registry):
+    received = []
+    registry.add_listener(lambda name, labels, value: received.append((name, labels, value)))
+
+    with pytest.raises(ValueError):
+        CNPJ('11111111111111')
+
+    labels = {'type': 'CNPJ', 'reason': 'REPEATED_DIGITS'}
+    assert ('docbr_documents_rejected', labels, 1) in received
+    assert any(name == 'docbr_method_duration_seconds' for name, _, _ in received)
+
+
+def test_reset_keeps_listeners(registry):
+    received = []
+    registry.add_listener(lambda *args: received.append(args))
+    CPF('529.982.247-25')
+    registry.reset()
+    CPF('529.982.247-25')
+
+    assert registry.snapshot().constructed == {'CPF': 1}
+    assert len(received) == 6
+
+
+def test_histogram_buckets():
+    histogram = metrics.Histogram([1e-3, 1e-2])
+    for seconds in (1e-4, 1e-3, 5e-3, 1.0):
+        histogram.observe(seconds)
+
+    assert histogram.snapshot().counts == (2, 1, 1)
+    assert histogram.snapshot().count == 4
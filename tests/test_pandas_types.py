@@ -0,0 +1,138 @@
+import pytest
+
+from doc_br.types import CNPJ, CPF
+
+pd = pytest.importorskip('pandas')
+pa = pytest.importorskip('pyarrow')
+np = pytest.importorskip('numpy')
+pandas_types = pytest.importorskip('doc_br.pandas_types')
+
+
+def test_dtype_construction_and_scalars():
+    series = pd.Series(['529.982.247-25', '337231923', None, CPF('52998224725')], dtype='cpf')
+
+    assert isinstance(series.dtype, pandas_types.CPFDtype)
+    assert series.array.nbytes == 32
+    assert series[0] == CPF('52998224725')
+    assert series[2] is pd.NA
+    assert series.isna().tolist() == [False, False, True, False]
+    assert series.nunique() == 2
+
+
+def test_dtype_rejects_invalid_documents():
+    with pytest.raises(ValueError):
+        pd.Series(['529.982.247-24'], dtype='cpf')
+
+    with pytest.raises(ValueError):
+        pd.Series([11111111111111], dtype='cnpj')
+
+    with pytest.raises(TypeError):
+        pd.Series([CNPJ('11222333000181')], dtype='cpf')
+
+
+def test_dtype_from_integers():
+    series = pd.Series(np.array([52998224725, 337231923]), dtype='cpf')
+    assert series.astype(str).tolist() == ['52998224725', '00337231923']
+
+
+def test_setitem_validates():
+    series = pd.Series(['529.982.247-25', None], dtype='cpf')
+    series[1] = '337231923'
+    assert series[1] == CPF('337231923')
+
+    with pytest.raises(ValueError):
+        series[0] = '123.456.789-00'
+
+
+def test_accessor_on_document_dtype():
+    series = pd.Series(['11.222.333/0001-81', None], dtype='cnpj', index=['a', 'b'])
+
+    assert series.docbr.plain().tolist() == ['11222333000181', pd.NA]
+    assert series.docbr.masked().tolist() == ['11.222.333/0001-81', pd.NA]
+    assert series.docbr.is_valid().tolist() == [True, False]
+    assert series.docbr.is_valid('cpf').tolist() == [False, False]
+    assert series.docbr.kind().tolist() == ['cnpj', pd.NA]
+    assert series.docbr.plain().index.tolist() == ['a', 'b']
+
+
+def test_accessor_on_strings():
+    series = pd.Series(
+        ['529.982.247-25', '11.222.333/0001-81', '123', None, 'abc', '337231923', 52998224725]
+    )
+
+    assert series.docbr.kind().tolist() == ['cpf', 'cnpj', pd.NA, pd.NA, pd.NA, 'cpf', pd.NA]
+    assert series.docbr.is_valid().tolist() == [True, True, False, False, False, True, False]
+    assert series.docbr.is_valid('cnpj').tolist() == [
+        False, True, False, False, False, True, False
+    ]
+    assert series.docbr.plain('cpf').tolist() == [
+        '52998224725', pd.NA, pd.NA, pd.NA, pd.NA, '00337231923', pd.NA
+    ]
+    assert series.docbr.masked().tolist() == [
+        '529.982.247-25', '11.222.333/0001-81', pd.NA, pd.NA, pd.NA, '003.372.319-23', pd.NA
+    ]
+
+    with pytest.raises(ValueError):
+        series.docbr.plain('rg')
+
+
+def test_arrow_round_trip():
+    series = pd.Series(['529.982.247-25', None, '337231923'], dtype='cpf')
+
+    array = pa.array(series)
+    assert array.type == pa.uint64()
+    assert array.null_count == 1
+
+    table = pa.Table.from_pandas(pd.DataFrame({'cpf': series}))
+    assert table.to_pandas()['cpf'].equals(series)
+
+
+def test_arrow_conversion_without_copy():
+    values = np.array([52998224725, 337231923], dtype=np.uint64)
+    array = pa.array(values)
+
+    documents = pandas_types.CPFDtype().__from_arrow__(array)
+    assert np.shares_memory(documents._data, values)
+    assert np.shares_memory(pa.array(documents).to_numpy(), values)
+
+
+def test_arrow_strings_are_validated():
+    documents = pandas_types.CNPJDtype().__from_arrow__(pa.array(['11.222.333/0001-81', None]))
+    assert list(documents) == [CNPJ('11222333000181'), pd.NA]
+
+    with pytest.raises(ValueError):
+        pandas_types.CNPJDtype().__from_arrow__(pa.chunked_array([['11.222.333/0001-82']]))
+
+
+def test_kind_matches_document_detection():
+    from doc_br.types import try_parse_document
+
+    # Valid as a zero-filled CNPJ but not as a CPF, which its digit count makes it.
+    docs = ['24427250908', '00024427250908', '529.982.247-25', '11.222.333/0001-81', None]
+    expected = [
+        {CPF: 'cpf', CNPJ: 'cnpj'}[type(parsed)] if parsed else pd.NA
+        for parsed in map(try_parse_document, docs)
+    ]
+
+    assert pd.Series(docs).docbr.kind().tolist() == expected == [
+        pd.NA, 'cnpj', 'cpf', 'cnpj', pd.NA
+    ]
+    assert pd.Series(docs).docbr.is_valid('cnpj').tolist() == [True, True, False, True, False]
+
+
+def test_arrow_int64_conversion_without_copy():
+    values = np.array([52998224725, 337231923], dtype=np.int64)
+
+    documents = pandas_types.CPFDtype().__from_arrow__(pa.array(values))
+    assert np.shares_memory(documents._data, values)
+
+    with pytest.raises(ValueError):
+        pandas_types.CPFDtype().__from_arrow__(pa.array([-52998224725]))
+
+
+def test_integer_input_is_not_shared():
+    values = np.array([52998224725, 337231923], dtype=np.uint64)
+    series = pd.Series(values, dtype='cpf')
+
+    values[0] = 1
+    assert series[0] == CPF('52998224725')
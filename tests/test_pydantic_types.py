@@ -0,0 +1,64 @@
+from typing import Annotated, List, Optional
+
+import pytest
+
+from doc_br.types import CNPJ, CPF
+
+pydantic = pytest.importorskip('pydantic')
+pydantic_types = pytest.importorskip('doc_br.pydantic_types')
+
+
+class Customer(pydantic.BaseModel):
+    cpf: CPF
+    cnpj: Optional[Annotated[CNPJ, pydantic_types.SerializeAs('masked')]] = None
+
+
+def test_validation_and_serialization():
+    customer = Customer(cpf='529.982.247-25', cnpj='11222333000181')
+
+    assert type(customer.cpf) is CPF and customer.cpf == CPF('52998224725')
+    assert customer.model_dump() == {'cpf': customer.cpf, 'cnpj': customer.cnpj}
+    assert customer.model_dump_json() == '{"cpf":"52998224725","cnpj":"11.222.333/0001-81"}'
+    assert Customer.model_validate_json(customer.model_dump_json()) == customer
+
+
+def test_document_objects_are_accepted_as_they_are():
+    cpf = CPF('337231923')
+    assert Customer(cpf=cpf).cpf is cpf
+
+    with pytest.raises(pydantic.ValidationError):
+        Customer(cpf=CNPJ('191'))
+
+
+@pytest.mark.parametrize("value, error_type", [
+    ('529.982.247-24', 'value_error'),
+    ('111.111.111-11', 'value_error'),
+    ('529 982 247 25', 'string_pattern_mismatch'),
+    ('529.982.247/25', 'string_pattern_mismatch'),
+    ('5' * 15, 'string_too_long'),
+    (52998224725, 'string_type'),
+])
+def test_invalid_documents(value, error_type):
+    with pytest.raises(pydantic.ValidationError) as error:
+        Customer.model_validate_json(f'{{"cpf": {value!r}}}'.replace("'", '"'))
+
+    assert [e['type'] for e in error.value.errors()] == [error_type]
+
+
+def test_json_schema_and_containers():
+    schema = Customer.model_json_schema()['properties']['cpf']
+    assert schema['type'] == 'string' and schema['maxLength'] == 14
+
+    adapter = pydantic.TypeAdapter(List[CNPJ])
+    assert adapter.validate_python(['191', CNPJ('11222333000181')]) == [
+        CNPJ('191'), CNPJ('11222333000181')
+    ]
+    assert adapter.dump_json([CNPJ('191')]) == b'["00000000000191"]'
+
+
+def test_unsupported_types_and_formats():
+    with pytest.raises(ValueError):
+        pydantic_types.SerializeAs('upper')
+
+    with pytest.raises(TypeError):
+        pydantic_types.document_core_schema(str)
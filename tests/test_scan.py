@@ -0,0 +1,84 @@
+import io
+import random
+
+import pytest
+
+from doc_br.scan import find_documents
+from doc_br.types import CNPJ, CPF
+from doc_br.utils import CNPJDocumentUtils, CPFDocumentUtils
+
+
+def _text() -> str:
+    rng = random.Random(0)
+    docs = [d.masked for d in CPFDocumentUtils().iter_documents(50, seed=1)]
+    docs += [d.plain for d in CPFDocumentUtils().iter_documents(50, seed=2)]
+    docs += [d.masked for d in CNPJDocumentUtils().iter_documents(50, seed=3)]
+    docs += [d.plain for d in CNPJDocumentUtils().iter_documents(50, seed=4)]
+    docs += ['529.982.247-24', '11111111111', '123456789012']
+    rng.shuffle(docs)
+    return ''.join(doc + rng.choice([' ', 'x', '\n', ', ', '-', 'ção ']) for doc in docs)
+
+
+def test_find_documents_in_text():
+    text = 'CPF 529.982.247-25, CNPJ 11222333000181; 52998224724 0052998224725 1234'
+    matches = list(find_documents(text))
+
+    assert [(m.kind, m.start, m.end, m.text, m.plain) for m in matches] == [
+        ('cpf', 4, 18, '529.982.247-25', '52998224725'),
+        ('cnpj', 25, 39, '11222333000181', '11222333000181'),
+    ]
+    assert matches[0].masked and not matches[1].masked
+    assert matches[0].document == CPF('52998224725')
+    assert matches[1].document == CNPJ('11222333000181')
+
+
+def test_find_documents_filters_kinds():
+    text = '529.982.247-25 11.222.333/0001-81'
+    assert [m.kind for m in find_documents(text, kinds=['CNPJ'])] == ['cnpj']
+
+    with pytest.raises(ValueError):
+        list(find_documents(text, kinds=['rg']))
+
+
+def test_find_documents_rejects_digits_around_masked_documents():
+    assert not list(find_documents('1529.982.247-25 529.982.247-251'))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 17, 18, 19, 64, 4096])
+def test_find_documents_across_chunks(chunk_size):
+    text = _text()
+    expected = list(find_documents(text))
+    assert len(expected) == 200
+
+    assert list(find_documents(io.StringIO(text), chunk_size=chunk_size)) == expected
+
+    data = text.encode()
+    offsets = [(m.plain, m.start, m.end) for m in find_documents(data)]
+    binary = find_documents(io.BytesIO(data), chunk_size=chunk_size)
+    assert [(m.plain, m.start, m.end) for m in binary] == offsets
+    assert all(data[start:end].decode() == m.text for m, (_, start, end) in zip(expected, offsets))
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_find_documents_in_file(tmp_path, use_mmap):
+    text = _text()
+    path = tmp_path / 'log.txt'
+    path.write_text(text, encoding='utf-8')
+
+    matches = list(find_documents(path, use_mmap=use_mmap, chunk_size=100))
+    assert [m.plain for m in matches] == [m.plain for m in find_documents(text)]
+
+
+def test_find_documents_in_empty_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.touch()
+    assert not list(find_documents(path))
+
+
+def test_find_documents_without_numpy(monkeypatch):
+    import doc_br.scan
+
+    text = _text()
+    expected = list(find_documents(text))
+    monkeypatch.setattr(doc_br.scan, 'np', None)
+    assert list(find_documents(text)) == expected
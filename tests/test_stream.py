@@ -0,0 +1,52 @@
+import pytest
+
+from doc_br.stream import validate_file
+from doc_br.types import CPF
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / 'docs.csv'
+    path.write_text('id;cpf\n1;529.982.247-25\n2;11111111111\n3;337231923\n')
+    return path
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_validate_file_by_column_name(csv_file, use_mmap):
+    records = list(validate_file(csv_file, column='cpf', delimiter=';', use_mmap=use_mmap))
+
+    assert [r.line_number for r in records] == [2, 3, 4]
+    assert [r.valid for r in records] == [True, False, True]
+    assert records[0].plain == '52998224725'
+    assert records[0].masked == '529.982.247-25'
+    assert records[1].plain == '11111111111'
+    assert records[1].masked is None
+    assert records[0].document is None
+
+
+def test_validate_file_lines(tmp_path):
+    path = tmp_path / 'docs.txt'
+    path.write_text('11.222.333/0001-81\r\n12.345.678/9012-34\n')
+
+    records = list(validate_file(path, kind='cnpj', documents=True))
+
+    assert [r.valid for r in records] == [True, False]
+    assert records[0].document.plain == '11222333000181'
+    assert records[1].document is None
+
+
+def test_validate_file_builds_documents(csv_file):
+    records = validate_file(csv_file, column=1, delimiter=';', skip_header=True, documents=True)
+    assert next(records).document == CPF('529.982.247-25')
+
+
+def test_validate_file_errors(csv_file, tmp_path):
+    with pytest.raises(ValueError):
+        next(validate_file(csv_file, kind='rg'))
+
+    with pytest.raises(ValueError):
+        next(validate_file(csv_file, column='cnpj', delimiter=';'))
+
+    empty = tmp_path / 'empty.txt'
+    empty.write_text('')
+    assert list(validate_file(empty, use_mmap=True)) == []
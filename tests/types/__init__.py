@@ -1,2 +1,6 @@
+from .test_check_digit import *  # noqa: F401
+from .test_cache import *  # noqa: F401
 from .test_cpf import *  # noqa: F401
 from .test_cnpj import *  # noqa: F401
+from .test_detect import *  # noqa: F401
+from .test_binary import *  # noqa: F401
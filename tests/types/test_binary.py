@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from doc_br.types import CNPJ, CPF, Document
+
+
+def test_pickle_skips_validation(monkeypatch):
+    docs = [CPF('529.982.247-25'), CNPJ('191')]
+    docs[0].masked
+    data = pickle.dumps(docs)
+
+    def fail(self, doc):
+        raise AssertionError('document validated again')
+
+    monkeypatch.setattr(CPF, 'sanitize', fail)
+    monkeypatch.setattr(CNPJ, 'sanitize', fail)
+    restored = pickle.loads(data)
+
+    assert restored == docs
+    assert [type(doc) for doc in restored] == [CPF, CNPJ]
+    assert restored[0].masked == '529.982.247-25'
+
+
+def test_to_bytes_round_trip():
+    cpf = CPF('529.982.247-25')
+    cnpj = CNPJ('11.222.333/0001-81')
+
+    assert len(cpf.to_bytes()) == 8
+    assert cpf.to_bytes() != CNPJ.from_trusted(cpf.plain).to_bytes()
+    assert CPF.from_bytes(cpf.to_bytes()) == cpf
+    assert type(Document.from_bytes(cnpj.to_bytes())) is CNPJ
+    assert Document.from_bytes(cnpj.to_bytes()) == cnpj
+
+
+@pytest.mark.parametrize("data", [
+    b'', b'\x00' * 9, bytes(8), CNPJ('191').to_bytes(),
+    (10**11).to_bytes(7, 'little') + b'\x01',
+])
+def test_from_bytes_rejects_invalid(data):
+    with pytest.raises(ValueError):
+        CPF.from_bytes(data)
+
+
+def test_pack_many_round_trip():
+    docs = [CPF('337231923'), CNPJ('191'), CPF('529.982.247-25')]
+    data = Document.pack_many(docs)
+
+    assert len(data) == 8 * len(docs)
+    assert data[8:16] == docs[1].to_bytes()
+    assert Document.unpack_many(data) == docs
+    assert [type(doc) for doc in Document.unpack_many(data)] == [CPF, CNPJ, CPF]
+    assert Document.pack_many([]) == b'' and Document.unpack_many(b'') == []
+
+    with pytest.raises(ValueError):
+        CPF.unpack_many(data)
+    with pytest.raises(ValueError):
+        Document.unpack_many(data[:-1])
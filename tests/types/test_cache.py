@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+
+from doc_br.types import CNPJ, CPF, CacheInfo, DocumentCache
+
+
+def test_cache_returns_same_instance():
+    cache = DocumentCache(CPF, maxsize=10)
+    first = cache.get('529.982.247-25')
+
+    assert cache.get('529.982.247-25') is first
+    assert cache.get('52998224725') == first
+    assert cache.info() == CacheInfo(hits=1, misses=2, maxsize=10, currsize=2)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = DocumentCache(CNPJ, maxsize=2)
+    first = cache.get('11.222.333/0001-81')
+    cache.get('11222333000181')
+    cache.get('11.222.333/0001-81')
+    cache.get('00.000.000/0001-91')
+
+    assert len(cache) == 2
+    assert cache.get('11.222.333/0001-81') is first
+    assert cache.info().misses == 3
+
+    cache.resize(1)
+    assert len(cache) == 1
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=1, currsize=0)
+
+
+def test_cache_does_not_store_invalid_documents():
+    cache = DocumentCache(CPF)
+    with pytest.raises(ValueError):
+        cache.get('111.111.111-11')
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        DocumentCache(CPF, maxsize=0)
+
+
+def test_intern():
+    assert CPF.intern('529.982.247-25') is CPF.intern('529.982.247-25')
+    assert CPF.intern_cache() is CPF.intern_cache()
+    assert CPF.intern_cache() is not CNPJ.intern_cache()
+
+
+def test_cache_concurrent_misses_return_same_instance():
+    barrier = Barrier(2, timeout=5)
+
+    class SlowCPF(CPF):
+        __slots__ = ()
+
+        def sanitize(self, doc):
+            barrier.wait()
+            return super().sanitize(doc)
+
+    cache = DocumentCache(SlowCPF)
+    with ThreadPoolExecutor(2) as executor:
+        first, second = executor.map(cache.get, ['529.982.247-25'] * 2)
+
+    assert first is second
+    assert cache.info() == CacheInfo(hits=0, misses=2, maxsize=65536, currsize=1)
+
+
+def test_intern_cache_created_once_across_threads():
+    class InternedCPF(CPF):
+        __slots__ = ()
+
+    with ThreadPoolExecutor(8) as executor:
+        caches = list(executor.map(lambda _: InternedCPF.intern_cache(), range(64)))
+
+    assert all(cache is caches[0] for cache in caches)
@@ -0,0 +1,54 @@
+import random
+from operator import mul
+
+import pytest
+import validate_docbr
+
+from doc_br.types.check_digit import CNPJ_ENGINE, CPF_ENGINE
+
+
+@pytest.mark.parametrize("engine, reference", [
+    (CPF_ENGINE, validate_docbr.CPF()),
+    (CNPJ_ENGINE, validate_docbr.CNPJ()),
+])
+def test_matches_reference_implementation(engine, reference):
+    for _ in range(200):
+        plain = reference.generate()
+        assert engine.is_valid(plain)
+        assert engine.sanitize(reference.mask(plain)) == plain
+        assert engine.mask(plain) == reference.mask(plain)
+        assert engine.compute_check_digits(plain[:-2]) == plain[-2:]
+
+
+def _weighted_check_digits(base, weights):
+    digits = [int(digit) for digit in base]
+    for digit_weights in (weights[1:], weights):
+        remainder = sum(map(mul, digits, digit_weights)) % 11
+        digits.append(0 if remainder < 2 else 11 - remainder)
+    return f'{digits[-2]}{digits[-1]}'
+
+
+@pytest.mark.parametrize("engine", [CPF_ENGINE, CNPJ_ENGINE])
+def test_compute_check_digits_matches_weighted_sum(engine):
+    rng = random.Random(0)
+    size = engine.size - 2
+    bases = [digit * size for digit in '0123456789']
+    bases += [''.join(rng.choices('0123456789', k=size)) for _ in range(2000)]
+
+    for base in bases:
+        assert engine.compute_check_digits(base) == _weighted_check_digits(base, engine.weights)
+
+
+@pytest.mark.parametrize("plain", ['52998224724', '11111111111', '5299822472', '5299822472a'])
+def test_is_valid_rejects_invalid(plain):
+    assert not CPF_ENGINE.is_valid(plain)
+
+
+def test_sanitize_fills_with_zeros():
+    assert CPF_ENGINE.sanitize('337231923') == '00337231923'
+
+
+@pytest.mark.parametrize("doc", [None, '', '529 982 247-25', '529.982.247/25', '５２９.982.247-25'])
+def test_sanitize_rejects_invalid(doc):
+    with pytest.raises(ValueError):
+        CPF_ENGINE.sanitize(doc)
@@ -1,7 +1,7 @@
 import pytest
 import validate_docbr
 
-from doc_br.types import CNPJ
+from doc_br.types import CNPJ, InvalidReason
 
 
 @pytest.fixture
@@ -42,6 +42,13 @@ def test_validate(invalid_cnpj, valid_cnpj):
     assert valid_cnpj.validate(valid_cnpj.plain) is None
 
 
+def test_validate_does_not_fill_with_zeros(valid_cnpj):
+    assert valid_cnpj.validate('00.000.000/0001-91') is None
+
+    with pytest.raises(ValueError):
+        valid_cnpj.validate('191')
+
+
 def test_mask(valid_cnpj, valid_cnpj_str):
     plain = ''.join([c for c in valid_cnpj_str if c.isdigit()])
 
@@ -75,7 +82,7 @@ def test_init(invalid_cnpj):
 
 
 def test_hash(valid_cnpj):
-    assert hash(valid_cnpj) == hash(valid_cnpj.plain)
+    assert hash(valid_cnpj) == hash(int(valid_cnpj.plain))
 
 
 def test_eq():
@@ -88,3 +95,13 @@ def test_eq():
 
 def test_repr(valid_cnpj):
     assert repr(valid_cnpj) == valid_cnpj.plain
+
+
+def test_try_parse(valid_cnpj):
+    result = CNPJ.try_parse(valid_cnpj.masked)
+    assert isinstance(result, CNPJ)
+    assert result.masked == valid_cnpj.masked
+
+    result = CNPJ.try_parse('11.111.111/1111-11')
+    assert not result
+    assert result.reason is InvalidReason.REPEATED_DIGITS
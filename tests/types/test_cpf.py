@@ -1,7 +1,7 @@
 import pytest
 import validate_docbr
 
-from doc_br.types import CPF
+from doc_br.types import CNPJ, CPF, InvalidDocumentError, InvalidReason, ParseFailure
 
 
 @pytest.fixture
@@ -76,3 +76,57 @@ def test_sanitize(valid_cpf, valid_cpf_str):
 
     with pytest.raises(ValueError):
         valid_cpf.sanitize("11111111111")
+
+
+def test_validate_does_not_fill_with_zeros(valid_cpf):
+    assert valid_cpf.validate("529.982.247-25") is None
+    assert valid_cpf.validate("00337231923") is None
+
+    with pytest.raises(InvalidDocumentError) as error:
+        valid_cpf.validate("337231923")
+    assert error.value.reason is InvalidReason.INVALID_LENGTH
+
+
+@pytest.mark.parametrize("doc, reason", [
+    ('529.982.247-2a', InvalidReason.INVALID_CHARACTER),
+    ('529 982 247 25', InvalidReason.INVALID_CHARACTER),
+    ('', InvalidReason.INVALID_LENGTH),
+    (None, InvalidReason.INVALID_LENGTH),
+    ('529.982.247-250', InvalidReason.INVALID_LENGTH),
+    ('111.111.111-11', InvalidReason.REPEATED_DIGITS),
+    ('529.982.247-24', InvalidReason.INVALID_CHECK_DIGITS),
+])
+def test_try_parse_invalid(doc, reason):
+    result = CPF.try_parse(doc)
+    assert not result
+    assert result == ParseFailure(doc, reason)
+
+    with pytest.raises(InvalidDocumentError) as error:
+        CPF(doc)
+    assert error.value.reason is reason
+
+
+def test_try_parse_valid(valid_cpf):
+    result = CPF.try_parse(valid_cpf.masked)
+    assert isinstance(result, CPF)
+    assert result == valid_cpf
+    assert result.masked == valid_cpf.masked
+
+
+def test_cpf_compact_representation():
+    cpf = CPF('003.372.319-23')
+    assert not hasattr(cpf, '__dict__')
+    assert int(cpf) == 337231923
+    assert cpf.plain == '00337231923'
+    assert cpf.masked == '003.372.319-23'
+    assert hash(cpf) == hash(337231923)
+    assert cpf != CNPJ('00.000.000/0001-91')
+    assert cpf != '00337231923'
+
+
+def test_cpf_masked_is_lazy_and_cached():
+    cpf = CPF.from_trusted('52998224725')
+    masked = cpf.masked
+
+    assert masked == '529.982.247-25'
+    assert cpf.masked is masked
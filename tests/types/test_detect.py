@@ -0,0 +1,90 @@
+from abc import ABC
+
+import pytest
+
+from doc_br.types import (
+    CNPJ,
+    CPF,
+    InvalidReason,
+    detect_document_class,
+    parse_document,
+    parse_documents,
+    try_parse_document,
+)
+from doc_br.utils import CNPJDocumentUtils, CPFDocumentUtils, DocumentUtils
+
+
+@pytest.mark.parametrize("doc, expected", [
+    ('529.982.247-25', CPF),
+    ('52998224725', CPF),
+    ('337231923', CPF),
+    ('11.222.333/0001-81', CNPJ),
+    ('11222333000181', CNPJ),
+    ('000191', CPF),
+    ('0001/91', CNPJ),
+    ('', CPF),
+])
+def test_detect_document_class(doc, expected):
+    assert detect_document_class(doc) is expected
+
+
+def test_parse_document():
+    cpf = parse_document('529.982.247-25')
+    cnpj = parse_document('11222333000181')
+
+    assert type(cpf) is CPF and cpf == CPF('52998224725')
+    assert type(cnpj) is CNPJ and cnpj.masked == '11.222.333/0001-81'
+    assert parse_document('337231923').plain == '00337231923'
+
+
+@pytest.mark.parametrize("doc, reason, name", [
+    (None, InvalidReason.INVALID_LENGTH, 'CPF'),
+    ('529.982.247-24', InvalidReason.INVALID_CHECK_DIGITS, 'CPF'),
+    ('11.222.333/0001-80', InvalidReason.INVALID_CHECK_DIGITS, 'CNPJ'),
+    ('111.111.111-11', InvalidReason.REPEATED_DIGITS, 'CPF'),
+    ('529 982 247 25', InvalidReason.INVALID_CHARACTER, 'CPF'),
+    ('112223330001812', InvalidReason.INVALID_LENGTH, 'CNPJ'),
+    (52998224725, InvalidReason.INVALID_CHARACTER, 'CPF'),
+    (b'52998224725', InvalidReason.INVALID_CHARACTER, 'CPF'),
+    (['x'], InvalidReason.INVALID_CHARACTER, 'CPF'),
+])
+def test_parse_document_rejects_invalid(doc, reason, name):
+    result = try_parse_document(doc)
+    assert not result and result.reason is reason
+
+    with pytest.raises(ValueError, match=name) as error:
+        parse_document(doc)
+    assert error.value.reason is reason
+
+
+def test_parse_documents_matches_single_parsing():
+    docs = [
+        '529.982.247-25', '11.222.333/0001-81', '337231923', '11222333000180',
+        'abc', None, '', '0001/91', '529.982.247/25', '1122233300018100',
+        52998224725, b'11222333000181',
+    ]
+
+    assert parse_documents(docs) == [try_parse_document(doc) for doc in docs]
+    assert parse_documents(iter([])) == []
+    assert [type(d) for d in parse_documents(docs[:3])] == [CPF, CNPJ, CPF]
+
+
+def test_document_utils_for_document():
+    assert isinstance(DocumentUtils.for_document('529.982.247-25'), CPFDocumentUtils)
+    assert isinstance(DocumentUtils.for_document('11.222.333/0001-81'), CNPJDocumentUtils)
+    assert isinstance(DocumentUtils.for_document(11222333000181), CPFDocumentUtils)
+
+
+def test_document_utils_for_document_walks_subclasses():
+    from doc_br.utils.document_utils import _subclasses
+
+    class BaseUtils(DocumentUtils, ABC):
+        pass
+
+    class CustomCPFUtils(BaseUtils, CPFDocumentUtils):
+        pass
+
+    subclasses = list(_subclasses(DocumentUtils))
+    assert BaseUtils in subclasses
+    assert subclasses.index(CPFDocumentUtils) < subclasses.index(CustomCPFUtils)
+    assert type(DocumentUtils.for_document('529.982.247-25')) is CPFDocumentUtils
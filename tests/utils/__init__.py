@@ -0,0 +1,2 @@
+from .test_document_utils import *  # noqa: F401
+from .test_generator import *  # noqa: F401
@@ -0,0 +1,49 @@
+import pytest
+
+from doc_br.types import CNPJ, InvalidReason, ParseFailure
+from doc_br.utils import CNPJDocumentUtils, CPFDocumentUtils, ValidationResult
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_validate_bulk_keeps_input_order(workers):
+    docs = ['529.982.247-25', '11111111111', None, '337231923', 'abc'] * 3
+
+    results = CPFDocumentUtils().validate_bulk(docs, workers=workers, chunk_size=2)
+
+    assert len(results) == len(docs)
+    assert [r.valid for r in results] == [True, False, False, True, False] * 3
+    assert results[0] == ValidationResult(True, '52998224725', None)
+    assert results[3].plain == '00337231923'
+    assert results[1].plain is None
+    assert results[1].reason is InvalidReason.REPEATED_DIGITS
+
+
+def test_validate_bulk_cnpj():
+    results = CNPJDocumentUtils().validate_bulk(iter(['11.222.333/0001-81']), workers=1)
+    assert results == [ValidationResult(True, '11222333000181', None)]
+
+
+@pytest.mark.parametrize('workers, chunk_size', [(0, 10), (1, 0)])
+def test_validate_bulk_invalid_arguments(workers, chunk_size):
+    with pytest.raises(ValueError):
+        CPFDocumentUtils().validate_bulk([], workers=workers, chunk_size=chunk_size)
+
+
+def test_iter_validate_bulk_is_lazy():
+    docs = (doc for doc in ['529.982.247-25', 'x'] * 5)
+    results = CPFDocumentUtils().iter_validate_bulk(docs, workers=1, chunk_size=3)
+
+    assert next(results).plain == '52998224725'
+    assert not next(results).valid
+    assert len(list(results)) == 8
+
+
+@pytest.mark.parametrize('doc', [123, 52998224725, b'52998224725'])
+def test_try_parse_non_string(doc):
+    result = CPFDocumentUtils().try_parse(doc)
+    assert result == ParseFailure(doc, InvalidReason.INVALID_CHARACTER)
+
+
+def test_try_parse_uses_document_class():
+    assert CNPJDocumentUtils().try_parse('11.222.333/0001-81') == CNPJ('11222333000181')
+    assert not CNPJDocumentUtils().try_parse('11.222.333/0001-80')
@@ -0,0 +1,44 @@
+import sys
+
+import pytest
+
+from doc_br.types import CNPJ, CPF
+from doc_br.types.check_digit import CPF_ENGINE
+from doc_br.utils import CNPJDocumentUtils, CPFDocumentUtils
+from doc_br.utils.generator import generate_values
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'pure-python'])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        # A None entry makes the lazy import of NumPy fail as if it was not installed.
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+    else:
+        pytest.importorskip('numpy')
+
+
+def test_generate_documents_are_unique_and_valid(use_numpy):
+    docs = CPFDocumentUtils().generate_documents(n=5000)
+
+    assert len(docs) == 5000
+    assert all(CPF(doc.plain) == doc for doc in docs)
+
+
+def test_iter_documents_is_reproducible(use_numpy):
+    utils = CNPJDocumentUtils()
+    docs = list(utils.iter_documents(100, seed=42))
+
+    assert docs == list(utils.iter_documents(100, seed=42))
+    assert docs != list(utils.iter_documents(100, seed=43))
+    assert all(isinstance(doc, CNPJ) and CNPJ(doc.masked) == doc for doc in docs)
+
+
+def test_generate_values_spans_chunks(use_numpy):
+    values = list(generate_values(CPF_ENGINE, 250, seed=1, chunk_size=64))
+    assert len(set(values)) == 250
+
+
+@pytest.mark.parametrize('n', [-1, 10**9])
+def test_generate_values_invalid_n(n):
+    with pytest.raises(ValueError):
+        generate_values(CPF_ENGINE, n)